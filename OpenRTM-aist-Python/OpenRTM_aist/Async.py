@@ -18,10 +18,77 @@
 #
 #
 
+import sys
 import threading
 import OpenRTM_aist
 
 
+##
+# @if jp
+# @brief ƱƤӽФѤΥåɥס
+#
+# ƱƤӽФϥץǶͭ PeriodicTaskPool Υå
+# Ǽ¹Ԥ롣publisher ѤΥסȤ̤ΥסǡǽθƤӽФ
+# 롣 rtc.conf  async.pool.size ǻꤹ롣
+#
+# @return PeriodicTaskPool Υ󥹥
+#
+# @else
+# @brief Get the thread pool for asynchronous invocations
+#
+# Asynchronous invocations are executed by the worker threads of a
+# PeriodicTaskPool shared in the process.  It is separate from the pool
+# for publishers and is created by the first call.  The number of
+# workers is given by async.pool.size in rtc.conf.
+#
+# @return Instance of PeriodicTaskPool
+#
+# @endif
+#
+def asyncInvokerPool():
+  global asyncinvokerpool
+
+  if asyncinvokerpool is None:
+    guard = OpenRTM_aist.ScopedLock(asyncinvokerpool_mutex)
+    if asyncinvokerpool is None:
+      size = [8]
+      conf = OpenRTM_aist.Manager.instance().getConfig()
+      OpenRTM_aist.stringTo(size, conf.getProperty("async.pool.size"))
+      asyncinvokerpool = OpenRTM_aist.PeriodicTaskPool(size[0])
+
+  return asyncinvokerpool
+
+
+asyncinvokerpool = None
+asyncinvokerpool_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @class Async_t
+# @brief ƱСؿƤӽФ饹
+#
+# invoke() ǴؿθƤӽФ򥹥åɥס롣ƤӽФȤ
+# åɤʤᡢۤƤӽФϥ塼
+# Ԥ롣ƤӽФδλ finished()  wait() ǡͤ㳰
+# result()  exception() ǼǤ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class Async_t
+# @brief Asynchronous member function invocation class
+#
+# invoke() puts the invocation into the thread pool.  No thread is
+# created per invocation, so invocations beyond the number of workers
+# wait in the queue.  Completion is checked by finished() and wait(),
+# and the return value and the exception are obtained by result() and
+# exception().
+#
+# @since 1.0.0
+#
+# @endif
+#
 class Async_t(OpenRTM_aist.Task):
 
   def __init__(self, obj, func, *args):
@@ -31,9 +98,42 @@ class Async_t(OpenRTM_aist.Task):
     self._finished   = False
     self._args       = args
     self._mutex      = threading.RLock()
+    self._cond       = threading.Condition(self._mutex)
+    self._invoked    = False
+    self._result     = None
+    self._exc_info   = None
 
-  def invoke(self):
-    self.activate()
+
+  ##
+  # @if jp
+  # @brief ؿ򥹥åɥסǸƤӽФ
+  #
+  # 2ܰʹߤθƤӽФ̵뤵롣
+  #
+  # @param self
+  # @param pool Ѥ PeriodicTaskPoolNone ξ
+  #             asyncInvokerPool() Ȥ
+  #
+  # @else
+  # @brief Invoke the function in the thread pool
+  #
+  # The second and later calls are ignored.
+  #
+  # @param self
+  # @param pool PeriodicTaskPool to be used.  asyncInvokerPool() is
+  #             used if None.
+  #
+  # @endif
+  #
+  def invoke(self, pool=None):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if self._invoked:
+      return
+    self._invoked = True
+    del guard
+    if pool is None:
+      pool = asyncInvokerPool()
+    pool.schedule(self)
 
 
   def finished(self):
@@ -41,43 +141,150 @@ class Async_t(OpenRTM_aist.Task):
     return self._finished
 
 
-  def svc(self):
-    if len(self._args) > 0:
-      self._func(self._obj, self._args)
-    else:
-      self._func(self._obj)
+  ##
+  # @if jp
+  # @brief ƤӽФδλԤ
+  #
+  # @param self
+  # @param timeout ॢ [sec]None ξϴλޤԤġ
+  #
+  # @return λƤ True
+  #
+  # @else
+  # @brief Wait for the invocation to finish
+  #
+  # @param self
+  # @param timeout Timeout [sec].  Waits until finished if None.
+  #
+  # @return True if finished
+  #
+  # @endif
+  #
+  def wait(self, timeout=None):
+    self._cond.acquire()
+    try:
+      if timeout is None:
+        while not self._finished:
+          self._cond.wait()
+      elif not self._finished:
+        self._cond.wait(timeout)
+      return self._finished
+    finally:
+      self._cond.release()
 
-    guard = OpenRTM_aist.ScopedLock(self._mutex)
-    self._finished = True
-    return 0
 
+  ##
+  # @if jp
+  # @brief ƤӽФͤ
+  #
+  # λޤԤؿ㳰ФϤ㳰Ф롣
+  #
+  # @param self
+  # @param timeout ॢ [sec]None ξϴλޤԤġ
+  #
+  # @return ؿ
+  #
+  # @exception RuntimeError ॢȤ
+  #
+  # @else
+  # @brief Get the return value of the invocation
+  #
+  # Waits until finished, and re-raises the exception if the function
+  # raised one.
+  #
+  # @param self
+  # @param timeout Timeout [sec].  Waits until finished if None.
+  #
+  # @return Return value of the function
+  #
+  # @exception RuntimeError Timed out
+  #
+  # @endif
+  #
+  def result(self, timeout=None):
+    if not self.wait(timeout):
+      raise RuntimeError("asynchronous invocation timed out")
+    if self._exc_info is not None:
+      raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+    return self._result
 
-class Async_ref_t(OpenRTM_aist.Task):
 
-  def __init__(self, obj, func, *args):
-    OpenRTM_aist.Task.__init__(self)
-    self._obj        = obj
-    self._func       = func
-    self._args       = args
-    self._finished   = False
-    
+  ##
+  # @if jp
+  # @brief ƤӽФФ줿㳰
+  #
+  # λޤԤġ㳰Фʤä None ֤
+  #
+  # @else
+  # @brief Get the exception raised by the invocation
+  #
+  # Waits until finished.  Returns None if no exception was raised.
+  #
+  # @endif
+  #
+  def exception(self, timeout=None):
+    if not self.wait(timeout):
+      raise RuntimeError("asynchronous invocation timed out")
+    if self._exc_info is not None:
+      return self._exc_info[1]
+    return None
 
-  def invoke(self):
-    self.activate()
 
+  ##
+  # @if jp
+  # @brief åɤƤФ¹Դؿ
+  # @else
+  # @brief Execution function called by a worker thread
+  # @endif
+  #
+  def run(self):
+    result = None
+    exc_info = None
+    try:
+      if len(self._args) > 0:
+        result = self._func(self._obj, self._args)
+      else:
+        result = self._func(self._obj)
+    except:
+      exc_info = sys.exc_info()
 
-  def finished(self):
-    return self._finished
-  
+    self._cond.acquire()
+    self._result = result
+    self._exc_info = exc_info
+    self._finished = True
+    self._cond.notifyAll()
+    self._cond.release()
 
-  def svc(self):
-    if len(self._args) > 0:
-      self._func(self._obj, self._args)
-    else:
-      self._func(self._obj)
 
-    self._finished = True
+  def svc(self):
+    self.run()
     return 0
+
+
+##
+# @if jp
+# @class Async_ref_t
+# @brief ƱСؿƤӽФ饹 (ؿ֥Ȥλ)
+#
+# Python Ǥϥ֥ȤϾ˻ȤϤ뤿ᡢAsync_t Ʊư򤹤롣
+#
+# @since 1.0.0
+#
+# @else
+# @class Async_ref_t
+# @brief Asynchronous member function invocation class (reference version)
+#
+# Since objects are always passed by reference in Python, it behaves the
+# same as Async_t.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class Async_ref_t(Async_t):
+
+  def __init__(self, obj, func, *args):
+    Async_t.__init__(self, obj, func, *args)
   
   
 ##
@@ -370,6 +370,58 @@ class BufferBase(OpenRTM_aist.BufferStatus):
     pass
 
 
+  ##
+  # @if jp
+  #
+  # @brief ХåեʣΥǡɤ߽Ф
+  #
+  # Хåեɤ߽Фǽʥǡ n ɤ߽Фvalue ɲ
+  # 롣n ξɤ߽Фǽʥǡ򤹤٤ɤ߽ФХåե
+  # ξǤ readback  block ϹԤʤ
+  # μ read() 򷫤֤ƤӽФ֥饹Ǥϥåμ
+  # ٤ǺѤޤ褦뤳Ȥ˾ޤ
+  #
+  # @param self
+  # @param value ɤ߽Фǡɲäꥹ
+  # @param n ɤ߽Фǿ (default -1: ٤)
+  #
+  # @return BUFFER_OK: 1İʾΥǡɤ߽Ф
+  #         BUFFER_EMPTY: Хåե
+  #
+  # @else
+  #
+  # @brief Read a number of data from the buffer
+  #
+  # This operation reads up to n readable data from the buffer and
+  # appends them to value.  If n is negative, all the readable data
+  # are read.  Neither readback nor block is done on empty buffer.
+  # This implementation calls read() repeatedly, and subclasses had
+  # better override it to take the lock only once.
+  #
+  # @param self
+  # @param value The list to which the read data are appended
+  # @param n The maximum number of data to read (default -1: all)
+  #
+  # @return BUFFER_OK: One or more data were read
+  #         BUFFER_EMPTY: The buffer is empty
+  #
+  # @endif
+  #
+  # ReturnCode readN(std::vector<DataType>& value, long int n = -1)
+  def readN(self, value, n = -1):
+    count = 0
+    while (n < 0 or count < n) and not self.empty():
+      tmp = [None]
+      if self.read(tmp) != OpenRTM_aist.BufferStatus.BUFFER_OK:
+        break
+      value.append(tmp[0])
+      count += 1
+
+    if count == 0:
+      return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
   ##
   # @if jp
   #
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file CdrBatch.py
+# @brief Framing functions for batched CDR data
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import struct
+
+
+##
+# @if jp
+# @brief ХåΥإåӥե졼Ĺη (ȥ륨ǥ 32bit)
+# @else
+# @brief Format of the batch header and the frame length
+#        (32bit little endian)
+# @endif
+CDR_BATCH_LENGTH = struct.Struct("<I")
+
+
+##
+# @if jp
+#
+# @brief ʣ CDR ǡ1ĤΥǡˤޤȤ
+#
+# ե졼³ơ CDR ǡ򤽤ĹȤȤ˳Ǽ롣
+#  32bit ȥ륨ǥǰʲ̤ꡣ
+#
+# [ե졼][Ĺ][CDR ǡ][Ĺ][CDR ǡ]...
+#
+# @param cdrs CDR ǡ(ʸ)Υꥹ
+#
+# @return ޤȤ줿ǡ
+#
+# @else
+#
+# @brief Pack CDR data into one data
+#
+# The number of frames is followed by each CDR data with its length.
+# The format is as follows, where all the integers are 32bit little
+# endian.
+#
+# [number of frames][length][CDR data][length][CDR data]...
+#
+# @param cdrs List of CDR data (string)
+#
+# @return Packed data
+#
+# @endif
+def packCdrBatch(cdrs):
+  pack = CDR_BATCH_LENGTH.pack
+  frames = [pack(len(cdrs))]
+  for cdr in cdrs:
+    frames.append(pack(len(cdr)))
+    frames.append(cdr)
+  return "".join(frames)
+
+
+##
+# @if jp
+#
+# @brief ޤȤ줿ǡ CDR ǡΥꥹȤ᤹
+#
+# packCdrBatch() ǤޤȤ줿ǡʬ䤹롣
+#
+# @param data ޤȤ줿ǡ
+#
+# @return CDR ǡ(ʸ)Υꥹ
+#
+# @exception ValueError ǡηʤ
+#
+# @else
+#
+# @brief Unpack data into the list of CDR data
+#
+# Splits data packed by packCdrBatch().
+#
+# @param data Packed data
+#
+# @return List of CDR data (string)
+#
+# @exception ValueError The data is malformed
+#
+# @endif
+def unpackCdrBatch(data):
+  unpack_from = CDR_BATCH_LENGTH.unpack_from
+  size = CDR_BATCH_LENGTH.size
+  length = len(data)
+
+  if length < size:
+    raise ValueError("CDR batch too short: %d" % length)
+
+  count = unpack_from(data, 0)[0]
+  pos = size
+  cdrs = []
+  for i in range(count):
+    if pos + size > length:
+      raise ValueError("CDR batch truncated at frame %d" % i)
+    end = pos + size + unpack_from(data, pos)[0]
+    if end > length:
+      raise ValueError("CDR batch truncated at frame %d" % i)
+    cdrs.append(data[pos + size:end])
+    pos = end
+
+  if pos != length:
+    raise ValueError("CDR batch has %d trailing bytes" % (length - pos))
+  return cdrs
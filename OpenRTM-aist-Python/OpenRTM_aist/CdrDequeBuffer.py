@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  CdrDequeBuffer.py
+# @brief DequeBuffer for CDR
+# @date  $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+
+import OpenRTM_aist
+
+class CdrDequeBuffer(OpenRTM_aist.DequeBuffer):
+    def __init__(self):
+        OpenRTM_aist.DequeBuffer.__init__(self)
+        pass
+
+
+def CdrDequeBufferInit():
+    OpenRTM_aist.CdrBufferFactory.instance().addFactory("deque_buffer",
+                                                        OpenRTM_aist.CdrDequeBuffer,
+                                                        OpenRTM_aist.Delete)
@@ -17,7 +17,6 @@
 
 
 import OpenRTM_aist
-from OpenRTM_aist import *
 
 class CdrRingBuffer(OpenRTM_aist.RingBuffer):
     def __init__(self):
@@ -62,6 +62,36 @@ class ConnectorInfo:
     self.id         = id_          # str
     self.ports      = ports_       # [str,...]
     self.properties = properties_  # OpenRTM_aist.Properties
+    self._endian    = None
+
+
+  ##
+  # @if jp
+  #
+  # @brief CDR Υǥ
+  #
+  # ץѥƥ serializer.cdr.endian Ƭͤᡢ̤ݻ롣
+  # ̤ξϥȥ륨ǥȤ롣
+  #
+  # @return True: ȥ륨ǥFalse: ӥåǥ
+  #
+  # @else
+  #
+  # @brief Getting the CDR endian
+  #
+  # Determined from the first value of the property
+  # serializer.cdr.endian, and the result is kept.  Little endian is
+  # assumed if not set.
+  #
+  # @return True: little endian, False: big endian
+  #
+  # @endif
+  def endian(self):
+    if self._endian is None:
+      endian = self.properties.getProperty("serializer.cdr.endian", "little")
+      endian = OpenRTM_aist.split(endian, ",") # Maybe endian is ["little","big"]
+      self._endian = (OpenRTM_aist.normalize(endian) != "big")
+    return self._endian
 
 #!
 # @if jp
@@ -15,12 +15,23 @@
 #         Advanced Industrial Science and Technology (AIST), Japan
 #     All rights reserved.
 
+import threading
+
 from omniORB import *
 from omniORB import any
 
 import OpenRTM_aist
 
 
+##
+# @if jp
+# @brief ΥǡΥǥɷ̤ݻ륹åɶɽѿ
+# @else
+# @brief Thread local variable holding the decoded data being notified
+# @endif
+_notifying = threading.local()
+
+
 ##
 # @if jp
 # @brief ConnectorDataListener Υ
@@ -164,26 +175,66 @@ class ConnectorDataListener:
 # @endif
 #
 class ConnectorDataListenerT(ConnectorDataListener):
+  """
+  """
+
+  _typecodes = {}
+
   def __del__(self):
     pass
 
 
+  ##
+  # @if jp
+  #
+  # @brief ǡǥɤ
+  #
+  # ConnectorDataListenerHolder ΤƤ֤ϡƱǡ
+  # ꥹʤδ֤1ĤΥǡˤĤ1ǥɤη̤ͭ롣
+  # Τᡢ֤줿ǡѹƤϤʤʤ
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata CDR ǡ
+  # @param data ǡ򼨤󥹥
+  #
+  # @return ǥɤ줿ǡ
+  #
+  # @else
+  #
+  # @brief Decode the data
+  #
+  # While notified by ConnectorDataListenerHolder, the data is decoded
+  # only once among the listeners of the same data type, and the
+  # result is shared.  Therefore, the returned data must not be
+  # modified.
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata CDR data
+  # @param data Instance indicating the data type
+  #
+  # @return Decoded data
+  #
+  # @endif
+  #
   # virtual void operator()(const ConnectorInfo& info,
   #                         const cdrMemoryStream& cdrdata)
   def __call__(self, info, cdrdata, data):
-    endian = info.properties.getProperty("serializer.cdr.endian","little")
-    if endian is not "little" and endian is not None:
-      endian = OpenRTM_aist.split(endian, ",") # Maybe endian is ["little","big"]
-      endian = OpenRTM_aist.normalize(endian) # Maybe self._endian is "little" or "big"
-
-    if endian == "little":
-      endian = True
-    elif endian == "big":
-      endian = False
-    else:
-      endian = True
-
-    _data = cdrUnmarshal(any.to_any(data).typecode(), cdrdata, endian)
+    cls = data.__class__
+    tc = self._typecodes.get(cls)
+    if tc is None:
+      tc = any.to_any(data).typecode()
+      # only generated types identify their typecode by the class
+      if hasattr(cls, "_NP_RepositoryId"):
+        self._typecodes[cls] = tc
+
+    decoded = getattr(_notifying, "decoded", None)
+    if decoded is None or decoded[0] is not cdrdata:
+      return cdrUnmarshal(tc, cdrdata, info.endian())
+
+    _data = decoded[1].get(tc)
+    if _data is None:
+      _data = cdrUnmarshal(tc, cdrdata, info.endian())
+      decoded[1][tc] = _data
     return _data
 
 
@@ -315,33 +366,75 @@ class ConnectorDataListenerHolder:
 
 
   def __del__(self):
-    for listener in self._listeners:
-      for (k,v) in listener.iteritems():
-        if v:
-          del k
+    for (k,v) in self._listeners:
+      if v:
+        del k
     return
 
     
   # void addListener(ConnectorDataListener* listener, bool autoclean);
   def addListener(self, listener, autoclean):
-    self._listeners.append({listener:autoclean})
+    self._listeners.append((listener, autoclean))
     return
 
     
   # void removeListener(ConnectorDataListener* listener);
   def removeListener(self, listener):
-    for (i, _listener) in enumerate(self._listeners):
-      if listener in _listener:
-        del self._listeners[i][listener]
+    for (i, (k,v)) in enumerate(self._listeners):
+      if k is listener:
+        del self._listeners[i]
         return
 
+
+  ##
+  # @if jp
+  # @brief ꥹʤϿƤʤɤ
+  # @else
+  # @brief Whether no listener is registered
+  # @endif
+  #
+  def isEmpty(self):
+    return not self._listeners
+
     
+  ##
+  # @if jp
+  #
+  # @brief ꥹʤΤ
+  #
+  # ꥹʤϿƤʤϲ⤷ʤΤδ֡
+  # ConnectorDataListenerT ˤǥɷ̤ǡȤݻ
+  # Ʊǡʣǥɤʤ褦ˤ롣
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata CDR ǡ
+  #
+  # @else
+  #
+  # @brief Notify listeners
+  #
+  # Nothing is done if no listener is registered.  During the
+  # notification, the data decoded by ConnectorDataListenerT is kept
+  # for each data type so that the same data is not decoded twice.
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata CDR data
+  #
+  # @endif
+  #
   # void notify(const ConnectorInfo& info,
   #             const cdrMemoryStream& cdrdata);
   def notify(self, info, cdrdata):
-    for listener in self._listeners:
-      for (k,v) in listener.iteritems():
+    if not self._listeners:
+      return
+
+    prev = getattr(_notifying, "decoded", None)
+    _notifying.decoded = (cdrdata, {})
+    try:
+      for (k,v) in self._listeners:
         k(info, cdrdata)
+    finally:
+      _notifying.decoded = prev
     return
 
 
@@ -18,6 +18,8 @@
 import omniORB.CORBA as CORBA
 import CosNaming
 import string
+import threading
+import time
 
 ##
 # @if jp
@@ -36,6 +38,10 @@ import string
 # ΥƥȤ¸ߤʤǤ⡢Ū˥ƥȤХ
 # ŪΥƥȤ䥪֥ȤΥХɤԤȤǤ롣
 #
+# setCacheTTL() ֤ͭꤹȡ褷֥ȻȤ
+# ƵŪʥХɤΥƥȤ򥯥饤¦ǥå夹롣
+# åϤΥ֥Ȥ̤ bindrebindunbind ̵롣
+#
 # @since 0.4.0
 #
 # @else
@@ -53,6 +59,11 @@ import string
 # This class realizes forced binding to deep NamingContext, without binding
 # intermediate NamingContexts explicitly.
 #
+# If a lifetime is set by setCacheTTL(), resolved object references and
+# the intermediate contexts of recursive binding are cached on the
+# client side.  The cache is invalidated by bind, rebind and unbind
+# through this object.
+#
 # @since 0.4.0
 #
 # @endif
@@ -81,6 +92,12 @@ class CorbaNaming:
     self._nameServer = ""
     self._rootContext = CosNaming.NamingContext._nil
     self._blLength = 100
+    self._cacheTTL = 0.0
+    self._cacheMutex = threading.RLock()
+    self._objCache = {}
+    self._cxtCache = {}
+    self._cacheStats = {"hits": 0, "misses": 0,
+                        "context_hits": 0, "context_misses": 0}
 
     if name_server:
       self._nameServer = "corbaloc::" + name_server + "/NameService"
@@ -160,6 +177,90 @@ class CorbaNaming:
     return False
 
 
+  ##
+  # @if jp
+  #
+  # @brief å֤ͭꤹ
+  #
+  # 褷֥ȻȤΥƥȤ֥å夹롣
+  # 0 ꤹȥå̵ˤåƤ˴롣
+  # ǥեȤ 0
+  #
+  # @param self
+  # @param ttl ͭ [sec]
+  #
+  # @else
+  #
+  # @brief Set the lifetime of the cache
+  #
+  # Resolved object references and intermediate contexts are cached for
+  # the given time.  0 disables the cache and discards its content.
+  # The default is 0.
+  #
+  # @param self
+  # @param ttl Lifetime [sec]
+  #
+  # @endif
+  def setCacheTTL(self, ttl):
+    self._cacheTTL = ttl
+    if ttl <= 0.0:
+      self.clearCache()
+    return
+
+
+  ##
+  # @if jp
+  # @brief å֤ͭ
+  # @else
+  # @brief Get the lifetime of the cache
+  # @endif
+  def getCacheTTL(self):
+    return self._cacheTTL
+
+
+  ##
+  # @if jp
+  #
+  # @brief åΥҥåȿȥߥ
+  #
+  # @param self
+  #
+  # @return resolve()  "hits""misses" ȡƵŪʥХɤǤ
+  #         ΥƥȤ "context_hits""context_misses" μ
+  #
+  # @else
+  #
+  # @brief Get the numbers of hits and misses of the cache
+  #
+  # @param self
+  #
+  # @return Dictionary of "hits" and "misses" of resolve(), and
+  #         "context_hits" and "context_misses" of intermediate contexts
+  #         in recursive binding
+  #
+  # @endif
+  def getCacheStats(self):
+    self._cacheMutex.acquire()
+    try:
+      return self._cacheStats.copy()
+    finally:
+      self._cacheMutex.release()
+
+
+  ##
+  # @if jp
+  # @brief åƤ˴
+  # @else
+  # @brief Discard the content of the cache
+  # @endif
+  def clearCache(self):
+    self._cacheMutex.acquire()
+    self._objCache.clear()
+    self._cxtCache.clear()
+    self._cacheMutex.release()
+    return
+
+
   ##
   # @if jp
   #
@@ -210,6 +311,7 @@ class CorbaNaming:
     if force is None :
       force = True
 
+    self.invalidateCache(name_list)
     try:
       self._rootContext.bind(name_list, obj)
     except CosNaming.NamingContext.NotFound:
@@ -225,6 +327,8 @@ class CorbaNaming:
     except CosNaming.NamingContext.AlreadyBound:
       self._rootContext.rebind(name_list, obj)
 
+    self.storeCache(self._objCache, name_list, obj)
+
 
   ##
   # @if jp
@@ -291,19 +395,28 @@ class CorbaNaming:
   # @endif
   def bindRecursive(self, context, name_list, obj):
     length = len(name_list)
-    cxt = context
-    for i in range(length):
-      if i == length -1:
-        try:
-          cxt.bind(self.subName(name_list, i, i), obj)
-        except CosNaming.NamingContext.AlreadyBound:
-          cxt.rebind(self.subName(name_list, i, i), obj)
-        return
-      else:
-        if self.objIsNamingContext(cxt):
-          cxt = self.bindOrResolveContext(cxt,self.subName(name_list, i, i))
+    start, cxt = self.lookupContext(context, name_list)
+    try:
+      for i in range(start, length):
+        if i == length -1:
+          try:
+            cxt.bind(self.subName(name_list, i, i), obj)
+          except CosNaming.NamingContext.AlreadyBound:
+            cxt.rebind(self.subName(name_list, i, i), obj)
+          return
         else:
-          raise CosNaming.NamingContext.CannotProceed(cxt, self.subName(name_list, i))
+          if self.objIsNamingContext(cxt):
+            cxt = self.bindOrResolveContext(cxt,self.subName(name_list, i, i))
+            if context is self._rootContext:
+              self.storeCache(self._cxtCache, self.subName(name_list, 0, i), cxt)
+          else:
+            raise CosNaming.NamingContext.CannotProceed(cxt, self.subName(name_list, i))
+    except:
+      if start == 0:
+        raise
+      # the cached context may be stale
+      self.invalidateCache(self.subName(name_list, 0, start - 1))
+      self.bindRecursive(context, name_list, obj)
     return
 
 
@@ -335,6 +448,7 @@ class CorbaNaming:
     if force is None:
       force = True
       
+    self.invalidateCache(name_list)
     try:
       self._rootContext.rebind(name_list, obj)
 
@@ -350,6 +464,7 @@ class CorbaNaming:
       else:
         raise
       
+    self.storeCache(self._objCache, name_list, obj)
     return
 
 
@@ -408,19 +523,29 @@ class CorbaNaming:
   # @endif
   def rebindRecursive(self, context, name_list, obj):
     length = len(name_list)
-    for i in range(length):
-      if i == length - 1:
-        context.rebind(self.subName(name_list, i, i), obj)
-        return
-      else:
-        if self.objIsNamingContext(context):
-          try:
-            context = context.bind_new_context(self.subName(name_list, i, i))
-          except CosNaming.NamingContext.AlreadyBound:
-            obj_ = context.resolve(self.subName(name_list, i, i))
-            context = obj_._narrow(CosNaming.NamingContext)
+    start, cxt = self.lookupContext(context, name_list)
+    try:
+      for i in range(start, length):
+        if i == length - 1:
+          cxt.rebind(self.subName(name_list, i, i), obj)
+          return
         else:
-          raise CosNaming.NamingContext.CannotProceed(context, self.subName(name_list, i))
+          if self.objIsNamingContext(cxt):
+            try:
+              cxt = cxt.bind_new_context(self.subName(name_list, i, i))
+            except CosNaming.NamingContext.AlreadyBound:
+              obj_ = cxt.resolve(self.subName(name_list, i, i))
+              cxt = obj_._narrow(CosNaming.NamingContext)
+            if context is self._rootContext:
+              self.storeCache(self._cxtCache, self.subName(name_list, 0, i), cxt)
+          else:
+            raise CosNaming.NamingContext.CannotProceed(cxt, self.subName(name_list, i))
+    except:
+      if start == 0:
+        raise
+      # the cached context may be stale
+      self.invalidateCache(self.subName(name_list, 0, start - 1))
+      self.rebindRecursive(context, name_list, obj)
     return
 
 
@@ -565,8 +690,13 @@ class CorbaNaming:
     else:
       name_ = name
       
+    obj = self.lookupCache(self._objCache, name_, "")
+    if obj is not None:
+      return obj
+
     try:
       obj = self._rootContext.resolve(name_)
+      self.storeCache(self._objCache, name_, obj)
       return obj
     except CosNaming.NamingContext.NotFound, ex:
       return None
@@ -605,6 +735,7 @@ class CorbaNaming:
     else:
       name_ = name
 
+    self.invalidateCache(name_)
     try:
       self._rootContext.unbind(name_)
     except:
@@ -667,6 +798,7 @@ class CorbaNaming:
     else:
       name_ = name
 
+    self.invalidateCache(name_)
     try:
       return self._rootContext.bind_new_context(name_)
     except CosNaming.NamingContext.NotFound:
@@ -714,6 +846,7 @@ class CorbaNaming:
   #
   # @endif
   def destroy(self, context):
+    self.clearCache()
     context.destroy()
 
 
@@ -776,6 +909,7 @@ class CorbaNaming:
   # @brief Destroy all binding
   # @endif
   def clearAll(self):
+    self.clearCache()
     self.destroyRecursive(self._rootContext)
     return
 
@@ -1213,3 +1347,156 @@ class CorbaNaming:
         pre_pos   = begin_pos
 
     return len(results)
+
+
+  ##
+  # @if jp
+  # @brief ͡ॳݡͥȤ饭åΥ
+  # @else
+  # @brief Create the key of the cache from name components
+  # @endif
+  def nameKey(self, name_list):
+    return tuple([(nc.id, nc.kind) for nc in name_list])
+
+
+  ##
+  # @if jp
+  #
+  # @brief å夫饪֥ȻȤ
+  #
+  # @param self
+  # @param cache å
+  # @param name_list ͡ॳݡͥ
+  # @param stat פ̾Ƭ
+  #
+  # @return ͭΥ֥Ȼȡʤ None
+  #
+  # @else
+  #
+  # @brief Get an object reference from the cache
+  #
+  # @param self
+  # @param cache Cache
+  # @param name_list Name components
+  # @param stat Prefix of the names of the statistics
+  #
+  # @return Object reference within the lifetime.  None if not found.
+  #
+  # @endif
+  def lookupCache(self, cache, name_list, stat):
+    if self._cacheTTL <= 0.0:
+      return None
+
+    key = self.nameKey(name_list)
+    self._cacheMutex.acquire()
+    try:
+      entry = cache.get(key)
+      if entry is not None:
+        if entry[0] > time.time():
+          self._cacheStats[stat + "hits"] += 1
+          return entry[1]
+        del cache[key]
+      self._cacheStats[stat + "misses"] += 1
+      return None
+    finally:
+      self._cacheMutex.release()
+
+
+  ##
+  # @if jp
+  # @brief å˥֥ȻȤǼ
+  # @else
+  # @brief Store an object reference in the cache
+  # @endif
+  def storeCache(self, cache, name_list, obj):
+    if self._cacheTTL <= 0.0 or obj is None:
+      return
+
+    key = self.nameKey(name_list)
+    self._cacheMutex.acquire()
+    cache[key] = (time.time() + self._cacheTTL, obj)
+    self._cacheMutex.release()
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief å̵
+  #
+  # ꤷ̾ȡβ̾Υȥ˴롣
+  #
+  # @param self
+  # @param name_list ͡ॳݡͥ
+  #
+  # @else
+  #
+  # @brief Invalidate the cache
+  #
+  # Discards the entries of the given name and the names under it.
+  #
+  # @param self
+  # @param name_list Name components
+  #
+  # @endif
+  def invalidateCache(self, name_list):
+    if not self._objCache and not self._cxtCache:
+      return
+
+    key = self.nameKey(name_list)
+    length = len(key)
+    self._cacheMutex.acquire()
+    for cache in (self._objCache, self._cxtCache):
+      for k in cache.keys():
+        if k[:length] == key:
+          del cache[k]
+    self._cacheMutex.release()
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ƵŪʥХɤ򳫻Ϥ륳ƥȤ
+  #
+  # context 롼ȥƥȤξ硢name_list ΥƥȤ
+  # å夵ƤǤ⿼Τ֤
+  #
+  # @param self
+  # @param context Хɤ򳫻Ϥ륳ƥ
+  # @param name_list ͡ॳݡͥ
+  #
+  # @return ѤߤΥ͡ॳݡͥȤοȥƥȤ
+  #
+  # @else
+  #
+  # @brief Get the context to start recursive binding from
+  #
+  # If context is the root context, returns the deepest cached context
+  # among the intermediate contexts of name_list.
+  #
+  # @param self
+  # @param context Context to start binding from
+  # @param name_list Name components
+  #
+  # @return Pair of the number of resolved name components and the
+  #         context
+  #
+  # @endif
+  def lookupContext(self, context, name_list):
+    if self._cacheTTL <= 0.0 or context is not self._rootContext:
+      return 0, context
+
+    key = self.nameKey(name_list)
+    now = time.time()
+    self._cacheMutex.acquire()
+    try:
+      for i in range(len(key) - 1, 0, -1):
+        entry = self._cxtCache.get(key[:i])
+        if entry is not None and entry[0] > now:
+          self._cacheStats["context_hits"] += 1
+          return i, entry[1]
+      self._cacheStats["context_misses"] += 1
+      return 0, context
+    finally:
+      self._cacheMutex.release()
@@ -1083,12 +1083,12 @@ class CorbaPort(OpenRTM_aist.PortBase):
   #   subscribeInterfaces(const ConnectorProfile& connector_profile);
   def subscribeInterfaces(self, connector_profile):
     self._rtcout.RTC_TRACE("subscribeInterfaces()")
-    nv = connector_profile.properties
+    nv = self.getPropertiesView(connector_profile)
 
     strict = False # default is "best_effort"
-    index = OpenRTM_aist.NVUtil.find_index(nv, "port.connection.strictness")
+    index = nv.find_index("port.connection.strictness")
     if index >=  0:
-      strictness = str(any.from_any(nv[index].value, keep_structs=True))
+      strictness = str(nv.valueAt(index))
       if "best_effort" == strictness:
         strict = False
       elif "strict" == strictness:
@@ -1143,7 +1143,7 @@ class CorbaPort(OpenRTM_aist.PortBase):
   #    unsubscribeInterfaces(const ConnectorProfile& connector_profile);
   def unsubscribeInterfaces(self, connector_profile):
     self._rtcout.RTC_TRACE("unsubscribeInterfaces()")
-    nv = connector_profile.properties
+    nv = self.getPropertiesView(connector_profile)
 
     for consumer in self._consumers:
       ior = []
@@ -1201,21 +1201,22 @@ class CorbaPort(OpenRTM_aist.PortBase):
     newdesc += ".required." + cons.descriptor()
 
     # find a NameValue of the consumer
-    cons_index = OpenRTM_aist.NVUtil.find_index(nv, newdesc)
+    nv = OpenRTM_aist.NVUtil.view(nv)
+    cons_index = nv.find_index(newdesc)
     if cons_index < 0:
       return False
 
-    provider = str(any.from_any(nv[cons_index].value, keep_structs=True))
+    provider = str(nv.valueAt(cons_index))
     if not provider:
       self._rtcout.RTC_WARN("Cannot extract Provider interface descriptor")
       return False
 
     # find a NameValue of the provider
-    prov_index = OpenRTM_aist.NVUtil.find_index(nv, provider)
+    prov_index = nv.find_index(provider)
     if prov_index < 0:
       return False
 
-    ior_ = str(any.from_any(nv[prov_index].value, keep_structs=True))
+    ior_ = str(nv.valueAt(prov_index))
     if not ior_:
       self._rtcout.RTC_WARN("Cannot extract Provider IOR string")
       return False
@@ -1270,11 +1271,12 @@ class CorbaPort(OpenRTM_aist.PortBase):
     olddesc = "port." + cons.descriptor()
 
     # find a NameValue of the provider same as olddesc
-    index = OpenRTM_aist.NVUtil.find_index(nv, olddesc)
+    nv = OpenRTM_aist.NVUtil.view(nv)
+    index = nv.find_index(olddesc)
     if index < 0:
       return False
 
-    ior_ = str(any.from_any(nv[index].value, keep_structs=True))
+    ior_ = str(nv.valueAt(index))
     if not ior_:
       self._rtcout.RTC_WARN("Cannot extract Provider IOR string")
       return False
@@ -35,6 +35,7 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "manager.naming_formats",           "%h.host_cxt/%n.mgr",
                  "manager.pid",                      "",
                  "manager.refstring_path",           "/var/log/rtcmanager.ref",
+                 "manager.id_generator.type",        "uuid1",
                  "os.name",                          "",
                  "os.release",                       "",
                  "os.version",                       "",
@@ -45,6 +46,7 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "logger.date_format",               "%b %d %H:%M:%S",
                  "logger.log_level",                 "INFO",
                  "logger.stream_lock",               "NO",
+                 "logger.strip_disabled_levels",     "NO",
                  "logger.master_logger",             "",
                  "module.conf_path",                 "",
                  "module.load_path",                 "",
@@ -53,8 +55,17 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "naming.formats",                   "%h.host_cxt/%n.rtc",
                  "naming.update.enable",             "YES",
                  "naming.update.interval",           "10.0",
+                 "naming.update.max_retry_interval", "300.0",
+                 "naming.timeout",                   "3.0",
+                 "naming.cache.ttl",                 "0.0",
                  "timer.enable",                     "YES",
                  "timer.tick",                       "0.1",
+                 "port.liveness.timeout",            "1.0",
+                 "port.liveness.ttl",                "1.0",
+                 "port.liveness.interval",           "0.0",
+                 "port.liveness.pool.size",          "4",
+                 "publisher.pool.size",              "4",
+                 "async.pool.size",                  "8",
                  "corba.args",                       "",
                  "corba.endpoint",                   "",
                  "corba.id",                         OpenRTM_aist.corba_name,
@@ -63,9 +74,17 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "corba.nameservice.replace_endpoint", "NO",
                  "exec_cxt.periodic.type",           "PeriodicExecutionContext",
                  "exec_cxt.periodic.rate",           "1000",
+                 "exec_cxt.periodic.scheduling",     "sleep",
+                 "exec_cxt.periodic.overrun_policy", "catchup",
+                 "exec_cxt.periodic.measure",        "NO",
+                 "exec_cxt.exttrig.tick_mode",       "sleep",
+                 "exec_cxt.exttrig.sync_tick",       "NO",
                  "exec_cxt.evdriven.type",           "EventDrivenExecutionContext",
                  "manager.modules.load_path",        "./",
                  "manager.modules.abs_path_allowed", "YES",
+                 "manager.modules.index_file",       "~/.openrtm/python_module_index",
+                 "manager.components.precreate_mode", "serial",
+                 "manager.components.pool.size",     "4",
                  "manager.is_master",                "NO",
                  "manager.corba_servant",            "YES",
                  "manager.shutdown_on_nortcs",       "YES",
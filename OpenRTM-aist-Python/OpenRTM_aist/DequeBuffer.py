@@ -0,0 +1,805 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file DequeBuffer.py
+# @brief Single lock buffer class based on collections.deque
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import threading
+import time
+from collections import deque
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class DequeBuffer
+# @brief deque ˤ󥰥Хåե饹
+#
+# RingBuffer ƱݥꥷĥХåե饹̤ɥǡ
+# collections.deque ˡɤ߽ФѤߤΥǡ򴬤ᤷѤ deque 
+# ݻƤĤ Condition ¾롣
+# readable(), writable(), full(), empty() ϥåʤ
+#
+# @since 1.0.0
+#
+# @else
+# @class DequeBuffer
+# @brief Ring buffer implementation class based on deque
+#
+# Buffer implementation class which has the same policies as
+# RingBuffer.  Unread data are held in a collections.deque and data
+# already read are held in another deque for rewinding, and all the
+# operations are guarded by one Condition.  readable(), writable(),
+# full() and empty() do not take the lock.
+#
+# @since 1.0.0
+#
+# @endif
+class DequeBuffer(OpenRTM_aist.BufferBase):
+  """
+  """
+
+  DEQUEBUFFER_DEFAULT_LENGTH = 8
+
+  ##
+  # @if jp
+  #
+  # @brief 󥹥ȥ饯
+  #
+  # ꤵ줿ХåեĹǥХåե롣
+  #
+  # @param length ХåեĹ
+  #
+  # @else
+  #
+  # @brief Constructor
+  #
+  # Initialize the buffer by specified buffer length.
+  #
+  # @param length Buffer length
+  #
+  # @endif
+  def __init__(self, length=DEQUEBUFFER_DEFAULT_LENGTH):
+    self._overwrite = True
+    self._readback = True
+    self._timedwrite = False
+    self._timedread  = False
+    self._wtimeout = OpenRTM_aist.TimeValue(1,0)
+    self._rtimeout = OpenRTM_aist.TimeValue(1,0)
+    self._length   = length
+    self._data = deque()
+    self._done = deque()
+    self._wvalue = None
+    self._waiters = 0
+    self._cond = threading.Condition(threading.Lock())
+
+
+  ##
+  # @if jp
+  # @brief Хåե
+  #
+  # Properties ͿץѥƥˤꡢХåե
+  # 롣ѤǤ륪ץ RingBuffer Ʊ
+  #
+  # @else
+  # @brief Set the buffer
+  #
+  # Initialize the buffer by the given properties.  The available
+  # options are the same as RingBuffer.
+  #
+  # @endif
+  #
+  # void init(const coil::Properties& prop)
+  def init(self, prop):
+    self.__initLength(prop)
+    self.__initWritePolicy(prop)
+    self.__initReadPolicy(prop)
+
+
+  ##
+  # @if jp
+  #
+  # @brief ХåեĹꤹ
+  #
+  # Ϳ줿ϥХåեĹꤷХåեꥻåȤ롣
+  #
+  # @param n ХåեĹ
+  #
+  # @return ХåեĹޤ BUFFER_OK, NOT_SUPPORTED
+  #
+  # @else
+  #
+  # @brief Get or set the buffer length
+  #
+  # If an argument is given, the buffer length is set and the buffer
+  # is reset.
+  #
+  # @param n new buffer length
+  #
+  # @return buffer length, or BUFFER_OK, NOT_SUPPORTED
+  #
+  # @endif
+  #
+  # size_t length(void) const
+  def length(self, n = None):
+    if n is None:
+      return self._length
+
+    if n < 1:
+      return OpenRTM_aist.BufferStatus.NOT_SUPPORTED
+
+    self._cond.acquire()
+    self._length = n
+    self._cond.release()
+    self.reset()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեξ֤ꥻåȤ
+  #
+  # Хåե˳Ǽ줿ǡ򤹤٤˴롣
+  #
+  # @return BUFFER_OK: ｪλ
+  #
+  # @else
+  #
+  # @brief Reset the buffer status
+  #
+  # All the data stored in the buffer are discarded.
+  #
+  # @return BUFFER_OK: Normal return
+  #
+  # @endif
+  #
+  # ReturnCode reset()
+  def reset(self):
+    self._cond.acquire()
+    self._data.clear()
+    self._done.clear()
+    self._wvalue = None
+    self.__notify()
+    self._cond.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  #
+  # @brief ХåեθߤνǤ
+  #
+  # put() ǽ񤭹ޤ졢ޤ advanceWptr() Ƥʤǡ֤
+  #
+  # @return 񤭹
+  #
+  # @else
+  #
+  # @brief Get the current writing element
+  #
+  # This operation returns the data given by put() which has not been
+  # committed by advanceWptr() yet.
+  #
+  # @return the writing element
+  #
+  # @endif
+  #
+  # DataType* wptr(long int n = 0)
+  def wptr(self, n = 0):
+    if n == 0:
+      return self._wvalue
+    return None
+
+
+  ##
+  # @if jp
+  #
+  # @brief ߥݥ󥿤ʤ
+  #
+  # n > 0 ξ put() 줿ǡ񤭹ߡn < 0 ξϺǸ
+  # ˽񤭹ޤ줿ǡä
+  #
+  # @param n ߥݥ + n ΰ֤Υݥ
+  # @return BUFFER_OK:            ｪλ
+  #         PRECONDITION_NOT_MET: n > writable() ޤ n < -readable()
+  #
+  # @else
+  #
+  # @brief Forward n writing pointers.
+  #
+  # If n > 0 the data given by put() are written, and if n < 0 the
+  # last written data are withdrawn.
+  #
+  # @param n writing pointer + n
+  # @return BUFFER_OK:            Normal return
+  #         PRECONDITION_NOT_MET: n > writable() or n < -readable()
+  #
+  # @endif
+  #
+  # ReturnCode advanceWptr(long int n = 1)
+  def advanceWptr(self, n = 1):
+    self._cond.acquire()
+    try:
+      if (n > 0 and n > (self._length - len(self._data))) or \
+            (n < 0 and n < (-len(self._data))):
+        return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      if n > 0:
+        for i in range(n):
+          self.__append(self._wvalue)
+        self._wvalue = None
+      else:
+        for i in range(-n):
+          self._data.pop()
+      self.__notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåե˥ǡ񤭹
+  #
+  # 񤭹ǡݻ롣ǡ advanceWptr() ˤХåե
+  # ˽񤭹ޤ롣
+  #
+  # @param value 񤭹оݥǡ
+  #
+  # @return BUFFER_OK: ｪλ
+  #
+  # @else
+  #
+  # @brief Write data into the buffer
+  #
+  # The data is held until it is written into the buffer by
+  # advanceWptr().
+  #
+  # @param value Target data to write.
+  #
+  # @return BUFFER_OK: Normal return
+  #
+  # @endif
+  #
+  # ReturnCode put(const DataType& value)
+  def put(self, value):
+    self._wvalue = value
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåե˽񤭹
+  #
+  # RingBuffer.write() ƱݥꥷǥХåե˥ǡ񤭹ࡣ
+  # 2 (sec) ꤵ줿 block ⡼ɤǽ񤭹ࡣ
+  #
+  # @param value 񤭹оݥǡ
+  # @param sec   ॢȻ sec  (default -1: ̵)
+  # @param nsec  ॢȻ nsec (default 0)
+  # @return BUFFER_OK            ｪλ
+  #         BUFFER_FULL          Хåեե
+  #         TIMEOUT              ߤॢȤ
+  #         PRECONDITION_NOT_MET ۾
+  #
+  # @else
+  #
+  # @brief Write data into the buffer
+  #
+  # The data is written with the same policies as
+  # RingBuffer.write().  If the second argument (sec) is given, the
+  # data is written in block mode.
+  #
+  # @param value Target data to write.
+  # @param sec   Timeout sec  (default -1: no timeout)
+  # @param nsec  Timeout nsec (default 0)
+  # @return BUFFER_OK            Normal return
+  #         BUFFER_FULL          The buffer is full
+  #         TIMEOUT              Timeout occurred
+  #         PRECONDITION_NOT_MET Invalid settings
+  #
+  # @endif
+  #
+  # ReturnCode write(const DataType& value,
+  #                  long int sec = -1, long int nsec = 0)
+  def write(self, value, sec = -1, nsec = 0):
+    self._cond.acquire()
+    try:
+      if len(self._data) >= self._length:
+        timedwrite = self._timedwrite # default is False
+        overwrite  = self._overwrite  # default is True
+
+        if not (sec < 0): # if second arg is set -> block mode
+          timedwrite = True
+          overwrite  = False
+
+        if overwrite and not timedwrite:       # "overwrite" mode
+          self._done.append(self._data.popleft())
+
+        elif not overwrite and not timedwrite: # "do_nothiong" mode
+          return OpenRTM_aist.BufferStatus.BUFFER_FULL
+
+        elif not overwrite and timedwrite:     # "block" mode
+          if sec < 0:
+            sec = self._wtimeout.sec()
+            nsec = self._wtimeout.usec() * 1000
+
+          if not self.__wait(self.writable, sec + (nsec/1000000000.0)):
+            return OpenRTM_aist.BufferStatus.TIMEOUT
+
+        else: # unknown condition
+          return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      self.__append(value)
+      self.__notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåե˽߲ǽǿ
+  #
+  # @return 񤭹߲ǽǿ
+  #
+  # @else
+  #
+  # @brief Get a writable number.
+  #
+  # @return writable number
+  #
+  # @endif
+  #
+  # size_t writable() const
+  def writable(self):
+    return self._length - len(self._data)
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեfullå
+  #
+  # @return true: Хåեfull, false: Хåե
+  #
+  # @else
+  #
+  # @brief Check on whether the buffer is full.
+  #
+  # @return true: full, false: writable
+  #
+  # @endif
+  #
+  # bool full(void) const
+  def full(self):
+    return len(self._data) >= self._length
+
+
+  ##
+  # @if jp
+  #
+  # @brief ɤ߽Фݥ󥿤ΰ֤ˤǤ
+  #
+  #  n ˤɤ߽ФѤߤǤ֤롣
+  #
+  # @param n ɤ߽Фݥ + n ΰ
+  # @return ɤ߽Ф
+  #
+  # @else
+  #
+  # @brief Get the element at the reading pointer + n
+  #
+  # For negative n, the element already read is returned.
+  #
+  # @param n reading pointer + n
+  # @return the reading element
+  #
+  # @endif
+  #
+  # DataType* rptr(long int n = 0)
+  def rptr(self, n = 0):
+    self._cond.acquire()
+    try:
+      if n >= 0:
+        if n < len(self._data):
+          return self._data[n]
+      elif -n <= len(self._done):
+        return self._done[n]
+      return None
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief ɤ߽Фݥ󥿤ʤ
+  #
+  # n < 0 ξɤ߽ФѤߤǤ򴬤᤹
+  #
+  # @param n ɤ߽Фݥ + n ΰ
+  # @return BUFFER_OK:            ｪλ
+  #         PRECONDITION_NOT_MET: n > readable() ޤϴ᤻ʤ
+  #
+  # @else
+  #
+  # @brief Forward n reading pointers.
+  #
+  # If n < 0, the elements already read are rewound.
+  #
+  # @param n reading pointer + n
+  # @return BUFFER_OK:            Normal return
+  #         PRECONDITION_NOT_MET: n > readable() or cannot rewind
+  #
+  # @endif
+  #
+  # ReturnCode advanceRptr(long int n = 1)
+  def advanceRptr(self, n = 1):
+    self._cond.acquire()
+    try:
+      if (n > 0 and n > len(self._data)) or \
+            (n < 0 and -n > len(self._done)):
+        return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      if n > 0:
+        for i in range(n):
+          self._done.append(self._data.popleft())
+      else:
+        for i in range(-n):
+          self._data.appendleft(self._done.pop())
+      self.__notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեǡɤ߽Ф
+  #
+  # ɤ߽Фݥ󥿤ΰ֤Υǡɤ߽Фݥ󥿤Ͽʤʤ
+  #
+  # @param value ɤ߽Фǡ
+  #
+  # @return value Ϳʤɤ߽Фǡ
+  #         Ϳ줿 BUFFER_OK
+  #
+  # @else
+  #
+  # @brief Read data from the buffer
+  #
+  # The data at the reading pointer is read without forwarding the
+  # pointer.
+  #
+  # @param value Read data
+  #
+  # @return the read data if value is not given, otherwise BUFFER_OK
+  #
+  # @endif
+  #
+  # DataType& get()
+  def get(self, value=None):
+    val = self.rptr()
+    if value is None:
+      return val
+
+    value[0] = val
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեɤ߽Ф
+  #
+  # RingBuffer.read() ƱݥꥷǥХåեǡɤ߽Ф
+  # 2 (sec) ꤵ줿 block ⡼ɤɤ߽Ф
+  #
+  # @param value ɤ߽Фǡ (ꥹ)
+  # @param sec   ॢȻ sec  (default -1: ̵)
+  # @param nsec  ॢȻ nsec (default 0)
+  # @return BUFFER_OK            ｪλ
+  #         BUFFER_EMPTY         Хåեץƥ
+  #         TIMEOUT              ɤ߽ФॢȤ
+  #         PRECONDITION_NOT_MET ۾
+  #
+  # @else
+  #
+  # @brief Read data from the buffer
+  #
+  # The data is read with the same policies as RingBuffer.read().
+  # If the second argument (sec) is given, the data is read in block
+  # mode.
+  #
+  # @param value Read data (list)
+  # @param sec   Timeout sec  (default -1: no timeout)
+  # @param nsec  Timeout nsec (default 0)
+  # @return BUFFER_OK            Normal return
+  #         BUFFER_EMPTY         The buffer is empty
+  #         TIMEOUT              Timeout occurred
+  #         PRECONDITION_NOT_MET Invalid settings
+  #
+  # @endif
+  #
+  # ReturnCode read(DataType& value,
+  #                 long int sec = -1, long int nsec = 0)
+  def read(self, value, sec = -1, nsec = 0):
+    self._cond.acquire()
+    try:
+      if not self._data:
+        timedread = self._timedread
+        readback  = self._readback
+
+        if not (sec < 0):  # if second arg is set -> block mode
+          timedread = True
+          readback  = False
+
+        if readback and  not timedread:      # "readback" mode
+          if not self._done:
+            return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+          self._data.appendleft(self._done.pop())
+
+        elif not readback and not timedread: # "do_nothiong" mode
+          return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+
+        elif not readback and timedread:     # "block" mode
+          if sec < 0:
+            sec = self._rtimeout.sec()
+            nsec = self._rtimeout.usec() * 1000
+
+          if not self.__wait(self.readable, sec + (nsec/1000000000.0)):
+            return OpenRTM_aist.BufferStatus.TIMEOUT
+
+        else:                              # unknown condition
+          return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      val = self._data.popleft()
+      self._done.append(val)
+      if len(value) > 0:
+        value[0] = val
+      else:
+        value.append(val)
+
+      self.__notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief ХåեʣΥǡɤ߽Ф
+  #
+  # Хåեɤ߽Фǽʥǡ n ɤ߽Фvalue ɲ
+  # 롣n ξɤ߽Фǽʥǡ򤹤٤ɤ߽Фå
+  # ϰ٤readback  block ϹԤʤ
+  #
+  # @param value ɤ߽Фǡɲäꥹ
+  # @param n ɤ߽Фǿ (default -1: ٤)
+  #
+  # @return BUFFER_OK: 1İʾΥǡɤ߽Ф
+  #         BUFFER_EMPTY: Хåե
+  #
+  # @else
+  #
+  # @brief Read a number of data from the buffer
+  #
+  # This operation reads up to n readable data from the buffer and
+  # appends them to value.  If n is negative, all the readable data
+  # are read.  The lock is taken only once, and neither readback nor
+  # block is done.
+  #
+  # @param value The list to which the read data are appended
+  # @param n The maximum number of data to read (default -1: all)
+  #
+  # @return BUFFER_OK: One or more data were read
+  #         BUFFER_EMPTY: The buffer is empty
+  #
+  # @endif
+  #
+  # ReturnCode readN(std::vector<DataType>& value, long int n = -1)
+  def readN(self, value, n = -1):
+    self._cond.acquire()
+    try:
+      count = len(self._data)
+      if not (n < 0) and n < count:
+        count = n
+
+      if count == 0:
+        return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+
+      for i in range(count):
+        val = self._data.popleft()
+        self._done.append(val)
+        value.append(val)
+
+      self.__notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+    finally:
+      self._cond.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեɤ߽Фǽǿ
+  #
+  # @return ɤ߽Фǽǿ
+  #
+  # @else
+  #
+  # @brief Get a readable number.
+  #
+  # @return readable number
+  #
+  # @endif
+  #
+  # size_t readable() const
+  def readable(self):
+    return len(self._data)
+
+
+  ##
+  # @if jp
+  #
+  # @brief Хåեemptyå
+  #
+  # @return true: Хåեempty, false: ɤ߽Фǽ
+  #
+  # @else
+  #
+  # @brief Check on whether the buffer is empty.
+  #
+  # @return true: empty, false: readable
+  #
+  # @endif
+  #
+  # bool empty(void) const
+  def empty(self):
+    return not self._data
+
+
+  ## void initLength(const coil::Properties& prop)
+  def __initLength(self, prop):
+    if prop.getProperty("length"):
+      n = [0]
+      if OpenRTM_aist.stringTo(n, prop.getProperty("length")):
+        n = n[0]
+        if n > 0:
+          self.length(n)
+
+
+  ## void initWritePolicy(const coil::Properties& prop)
+  def __initWritePolicy(self, prop):
+    policy = OpenRTM_aist.normalize([prop.getProperty("write.full_policy")])
+
+    if policy == "overwrite":
+      self._overwrite  = True
+      self._timedwrite = False
+
+    elif policy == "do_nothing":
+      self._overwrite  = False
+      self._timedwrite = False
+
+    elif policy == "block":
+      self._overwrite  = False
+      self._timedwrite = True
+
+      tm = [0.0]
+      if OpenRTM_aist.stringTo(tm, prop.getProperty("write.timeout")):
+        tm = tm[0]
+        if not (tm < 0):
+          self._wtimeout.set_time(tm)
+
+
+  ## void initReadPolicy(const coil::Properties& prop)
+  def __initReadPolicy(self, prop):
+    policy = OpenRTM_aist.normalize([prop.getProperty("read.empty_policy")])
+
+    if policy == "readback":
+      self._readback  = True
+      self._timedread = False
+
+    elif policy == "do_nothing":
+      self._readback  = False
+      self._timedread = False
+
+    elif policy == "block":
+      self._readback  = False
+      self._timedread = True
+      tm = [0.0]
+      if OpenRTM_aist.stringTo(tm, prop.getProperty("read.timeout")):
+        self._rtimeout.set_time(tm[0])
+
+
+  ##
+  # @if jp
+  # @brief Ǥɲä
+  #
+  # ᤷѤݻɤ߽ФѤߤǤϡХåեζ̤ޤ
+  # ¤롣_cond ֤ǸƤӽФȡ
+  #
+  # @else
+  # @brief Append an element
+  #
+  # The elements already read and kept for rewinding are limited to
+  # the free space of the buffer.  _cond must be held by the caller.
+  #
+  # @endif
+  def __append(self, value):
+    self._data.append(value)
+    while self._done and len(self._done) > self._length - len(self._data):
+      self._done.popleft()
+
+
+  ##
+  # @if jp
+  # @brief 郎ޤԤ
+  #
+  #  cond() ˤʤ뤫ॢȤޤԤġ_cond 
+  # ֤ǸƤӽФȡ
+  #
+  # @param cond 
+  # @param timeout ॢȻ [sec]
+  # @return true: Ω, false: ॢ
+  #
+  # @else
+  # @brief Wait until the condition is satisfied
+  #
+  # This operation waits until cond() becomes true or timeout.  _cond
+  # must be held by the caller.
+  #
+  # @param cond condition
+  # @param timeout timeout [sec]
+  # @return true: satisfied, false: timeout
+  #
+  # @endif
+  def __wait(self, cond, timeout):
+    end_ = time.time() + timeout
+    self._waiters += 1
+    try:
+      while not cond():
+        remain_ = end_ - time.time()
+        if remain_ <= 0:
+          return False
+        self._cond.wait(remain_)
+      return True
+    finally:
+      self._waiters -= 1
+
+
+  ##
+  # @if jp
+  # @brief ԵΥåɤ򵯤
+  #
+  # ԵΥåɤ̵ϲ⤷ʤ_cond ֤
+  # ƤӽФȡ
+  #
+  # @else
+  # @brief Wake up the waiting threads
+  #
+  # Nothing is done if there are no waiting threads.  _cond must be
+  # held by the caller.
+  #
+  # @endif
+  def __notify(self):
+    if self._waiters > 0:
+      self._cond.notifyAll()
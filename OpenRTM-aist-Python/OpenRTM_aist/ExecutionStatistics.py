@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file ExecutionStatistics.py
+# @brief Execution time statistics of a component on an ExecutionContext
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import bisect
+import threading
+import math
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class ExecutionStatistics
+# @brief ¹Իץ饹
+#
+# ExecutionContext 1ĤΥݡͥȤ¹ԤΤˤä֤
+# 硢ǾʿѡɸкҥȥࡢӼۤ
+# Ͽ롣TimeMeasure ȰۤʤꡢϿݻ༡Ūפ򹹿롣
+#
+# @since 1.0.0
+#
+# @else
+# @class ExecutionStatistics
+# @brief Execution time statistics class
+#
+# Records the maximum, minimum, mean, standard deviation, histogram
+# and the number of period overruns of the time an ExecutionContext
+# takes to execute one component.  Unlike TimeMeasure, the statistics
+# are updated incrementally without keeping the records.
+#
+# @since 1.0.0
+#
+# @endif
+class ExecutionStatistics:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief ҥȥγƶ֤ξ [usec]
+  # @else
+  # @brief Upper bounds of the histogram bins [usec]
+  # @endif
+  HISTOGRAM_BOUNDS = [10, 20, 50, 100, 200, 500, 1000, 2000,
+                      5000, 10000, 20000, 50000, 100000]
+
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    self._mutex = threading.Lock()
+    self._bounds = [b / 1000000.0 for b in self.HISTOGRAM_BOUNDS]
+    self.reset()
+    return
+
+
+  ##
+  # @if jp
+  # @brief פꥻåȤ
+  # @else
+  # @brief Reset the statistics
+  # @endif
+  def reset(self):
+    self._mutex.acquire()
+    self._count = 0
+    self._overrun = 0
+    self._max = 0.0
+    self._min = 0.0
+    self._mean = 0.0
+    self._m2 = 0.0
+    self._histogram = [0] * (len(self._bounds) + 1)
+    self._mutex.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ի֤Ͽ
+  #
+  # ¹Ի֤ۤϥСȤƿ롣
+  #
+  # @param self
+  # @param exec_time ¹Ի [sec]
+  # @param period  [sec]0 ξϥСʤ
+  #
+  # @else
+  # @brief Record an execution time
+  #
+  # An execution time longer than the period is counted as an overrun.
+  #
+  # @param self
+  # @param exec_time Execution time [sec]
+  # @param period Period [sec]. Overruns are not counted if 0.
+  #
+  # @endif
+  def update(self, exec_time, period=0.0):
+    bin_ = bisect.bisect_left(self._bounds, exec_time)
+
+    self._mutex.acquire()
+    self._count += 1
+    if self._count == 1 or exec_time > self._max:
+      self._max = exec_time
+    if self._count == 1 or exec_time < self._min:
+      self._min = exec_time
+    delta = exec_time - self._mean
+    self._mean += delta / self._count
+    self._m2 += delta * (exec_time - self._mean)
+    self._histogram[bin_] += 1
+    if period > 0.0 and exec_time > period:
+      self._overrun += 1
+    self._mutex.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief Ͽ
+  # @else
+  # @brief Get the number of records
+  # @endif
+  def count(self):
+    return self._count
+
+
+  ##
+  # @if jp
+  # @brief Сβ
+  # @else
+  # @brief Get the number of overruns
+  # @endif
+  def overrun(self):
+    return self._overrun
+
+
+  ##
+  # @if jp
+  # @brief ͤ
+  #
+  # @param self
+  #
+  # @return 硢Ǿʿѡɸк [sec]  TimeMeasure.Statistics
+  #
+  # @else
+  # @brief Get the statistics
+  #
+  # @param self
+  #
+  # @return TimeMeasure.Statistics holding the maximum, minimum, mean
+  #         and standard deviation [sec]
+  #
+  # @endif
+  def getStatistics(self):
+    self._mutex.acquire()
+    stat = OpenRTM_aist.TimeMeasure.Statistics()
+    if self._count > 0:
+      stat._max_interval  = self._max
+      stat._min_interval  = self._min
+      stat._mean_interval = self._mean
+      stat._std_deviation = math.sqrt(self._m2 / self._count)
+    self._mutex.release()
+    return stat
+
+
+  ##
+  # @if jp
+  # @brief ҥȥ
+  #
+  # @param self
+  #
+  # @return (֤ξ [usec], ) ΥꥹȡǸζ֤ξ¤ None
+  #
+  # @else
+  # @brief Get the histogram
+  #
+  # @param self
+  #
+  # @return List of (upper bound of the bin [usec], count).  The upper
+  #         bound of the last bin is None.
+  #
+  # @endif
+  def histogram(self):
+    self._mutex.acquire()
+    hist = zip(self.HISTOGRAM_BOUNDS + [None], self._histogram)
+    self._mutex.release()
+    return hist
+
+
+  ##
+  # @if jp
+  # @brief פץѥƥ˽񤭽Ф
+  #
+  # count, overrun, max, min, mean, stddev [sec] ȡ
+  # histogram.<֤ξ [usec]> (Ǹζ֤ histogram.inf) ꤹ롣
+  #
+  # @param self
+  # @param prop 񤭽ФΥץѥƥ
+  #
+  # @else
+  # @brief Write the statistics to properties
+  #
+  # Sets count, overrun, max, min, mean, stddev [sec] and
+  # histogram.<upper bound of the bin [usec]> (histogram.inf for the
+  # last bin).
+  #
+  # @param self
+  # @param prop Properties to be written
+  #
+  # @endif
+  def toProperties(self, prop):
+    stat = self.getStatistics()
+    prop.setProperty("count", str(self._count))
+    prop.setProperty("overrun", str(self._overrun))
+    prop.setProperty("max", str(stat._max_interval))
+    prop.setProperty("min", str(stat._min_interval))
+    prop.setProperty("mean", str(stat._mean_interval))
+    prop.setProperty("stddev", str(stat._std_deviation))
+    for bound, count in self.histogram():
+      if bound is None:
+        bound = "inf"
+      prop.setProperty("histogram." + str(bound), str(count))
+    return
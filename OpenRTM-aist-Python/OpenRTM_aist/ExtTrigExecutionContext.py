@@ -32,10 +32,41 @@ import OpenRTM_aist
 # ExecutionContext饹
 # Υ᥽åɸƤӤˤäƻ֤򣱼ŤĿʤ뤳ȤǤ롣
 #
+# ʲΥץѥƥɤ߹ࡣrtc.conf Ǥ exec_cxt.exttrig. ʲ
+# ꤹ롣
+#
+# - tick_mode: tick() Ȥư
+#     sleep: 1¹Ԥ뤴Ȥ˼¹Լʬ sleep  (ǥե)
+#     immediate: sleep ³Ƽ¹Ԥ롣
+#   sleep ξ硢¹ sleep ˸ƤФ줿 tick() 1ˤޤȤ롣
+#   immediate ξޤ sync_tick  YES ξϡtick() 1ˤĤ
+#   1¹Ԥ¹˸ƤФ줿 tick() Ͻ˼¹Ԥ롣
+# - sync_tick: YES ξ硢tick() Ϥμμ¹Ԥޤʤ
+#     ǥեȤ NO
+#
 # @since 0.4.0
 #
 # @else
 # @class ExtTrigExecutionContext
+# @brief ExecutionContext class that enables one step execution
+#
+# ExecutionContext class that can execute every one cycle for Periodic
+# Sampled Data Processing.  Time can be advanced by one cycle at a time
+# by external method calls.
+#
+# The following properties are read.  In rtc.conf they are given under
+# exec_cxt.exttrig.
+#
+# - tick_mode: What is done for each tick().
+#     sleep: Sleep for the execution period after each cycle (default).
+#     immediate: Execute cycles back to back without sleeping.
+#   In sleep mode, tick() calls made during execution or sleep are
+#   merged into one cycle.  In immediate mode, or if sync_tick is YES,
+#   exactly one cycle is executed per tick(), and tick() calls made
+#   during execution are executed in order.
+# - sync_tick: If YES, tick() does not return until the cycle has been
+#     executed.  The default is NO.
+#
 # @endif
 class ExtTrigExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
   """
@@ -57,24 +88,80 @@ class ExtTrigExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
     OpenRTM_aist.PeriodicExecutionContext.__init__(self)
     self._worker = self.Worker()
     self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.exttrig_ec")
+    self._immediate = False
+    self._sync = False
+    self.setTickMode(OpenRTM_aist.Manager.instance().getConfig().getNode("exec_cxt.exttrig"))
+
+
+  ##
+  # @if jp
+  # @brief tick() ư
+  #
+  # tick_mode  sync_tick ץѥƥɤ߹ࡣ
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the behavior of tick()
+  #
+  # Reads the tick_mode and sync_tick properties.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  #
+  # void setTickMode(coil::Properties& props);
+  def setTickMode(self, props):
+    self._rtcout.RTC_TRACE("setTickMode()")
+
+    mode = OpenRTM_aist.normalize([props.getProperty("tick_mode", "sleep")])
+    if mode in ("sleep", "immediate"):
+      self._immediate = (mode == "immediate")
+    else:
+      self._rtcout.RTC_ERROR("invalid tick_mode value: %s", mode)
+      self._immediate = False
+
+    self._sync = OpenRTM_aist.toBool(props.getProperty("sync_tick"),
+                                     "YES", "NO", False)
+    self._rtcout.RTC_DEBUG("tick_mode: %s, sync_tick: %s",
+                           (mode, self._sync))
+    return
 
   ##
   # @if jp
   # @brief 򣱥ƥå׿ʤ
   #
   # ExecutionContextν򣱼ʬʤ롣
+  # sync_tick  YES ξϡμμ¹ԤޤԤġ
   #
   # @param self
   #
   # @else
+  # @brief Move forward one step of ExecutionContext
+  #
+  # Advances the processing of ExecutionContext by one cycle.
+  # If sync_tick is YES, waits until the cycle has been executed.
+  #
+  # @param self
   #
   # @endif
   def tick(self):
     self._rtcout.RTC_TRACE("tick()")
     if not self._worker._cond.acquire():
       return
-    self._worker._called = True
+    self._worker._called += 1
     self._worker._cond.notify()
+
+    if self._sync:
+      # the cycle being executed now was requested before this call
+      target = self._worker._done + self._worker._called
+      if self._worker._executing:
+        target += 1
+      while self._worker._done < target and self._running:
+        self._worker._cond.wait()
+
     self._worker._cond.release()
     return
 
@@ -84,32 +171,54 @@ class ExtTrigExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
   # 
   # ExecutionContext  attach Ƥ Component νƤӽФ
   #  Component νƤӽФ塢θƽФȯޤǵٻߤ롣
+  # tick_mode  sleep ξϡ˼¹Լʬ sleep 롣
+  # θƤӽФ sleep δ֤ϥåݻʤᡢtick() 
+  # ֥åʤ
   # 
   # @param self
   # 
   # @else
+  # @brief Invoke the processing of each component
+  #
+  # Invokes the processing of each component attached to the
+  # ExecutionContext, and then waits for the next call.  If tick_mode
+  # is sleep, it also sleeps for the execution period.  The lock is not
+  # held while invoking the components or sleeping, so tick() is not
+  # blocked.
   # 
   # @endif
   # 
   def svc(self):
     self._rtcout.RTC_TRACE("svc()")
-    flag = True
 
-    while flag:
-      flag = self._running
-      sec_ = float(self._usec)/1000000.0
+    while self._running:
       self._worker._cond.acquire()
       while not self._worker._called and self._running:
         self._worker._cond.wait()
-      if self._worker._called:
-        self._worker._called = False
-        for comp in self._comps:
-          comp._sm.worker()
-        while not self._running:
-          time.sleep(sec_)
-        time.sleep(sec_)
+      if not self._worker._called:
+        self._worker._cond.release()
+        break
+      if self._immediate or self._sync:
+        self._worker._called -= 1
+      else:
+        # ticks made during the cycle or the sleep are merged
+        self._worker._called = 0
+      self._worker._executing = True
       self._worker._cond.release()
 
+      self.invokeWorker()
+
+      self._worker._cond.acquire()
+      self._worker._executing = False
+      self._worker._done += 1
+      self._worker._cond.notifyAll()
+      self._worker._cond.release()
+
+      if not self._immediate:
+        time.sleep(float(self._usec)/1000000.0)
+
+    return 0
+
   ##
   # @if jp
   # @class Worker
@@ -140,7 +249,12 @@ class ExtTrigExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
     def __init__(self):
       self._mutex = threading.RLock()
       self._cond = threading.Condition(self._mutex)
-      self._called = False
+      # number of requested cycles not started yet, which are merged
+      # into one in the sleep tick_mode without sync_tick
+      self._called = 0
+      # number of executed cycles
+      self._done = 0
+      self._executing = False
 
 
 
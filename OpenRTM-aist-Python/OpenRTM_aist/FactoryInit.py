@@ -20,9 +20,11 @@ import OpenRTM_aist
 def FactoryInit():
     # Buffers
     OpenRTM_aist.CdrRingBufferInit()
+    OpenRTM_aist.CdrDequeBufferInit()
 
     # Threads
     OpenRTM_aist.DefaultPeriodicTaskInit()
+    OpenRTM_aist.PooledPeriodicTaskInit()
 
     # Publishers
     OpenRTM_aist.PublisherFlushInit()
@@ -32,6 +34,13 @@ def FactoryInit():
     # Providers/Consumer
     OpenRTM_aist.InPortCorbaCdrProviderInit()
     OpenRTM_aist.InPortCorbaCdrConsumerInit()
+    OpenRTM_aist.InPortCorbaCdrBatchProviderInit()
+    OpenRTM_aist.InPortCorbaCdrBatchConsumerInit()
+    OpenRTM_aist.InPortSharedMemoryProviderInit()
+    OpenRTM_aist.InPortSharedMemoryConsumerInit()
     OpenRTM_aist.OutPortCorbaCdrConsumerInit()
     OpenRTM_aist.OutPortCorbaCdrProviderInit()
     
+    # ID generators
+    OpenRTM_aist.IdGeneratorInit()
+
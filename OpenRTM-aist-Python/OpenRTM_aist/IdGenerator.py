@@ -0,0 +1,469 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+
+##
+# @file IdGenerator.py
+# @brief ID generators for connectors and components
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import time
+import random
+import binascii
+import threading
+import OpenRTM_aist
+
+
+# 100-ns intervals between the UUID epoch 1582-10-15 and the Unix epoch
+UUID_EPOCH_OFFSET = 0x01b21dd213814000L
+
+
+##
+# @if jp
+# @brief ΡID
+#
+# 48ӥåȤΥΡID֤Linux Ǥ /sys/class/net ͥåȥ
+# 󥿡եΥϡɥɥ쥹ɤࡣޥɤϵưʤ
+# Ǥʤ RFC 4122 4.5 ˽ޥ㥹ȥӥåȤΩƤ
+# Ȥͤϥץǥå夵롣
+#
+# @return ΡID
+#
+# @else
+# @brief Get the node ID
+#
+# Returns the 48-bit node ID.  On Linux the hardware address of a
+# network interface is read from /sys/class/net.  No external command
+# is launched.  If no address is available, a random number with the
+# multicast bit set is used as RFC 4122 4.5 suggests.  The value is
+# cached in the process.
+#
+# @return Node ID
+#
+# @endif
+#
+def getNodeId():
+  global nodeid
+
+  if nodeid is None:
+    guard = OpenRTM_aist.ScopedLock(idgenerator_mutex)
+    if nodeid is None:
+      nodeid = readNodeId()
+      if not nodeid:
+        nodeid = random.randrange(1 << 48L) | 0x010000000000L
+
+  return nodeid
+
+
+def readNodeId(path="/sys/class/net"):
+  try:
+    names = os.listdir(path)
+  except:
+    return None
+
+  names.sort()
+  for name in names:
+    if name == "lo":
+      continue
+    try:
+      f = open(os.path.join(path, name, "address"))
+      try:
+        addr = f.read().strip().replace(":", "")
+      finally:
+        f.close()
+    except:
+      continue
+    if len(addr) != 12:
+      continue
+    try:
+      node = int(addr, 16)
+    except ValueError:
+      continue
+    if node:
+      return node
+
+  return None
+
+
+nodeid = None
+
+
+##
+# @if jp
+# @class IdGenerator
+# @brief ID쥯饹
+#
+# ͥ䥳ݡͥȤ ID 롣generateList() ʣ ID
+# ޤȤǤåμ1ǺѤࡣμ
+# manager.id_generator.type ǻꤷIdGeneratorFactory 롣
+#
+# @since 1.0.0
+#
+# @else
+# @class IdGenerator
+# @brief ID generator base class
+#
+# Generates IDs of connectors and components.  generateList() generates
+# several IDs at a time with one lock acquisition.  The type of the
+# generator is given by manager.id_generator.type, and the generator is
+# created by IdGeneratorFactory.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class IdGenerator:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self):
+    self._mutex = threading.Lock()
+    self._pid   = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ID 1
+  #
+  # @return ID ʸ
+  #
+  # @else
+  # @brief Generate an ID
+  #
+  # @return ID string
+  #
+  # @endif
+  #
+  def generate(self):
+    ids = self.generateList(1)
+    if not ids:
+      return ""
+    return ids[0]
+
+
+  ##
+  # @if jp
+  # @brief ID ʣ
+  #
+  # @param n 
+  # @return ID ʸΥꥹ
+  #
+  # @else
+  # @brief Generate IDs
+  #
+  # @param n Number of IDs
+  # @return List of ID strings
+  #
+  # @endif
+  #
+  def generateList(self, n):
+    self._mutex.acquire()
+    try:
+      # fork() copies the state, so the child reinitializes it
+      pid = os.getpid()
+      if pid != self._pid:
+        self._pid = pid
+        self.reset()
+      return self.create(n)
+    finally:
+      self._mutex.release()
+
+
+  ##
+  # @if jp
+  # @brief ֤
+  #
+  # ǽ fork() ˡå֤ǸƤФ롣
+  #
+  # @else
+  # @brief Initialize the state
+  #
+  # Called at the first generation and after fork(), with the lock
+  # acquired.
+  #
+  # @endif
+  #
+  def reset(self):
+    pass
+
+
+  ##
+  # @if jp
+  # @brief ID 
+  #
+  # å֤ǸƤФ롣֥饹Ǽ롣
+  # 쥯饹Ǥ϶ΥꥹȤ֤
+  #
+  # @param n 
+  # @return ID ʸΥꥹ
+  #
+  # @else
+  # @brief Create IDs
+  #
+  # Called with the lock acquired.  Implemented by subclasses.  The
+  # base class returns an empty list.
+  #
+  # @param n Number of IDs
+  # @return List of ID strings
+  #
+  # @endif
+  #
+  def create(self, n):
+    return []
+
+
+
+##
+# @if jp
+# @class Uuid1IdGenerator
+# @brief UUID С1  ID 
+#
+# å夷ΡIDȻ狼 RFC 4122 ΥС1 UUID 롣
+# 郎ʤǤʤХॹפ1Ŀʤ뤿ᡢƱץ
+# ID ʣʤå󥹤ϽǷ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class Uuid1IdGenerator
+# @brief ID generator of version 1 UUIDs
+#
+# Generates RFC 4122 version 1 UUIDs from the cached node ID and the
+# time.  The timestamp is incremented when the time has not advanced,
+# so that the IDs are unique in the process.  The clock sequence is
+# chosen randomly at initialization.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class Uuid1IdGenerator(IdGenerator):
+  """
+  """
+
+  def __init__(self):
+    IdGenerator.__init__(self)
+    self._last   = 0
+    self._suffix = ""
+    return
+
+
+  def reset(self):
+    clock_seq = random.randrange(1 << 14L)
+    self._suffix = "-%02x%02x-%012x" % (((clock_seq >> 8) & 0x3f) | 0x80,
+                                        clock_seq & 0xff,
+                                        getNodeId())
+    return
+
+
+  def create(self, n):
+    timestamp = long(time.time() * 10000000) + UUID_EPOCH_OFFSET
+    if timestamp <= self._last:
+      timestamp = self._last + 1
+    self._last = timestamp + n - 1
+
+    ret = []
+    suffix = self._suffix
+    for ts in xrange(timestamp, timestamp + n):
+      ret.append("%08x-%04x-%04x%s" % (ts & 0xffffffffL,
+                                       (ts >> 32) & 0xffff,
+                                       ((ts >> 48) & 0x0fff) | 0x1000,
+                                       suffix))
+    return ret
+
+
+
+##
+# @if jp
+# @class Uuid4IdGenerator
+# @brief UUID С4  ID 
+#
+# os.urandom()  RFC 4122 ΥС4 UUID 롣
+# ʣޤȤɤࡣ
+#
+# @since 1.0.0
+#
+# @else
+# @class Uuid4IdGenerator
+# @brief ID generator of version 4 UUIDs
+#
+# Generates RFC 4122 version 4 UUIDs from random bytes of os.urandom().
+# The random bytes for several IDs are read at a time.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class Uuid4IdGenerator(IdGenerator):
+  """
+  """
+
+  def create(self, n):
+    try:
+      data = binascii.hexlify(os.urandom(16 * n))
+    except NotImplementedError:
+      data = "%0*x" % (32 * n, random.getrandbits(128 * n))
+
+    ret = []
+    for i in xrange(0, 32 * n, 32):
+      h = data[i:i + 32]
+      ret.append("%s-%s-4%s-%s%s-%s" % (h[0:8], h[8:12], h[13:16],
+                                         "89ab"[int(h[16], 16) & 3],
+                                         h[17:20], h[20:32]))
+    return ret
+
+
+
+##
+# @if jp
+# @class CounterIdGenerator
+# @brief  ID 
+#
+# ΡIDץIDνȥ󥿤Ϣ뤷 ID 
+# 롣UUID ηǤϤʤǤ㥳Ȥ˰դ ID Ǥ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class CounterIdGenerator
+# @brief ID generator with a counter
+#
+# Generates IDs which consist of the node ID, the process ID, the time
+# the generator was initialized and a counter.  They are not UUIDs, but
+# are unique and the cheapest to generate.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class CounterIdGenerator(IdGenerator):
+  """
+  """
+
+  def __init__(self):
+    IdGenerator.__init__(self)
+    self._prefix = ""
+    self._count  = 0
+    return
+
+
+  def reset(self):
+    self._prefix = "%012x-%x-%x-" % (getNodeId(), os.getpid(),
+                                     long(time.time() * 1000000))
+    self._count = 0
+    return
+
+
+  def create(self, n):
+    count = self._count
+    self._count += n
+    prefix = self._prefix
+    return [prefix + "%x" % i for i in xrange(count, count + n)]
+
+
+
+##
+# @if jp
+# @class IdGeneratorFactory
+# @brief IdGenerator Υեȥ
+# @else
+# @class IdGeneratorFactory
+# @brief Factory of IdGenerator
+# @endif
+#
+class IdGeneratorFactory(OpenRTM_aist.Factory):
+  def __init__(self):
+    OpenRTM_aist.Factory.__init__(self)
+    pass
+
+
+  def instance():
+    global idgeneratorfactory
+
+    if idgeneratorfactory is None:
+      idgeneratorfactory = IdGeneratorFactory()
+
+    return idgeneratorfactory
+
+  instance = staticmethod(instance)
+
+
+idgeneratorfactory = None
+
+
+##
+# @if jp
+# @brief ץǶͭ ID 
+#
+# ǽθƤӽФ manager.id_generator.type μ롣
+# ʼξ uuid1 Ȥ
+#
+# @return IdGenerator Υ󥹥
+#
+# @else
+# @brief Get the ID generator shared in the process
+#
+# The first call creates the generator of the type given by
+# manager.id_generator.type.  uuid1 is used for an unknown type.
+#
+# @return Instance of IdGenerator
+#
+# @endif
+#
+def idGenerator():
+  global idgenerator
+
+  if idgenerator is None:
+    guard = OpenRTM_aist.ScopedLock(idgenerator_mutex)
+    if idgenerator is None:
+      conf = OpenRTM_aist.Manager.instance().getConfig()
+      gen_type = conf.getProperty("manager.id_generator.type", "uuid1")
+      factory = IdGeneratorFactory.instance()
+      gen = None
+      if factory.hasFactory(gen_type):
+        gen = factory.createObject(gen_type)
+      if gen is None:
+        gen = Uuid1IdGenerator()
+      idgenerator = gen
+
+  return idgenerator
+
+
+idgenerator = None
+idgenerator_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @brief ID 1
+# @else
+# @brief Generate an ID
+# @endif
+#
+def generateId():
+  return idGenerator().generate()
+
+
+def IdGeneratorInit():
+  factory = IdGeneratorFactory.instance()
+  factory.addFactory("uuid1", OpenRTM_aist.Uuid1IdGenerator, OpenRTM_aist.Delete)
+  factory.addFactory("uuid4", OpenRTM_aist.Uuid4IdGenerator, OpenRTM_aist.Delete)
+  factory.addFactory("counter", OpenRTM_aist.CounterIdGenerator, OpenRTM_aist.Delete)
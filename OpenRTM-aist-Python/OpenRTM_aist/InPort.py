@@ -154,6 +154,52 @@ class InPort(OpenRTM_aist.InPortBase):
     self._value          = value
     self._OnRead         = None
     self._OnReadConvert  = None
+    self._copyPolicy     = "deep"
+
+
+  ##
+  # @if jp
+  # @brief ץѥƥν
+  #
+  # InPortBase.init() ƤӽФ塢ʲΥץѥƥɤ߹ࡣ
+  #
+  # - read.copy_policy: read() ͥɤ߽Ф˥Хɤ
+  #     ѿ򥳥ԡˡ
+  #     deep (copy.deepcopy), shallow (copy.copy), none (ԡʤ)
+  #     ǥեȤ deepnone Ǥɤ߽Ф줿ǡϥХåե
+  #     ֥ȤΤΤȤʤ롣
+  #
+  # @param prop ݡȤΥץѥƥ
+  #
+  # @else
+  # @brief Initializing properties
+  #
+  # After calling InPortBase.init(), the following property is read.
+  #
+  # - read.copy_policy: How read() copies the bound variable before
+  #     reading from the connector.
+  #     deep (copy.deepcopy), shallow (copy.copy), none (no copy)
+  #     The default is deep.  With none, the read data is the object in
+  #     the buffer itself.
+  #
+  # @param prop port properties
+  #
+  # @endif
+  #
+  # void init(coil::Properties& prop);
+  def init(self, prop):
+    OpenRTM_aist.InPortBase.init(self, prop)
+
+    policy = OpenRTM_aist.normalize([self._properties.getProperty("read.copy_policy",
+                                                                  "deep")])
+    if policy in ("deep", "shallow", "none"):
+      self._copyPolicy = policy
+    else:
+      self._rtcout.RTC_ERROR("invalid read.copy_policy value: %s", policy)
+      self._copyPolicy = "deep"
+
+    self._rtcout.RTC_DEBUG("read.copy_policy: %s", self._copyPolicy)
+    return
 
 
   ##
@@ -334,7 +380,12 @@ class InPort(OpenRTM_aist.InPortBase):
       self._rtcout.RTC_DEBUG("no connectors")
       return self._value
 
-    _val = copy.deepcopy(self._value)
+    if self._copyPolicy == "deep":
+      _val = copy.deepcopy(self._value)
+    elif self._copyPolicy == "shallow":
+      _val = copy.copy(self._value)
+    else:
+      _val = self._value
     cdr = [_val]
     ret = self._connectors[0].read(cdr)
 
@@ -361,6 +412,110 @@ class InPort(OpenRTM_aist.InPortBase):
     return self._value
 
 
+  ##
+  # @if jp
+  #
+  # @brief DataPort ʣͤɤ߽Ф
+  #
+  # InPort˽񤭹ޤ줿ǡ n ĤޤȤɤߤn 
+  # ϥХåեɤ߽Фǽʥǡ򤹤٤ɤ߽ФХåե
+  # Υåϰ٤롣
+  #
+  # - OnRead: ɤ߽Ф˰٤ƤФ롣
+  #
+  # - OnReadConvert: ɤߤƥǡȤƸƤӽФ졢
+  #       ֤ꥹȤǤȤʤ롣
+  #
+  # ɤ߽Ф硢Хɤ줿ѿϺǸΥǡǹ
+  # 롣
+  #
+  # @param n ɤ߽ФΥǡ (default -1: ٤)
+  #
+  # @return ɤ߽ФǡΥꥹ (ǡ̵϶Υꥹ)
+  #
+  # @else
+  #
+  # @brief Readout a number of values from DataPort
+  #
+  # Readout up to n data written into the InPort at once.  If n is
+  # negative, all the readable data in the buffer are read.  The lock
+  # of the buffer is taken only once.
+  #
+  # - OnRead: invoked once before reading.
+  #
+  # - OnReadConvert: invoked with each read data, and the return
+  #       values become the elements of the returned list.
+  #
+  # On success, the bound variable is updated with the last data.
+  #
+  # @param n The maximum number of data to read (default -1: all)
+  #
+  # @return The list of read data (empty list if there is no data)
+  #
+  # @endif
+  #
+  #  std::vector<DataType> readN(long int n = -1)
+  def readN(self, n = -1):
+    self._rtcout.RTC_TRACE("readN(%d)", n)
+
+    if self._OnRead is not None:
+      self._OnRead()
+      self._rtcout.RTC_TRACE("OnRead called")
+
+    if len(self._connectors) == 0:
+      self._rtcout.RTC_DEBUG("no connectors")
+      return []
+
+    data = [self._value]
+    ret = self._connectors[0].readN(data, n)
+
+    if ret == OpenRTM_aist.DataPortStatus.PORT_OK:
+      self._rtcout.RTC_DEBUG("%d data read succeeded", len(data))
+
+      if self._OnReadConvert is not None:
+        data = [self._OnReadConvert(d) for d in data]
+        self._rtcout.RTC_DEBUG("OnReadConvert called")
+
+      if data:
+        self._value = data[-1]
+      return data
+
+    elif ret == OpenRTM_aist.DataPortStatus.BUFFER_EMPTY:
+      self._rtcout.RTC_WARN("buffer empty")
+      return []
+
+    elif ret == OpenRTM_aist.DataPortStatus.BUFFER_TIMEOUT:
+      self._rtcout.RTC_WARN("buffer read timeout")
+      return []
+
+    self._rtcout.RTC_ERROR("unknown retern value from buffer.readN()")
+    return []
+
+
+  ##
+  # @if jp
+  #
+  # @brief DataPort 餹٤Ƥͤɤ߽Ф
+  #
+  # Хåեɤ߽Фǽʥǡ򤹤٤ɤ߽ФreadN(-1) Ʊ
+  #
+  # @return ɤ߽ФǡΥꥹ
+  #
+  # @else
+  #
+  # @brief Readout all the values from DataPort
+  #
+  # Readout all the readable data in the buffer.  Same as readN(-1).
+  #
+  # @return The list of read data
+  #
+  # @endif
+  #
+  #  std::vector<DataType> readAll()
+  def readAll(self):
+    return self.readN(-1)
+
+
   ##
   # @if jp
   #
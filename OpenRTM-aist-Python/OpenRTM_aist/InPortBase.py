@@ -809,8 +809,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
     # prop: [port.outport].
     prop = copy.deepcopy(self._properties)
 
-    conn_prop = OpenRTM_aist.Properties()
-    OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
+    conn_prop = self.getPropertiesView(cprof).toProperties()
     prop.mergeProperties(conn_prop.getNode("dataport")) # marge ConnectorProfile
 
     # marge ConnectorProfile for buffer property.
@@ -839,6 +838,8 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
       connector = self.createConnector(cprof, prop, provider_=provider)
       if not connector:
         self._rtcout.RTC_ERROR("PushConnector creation failed.")
+        provider.exit()
+        OpenRTM_aist.InPortProviderFactory.instance().deleteObject(provider)
         return RTC.RTC_ERROR
 
       connector.setDataType(self._value)
@@ -888,8 +889,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
 
     # prop: [port.outport].
     prop = copy.deepcopy(self._properties)
-    conn_prop = OpenRTM_aist.Properties()
-    OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
+    conn_prop = self.getPropertiesView(cprof).toProperties()
     prop.mergeProperties(conn_prop.getNode("dataport")) # marge ConnectorProfile
     prop.mergeProperties(conn_prop.getNode("dataport.inport")) # marge ConnectorProfile for buffer property.
     
@@ -1110,6 +1110,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
 
       if not provider.publishInterface(cprof.properties):
         self._rtcout.RTC_ERROR("publishing interface information error")
+        provider.exit()
         OpenRTM_aist.InPortProviderFactory.instance().deleteObject(provider)
         return 0
       return provider
@@ -1147,7 +1148,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
       self._rtcout.RTC_DEBUG("consumer created")
       consumer.init(prop.getNode("consumer"))
 
-      if not consumer.subscribeInterface(cprof.properties):
+      if not consumer.subscribeInterface(self.getPropertiesView(cprof)):
         self._rtcout.RTC_ERROR("interface subscription failed.")
         OpenRTM_aist.OutPortConsumerFactory.instance().deleteObject(consumer)
         return 0
@@ -177,6 +177,47 @@ class InPortConnector(OpenRTM_aist.ConnectorBase):
   def read(self, data):
     pass
 
+  ##
+  # @if jp
+  # @brief readN ؿ
+  #
+  #  n ĤΥǡ٤ɤ߽Фdata 򤽤ΥꥹȤ֤롣
+  # n ξɤ߽Фǽʥǡ򤹤٤ɤ߽Ф
+  # ƤӽФ data[0] ϥǡΤҤʷȤѤ礬롣
+  #
+  # @else
+  # @brief readN function
+  #
+  # The function to read up to n data at once and replace data with
+  # the list of them.  If n is negative, all the readable data are
+  # read.  data[0] on call may be used as the template of the data
+  # type.
+  #
+  # @endif
+  #
+  # virtual ReturnCode readN(std::vector<DataType>& data,
+  #                          long int n = -1) = 0;
+  def readN(self, data, n = -1):
+    pass
+
+  ##
+  # @if jp
+  # @brief readAll ؿ
+  #
+  # ɤ߽Фǽʥǡ򤹤٤ɤ߽ФreadN(data, -1) Ʊ
+  #
+  # @else
+  # @brief readAll function
+  #
+  # The function to read all the readable data.  Same as
+  # readN(data, -1).
+  #
+  # @endif
+  #
+  # ReturnCode readAll(std::vector<DataType>& data);
+  def readAll(self, data):
+    return self.readN(data, -1)
+
   # void setConnectorInfo(ConnectorInfo profile);
   def setConnectorInfo(self, profile):
     self._profile = profile
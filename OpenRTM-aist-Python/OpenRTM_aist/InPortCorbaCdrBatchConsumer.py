@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrBatchConsumer.py
+# @brief InPortCorbaCdrBatchConsumer class
+# @date  $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+import OpenRTM_aist
+
+##
+# @if jp
+#
+# @class InPortCorbaCdrBatchConsumer
+#
+# @brief InPortCorbaCdrBatchConsumer 饹
+#
+# 󥿡ե corba_cdr_batch ϥݡȥ󥷥塼ޡ
+# ʣ CDR ǡ packCdrBatch() 1ĤˤޤȤᡢInPortCdr::put() 
+# 1θƤӽФ롣¦ InPortCorbaCdrBatchProvider Ǥ
+# ɬפ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class InPortCorbaCdrBatchConsumer
+#
+# @brief InPortCorbaCdrBatchConsumer class
+#
+# The input port consumer of the corba_cdr_batch interface type.
+# Several CDR data are packed into one by packCdrBatch() and sent by
+# one call of InPortCdr::put().  The peer must be an
+# InPortCorbaCdrBatchProvider.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class InPortCorbaCdrBatchConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.InPortCorbaCdrConsumer.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortCorbaCdrBatchConsumer")
+    return
+
+
+  ##
+  # @if jp
+  # @brief ХåեؤΥǡ
+  #
+  # 1ĤΥǡǿ1ΥХåȤ롣
+  #
+  # @param data оݥǡ
+  #
+  # @else
+  # @brief Write data into the buffer
+  #
+  # Sends one data as a batch of one element.
+  #
+  # @param data The data to be written
+  #
+  # @endif
+  #
+  # virtual ReturnCode put(const cdrMemoryStream& data);
+  def put(self, data):
+    return self.putN([data])
+
+
+  ##
+  # @if jp
+  # @brief ʣΥǡΰ
+  #
+  # Ϳ줿 CDR ǡΥꥹȤ1ĤˤޤȤᡢ1θƤӽФ롣
+  # ͤΤФΤǡ줫Ǥνߤ˼Ԥ
+  # Ϥη̤֤
+  #
+  # @param data оݥǡΥꥹ
+  #
+  # @return ꥿󥳡
+  #
+  # @else
+  # @brief Write several data at once
+  #
+  # The given list of CDR data is packed into one and sent by one call.
+  # The return code is for the whole list and reports the failure of
+  # any element.
+  #
+  # @param data List of the data to be written
+  #
+  # @return Return code
+  #
+  # @endif
+  #
+  def putN(self, data):
+    self._rtcout.RTC_PARANOID("putN(%d)", len(data))
+    try:
+      if self._ptr():
+        return self.convertReturnCode(self._ptr().put(OpenRTM_aist.packCdrBatch(data)))
+      return self.CONNECTION_LOST
+    except:
+      self._rtcout.RTC_ERROR(sys.exc_info()[0])
+      return self.CONNECTION_LOST
+
+    return self.UNKNOWN_ERROR
+
+
+##
+# @if jp
+# @brief ⥸塼ؿ
+#
+# InPortCorbaCdrBatchConsumer ΥեȥϿؿ
+#
+# @else
+# @brief Module initialization
+#
+# This initialization function registers InPortCorbaCdrBatchConsumer's
+# factory.
+#
+# @endif
+#
+def InPortCorbaCdrBatchConsumerInit():
+  factory = OpenRTM_aist.InPortConsumerFactory.instance()
+  factory.addFactory("corba_cdr_batch",
+                     OpenRTM_aist.InPortCorbaCdrBatchConsumer,
+                     OpenRTM_aist.Delete)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrBatchProvider.py
+# @brief InPortCorbaCdrBatchProvider class
+# @date  $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import sys
+import time
+
+import OpenRTM_aist
+import OpenRTM
+
+
+##
+# @if jp
+# @class InPortCorbaCdrBatchProvider
+# @brief InPortCorbaCdrBatchProvider 饹
+#
+# 󥿡ե corba_cdr_batch ϥݡȥץХ
+# InPortCorbaCdrBatchConsumer  packCdrBatch() ǤޤȤ᤿ǡ
+# unpackCdrBatch() ʬ䤷Ǥ InPortCorbaCdrProvider Ʊͤ
+# Хåե˽񤭹ࡣ
+#
+# @since 1.0.0
+#
+# @else
+# @class InPortCorbaCdrBatchProvider
+# @brief InPortCorbaCdrBatchProvider class
+#
+# The input port provider of the corba_cdr_batch interface type.
+# Data packed by packCdrBatch() in InPortCorbaCdrBatchConsumer are split
+# by unpackCdrBatch(), and each element is written into the buffer in
+# the same way as InPortCorbaCdrProvider.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class InPortCorbaCdrBatchProvider(OpenRTM_aist.InPortCorbaCdrProvider):
+
+    ##
+    # @if jp
+    # @brief 󥹥ȥ饯
+    # @else
+    # @brief Constructor
+    # @endif
+    #
+    def __init__(self):
+        OpenRTM_aist.InPortCorbaCdrProvider.__init__(self)
+        self.setInterfaceType("corba_cdr_batch")
+        self._policy = "overwrite"
+        self._timeout = 1.0
+
+
+    ##
+    # @if jp
+    # @brief ꥹʤꤹ
+    #
+    # Хåե write.full_policy  write.timeout 롣
+    #
+    # @else
+    # @brief Set the listeners
+    #
+    # The write.full_policy and write.timeout of the buffer are also
+    # obtained.
+    #
+    # @endif
+    #
+    # void setListener(ConnectorInfo& info,
+    #                  ConnectorListeners* listeners);
+    def setListener(self, info, listeners):
+        OpenRTM_aist.InPortCorbaCdrProvider.setListener(self, info, listeners)
+        policy = OpenRTM_aist.normalize(
+            [info.properties.getProperty("buffer.write.full_policy")])
+        if policy in ("do_nothing", "block"):
+            self._policy = policy
+        else:
+            self._policy = "overwrite"
+
+        timeout = [1.0]
+        if OpenRTM_aist.stringTo(timeout,
+                                 info.properties.getProperty("buffer.write.timeout",
+                                                             "1.0")):
+            self._timeout = timeout[0]
+
+
+    ##
+    # @if jp
+    # @brief Хåե˥ǡ񤭹
+    #
+    # ޤȤ줿ǡʬ䤷Ƭ˥Хåե˽񤭹ࡣ
+    # 񤭤ʤХåեƤǤζʤϡ񤭹ޤ
+    # BUFFER_FULL ֤ᡢ¦ƱǡʣʤǤ롣
+    # write.full_policy  block ξ write.timeout ޤǶԤ
+    # Ԥʤв񤭹ޤ BUFFER_TIMEOUT ֤
+    # ƬǤν񤭹ߤ˼ԤϤη̤֤2ܰʹߤ
+    # ǤμԤǤϤޤǤǤХåեˤ뤿ᡢǤ˴
+    # ³롣ǡηʤ PORT_ERROR ֤
+    #
+    # @param data ޤȤ줿ǡ
+    #
+    # @return ꥿󥳡
+    #
+    # @else
+    # @brief Write data into the buffer
+    #
+    # The packed data are split and written into the buffer in order.
+    # If the buffer does not overwrite and has no space for all the
+    # elements, nothing is written and BUFFER_FULL is returned, so that
+    # the sender can send the same data again without duplicates.  If
+    # write.full_policy is block, the space is waited for up to
+    # write.timeout, and BUFFER_TIMEOUT is returned without writing
+    # anything if it is not available in time.  If the write of the
+    # first element fails, its result is returned.  A failed write of a
+    # later element drops the element and the rest are written, because
+    # the former elements are already in the buffer.  PORT_ERROR is
+    # returned if the data is malformed.
+    #
+    # @param data Packed data
+    #
+    # @return Return code
+    #
+    # @endif
+    #
+    # ::OpenRTM::PortStatus put(const ::OpenRTM::CdrData& data)
+    #  throw (CORBA::SystemException);
+    def put(self, data):
+        try:
+            cdrs = OpenRTM_aist.unpackCdrBatch(data)
+        except ValueError:
+            self._rtcout.RTC_ERROR(sys.exc_info()[1])
+            self.onReceiverError(data)
+            return OpenRTM.PORT_ERROR
+
+        self._rtcout.RTC_PARANOID("received %d frames", len(cdrs))
+        if self._policy != "overwrite" and self._buffer and \
+                not self.waitWritable(len(cdrs)):
+            self._rtcout.RTC_PARANOID("no space for %d frames", len(cdrs))
+            if self._policy == "block":
+                status = OpenRTM_aist.BufferStatus.TIMEOUT
+            else:
+                status = OpenRTM_aist.BufferStatus.BUFFER_FULL
+            for cdr in cdrs:
+                ret = self.convertReturn(status, cdr)
+            return ret
+
+        for i, cdr in enumerate(cdrs):
+            ret = OpenRTM_aist.InPortCorbaCdrProvider.put(self, cdr)
+            if ret != OpenRTM.PORT_OK:
+                if i == 0:
+                    return ret
+                self._rtcout.RTC_WARN("frame %d of %d dropped: %s",
+                                      (i, len(cdrs), ret))
+
+        return OpenRTM.PORT_OK
+
+
+    ##
+    # @if jp
+    # @brief ХåեζԤ
+    #
+    # write.full_policy  block ξ write.timeout ޤԤġ
+    # ХåեĹۤǿζԤʤ
+    #
+    # @param n ǿ
+    #
+    # @return  True
+    #
+    # @else
+    # @brief Wait for the space of the buffer
+    #
+    # Waits up to write.timeout if write.full_policy is block.  The space
+    # more than the length of the buffer is not waited for.
+    #
+    # @param n Number of elements
+    #
+    # @return True if the space is available
+    #
+    # @endif
+    #
+    def waitWritable(self, n):
+        if self._buffer.writable() >= n:
+            return True
+        if self._policy != "block" or n > self._buffer.length():
+            return False
+
+        deadline = time.time() + self._timeout
+        while self._buffer.writable() < n:
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+
+def InPortCorbaCdrBatchProviderInit():
+    factory = OpenRTM_aist.InPortProviderFactory.instance()
+    factory.addFactory("corba_cdr_batch",
+                       OpenRTM_aist.InPortCorbaCdrBatchProvider,
+                       OpenRTM_aist.Delete)
@@ -156,6 +156,30 @@ class InPortProvider(OpenRTM_aist.DataPortStatus):
     self._connector = connector
 
 
+  ##
+  # @if jp
+  # @brief λ
+  #
+  # ³˥ͥ顢³˼Ԥ InPortBase 
+  # ƤФ롣ץХݤ񸻤
+  # ϥ֥饹ǥС饤ɤ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Finalization
+  #
+  # Called by the connector on disconnection, and by InPortBase when
+  # the connection fails.  Subclasses override it to release resources
+  # allocated by the provider.
+  #
+  # @param self
+  #
+  # @endif
+  def exit(self):
+    pass
+
+
 inportproviderfactory = None
 
 
@@ -16,12 +16,18 @@
 #     All rights reserved.
 #
 
+import sys
+import time
+
 from omniORB import *
 from omniORB import any
 
 import OpenRTM_aist
 
 
+_monotonic = getattr(time, "monotonic", time.time)
+
+
 ##
 # @if jp
 # @class InPortPullConnector
@@ -45,6 +51,15 @@ import OpenRTM_aist
 # ƤӽФOutPortPullConnector λĥХåեǡɤ߽
 # InPortPullConnector ΤĥХåե˥ǡ񤭹ࡣ
 #
+# ³ץѥƥ inport.prefetch  YES ξ硢read() ϥǡ֤
+# ˼ OutPortConsumer::get() ƱƤӽФΥåɥס
+# ϤƤ read() ǤϤη̤֤Τ read() 
+# ̾⡼ȸƤӽФԤ˴λ롣ɤߤǡ
+# inport.prefetch.max_age [sec] Ť䡢ɤߤ PORT_OK ʳ
+# ä˴ƱŪ get() ľɤߤδλϺ
+# inport.prefetch.max_age ԤʤƱŪ get() 롣˴ǡ
+# OutPort ¦Ǥɤ߽ФѤߤȤʤ뤿ᡢǿͤɤӤꤷƤ롣
+#
 # @since 1.0.0
 #
 # @else
@@ -72,6 +87,18 @@ import OpenRTM_aist
 # OutPortPullConnector.  Finally data would be written into the
 # InPortPullConnector's buffer.
 #
+# If the connector property inport.prefetch is YES, read() starts the
+# next OutPortConsumer::get() in the asynchronous invocation thread
+# pool after returning data, and the next read() returns its result.
+# read() therefore usually completes without waiting for the remote
+# invocation.  Prefetched data older than inport.prefetch.max_age [sec],
+# or a prefetch that did not end with PORT_OK, is discarded and get()
+# is called again synchronously.  read() waits for a running prefetch
+# for at most inport.prefetch.max_age, and calls get() synchronously if
+# it has not finished.  Discarded data has already been read
+# on the OutPort side, so this mode is intended for reading the latest
+# value.
+#
 # @since 1.0.0
 #
 # @endif
@@ -126,6 +153,12 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
     OpenRTM_aist.InPortConnector.__init__(self, info, buffer)
     self._consumer = consumer
     self._listeners = listeners
+    self._prefetch = OpenRTM_aist.toBool(info.properties.getProperty("inport.prefetch"),
+                                         "YES", "NO", False)
+    max_age = [0.1]
+    OpenRTM_aist.stringTo(max_age, info.properties.getProperty("inport.prefetch.max_age"))
+    self._maxAge = max_age[0]
+    self._fetch = None
     if buffer == 0:
       self._buffer = self.createBuffer(self._profile)
 
@@ -198,7 +231,10 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
       return self.PORT_ERROR
 
     cdr_data = [None]
-    ret = self._consumer.get(cdr_data)
+    if self._prefetch:
+      ret = self.getPrefetched(cdr_data)
+    else:
+      ret = self._consumer.get(cdr_data)
 
     if ret == self.PORT_OK:
       # CDR -> (conversion) -> data
@@ -212,6 +248,126 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
     return ret
 
 
+  ##
+  # @if jp
+  # @brief ʣǡɤ߽Ф
+  #
+  # pull ³ˤϥХå̵ᡢread() ˤ 1 ĤΥǡ
+  # ɤ߽Фdata 򤽤ΥǡʤꥹȤ֤롣
+  # data[0]  read() Ʊͤ˥ǡΤҤʷȤѤ롣
+  #
+  # @else
+  # @brief Reading a number of data
+  #
+  # Since pull type connections have no backlog, one data is read by
+  # read() and data is replaced with the list of only that data.
+  # data[0] is used as the template of the data type as read() does.
+  #
+  # @endif
+  #
+  # virtual ReturnCode readN(std::vector<DataType>& data, long int n = -1);
+  def readN(self, data, n = -1):
+    self._rtcout.RTC_TRACE("InPortPullConnector.readN()")
+    tmp = data[:1]
+    del data[:]
+    if n == 0:
+      return self.PORT_OK
+
+    ret = self.read(tmp)
+    if ret == self.PORT_OK:
+      data.append(tmp[0])
+    return ret
+
+
+  ##
+  # @if jp
+  # @brief ɤߤǡμ
+  #
+  # ɤߤ¹Ǥк inport.prefetch.max_age λԤ
+  # η̤ PORT_OK  inport.prefetch.max_age 꿷Ф
+  # ֤Ǥʤ OutPortConsumer ƱŪ˼롣ɤߤ
+  # λƤʤФΤޤ޼ read() ǻȤλƤм
+  # ɤߤ򳫻Ϥ롣
+  #
+  # @param self
+  # @param data ǡ(CDR)Ǽꥹ
+  #
+  # @return ꥿󥳡
+  #
+  # @else
+  # @brief Getting prefetched data
+  #
+  # Waits for the prefetch for at most inport.prefetch.max_age if it is
+  # running, and returns its result if it is PORT_OK and newer than
+  # inport.prefetch.max_age.  Otherwise the data is got from the
+  # OutPortConsumer synchronously.  A prefetch which has not finished is
+  # kept for the next read(), and the next prefetch is started otherwise.
+  #
+  # @param self
+  # @param data List to store the data (CDR)
+  #
+  # @return Return code
+  #
+  # @endif
+  #
+  def getPrefetched(self, data):
+    fetch = self._fetch
+    ret = None
+    if fetch is not None:
+      if not fetch.wait(self._maxAge):
+        # queued behind other jobs or slow, used by the next read()
+        self._rtcout.RTC_DEBUG("prefetch has not finished.")
+        return self._consumer.get(data)
+
+      self._fetch = None
+      try:
+        ret, cdr, tm = fetch.result()
+      except:
+        self._rtcout.RTC_WARN("prefetch failed: %s", sys.exc_info()[1])
+        ret = None
+
+      if ret != self.PORT_OK:
+        ret = None
+      elif _monotonic() - tm > self._maxAge:
+        self._rtcout.RTC_DEBUG("prefetched data is too old.")
+        ret = None
+      else:
+        data[0] = cdr
+
+    if ret is None:
+      ret = self._consumer.get(data)
+
+    self._fetch = OpenRTM_aist.Async_tInvoker(self, InPortPullConnector.fetch)
+    self._fetch.invoke()
+    return ret
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽
+  #
+  # ƱƤӽФΥåɥסǼ¹Ԥ졢OutPortConsumer 
+  # ǡƥ꥿󥳡ɡǡ֤
+  #
+  # @else
+  # @brief Prefetch processing
+  #
+  # Executed in the asynchronous invocation thread pool.  Gets data from
+  # the OutPortConsumer, and returns the return code, the data and the
+  # time of getting.
+  #
+  # @endif
+  #
+  def fetch(self):
+    consumer = self._consumer
+    if not consumer:
+      return (self.PORT_ERROR, None, _monotonic())
+
+    data = [None]
+    ret = consumer.get(data)
+    return (ret, data[0], _monotonic())
+
+
   ##
   # @if jp
   # @brief ³ؿ
@@ -228,10 +384,17 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
   # virtual ReturnCode disconnect();
   def disconnect(self):
     self._rtcout.RTC_TRACE("disconnect()")
-    # delete consumer
-    if self._consumer:
-      OpenRTM_aist.OutPortConsumerFactory.instance().deleteObject(self._consumer)
+    fetch = self._fetch
+    self._fetch = None
+    consumer = self._consumer
+    # a queued prefetch does nothing without the consumer
     self._consumer = 0
+    if fetch is not None and not fetch.wait(self._maxAge):
+      self._rtcout.RTC_WARN("prefetch has not finished.")
+
+    # delete consumer
+    if consumer:
+      OpenRTM_aist.OutPortConsumerFactory.instance().deleteObject(consumer)
 
     return self.PORT_OK
         
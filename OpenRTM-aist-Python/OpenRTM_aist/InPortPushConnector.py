@@ -18,6 +18,7 @@
 #
 
 
+import sys
 from omniORB import *
 from omniORB import any
 
@@ -45,6 +46,12 @@ import OpenRTM_aist
 # InPortProvider::put() ˥ǡϤ롣񤭹ޤ줿ǡ
 # Connector  Buffer ˥ǡ񤭹ޤ롣
 #
+# ³ץѥƥ inport.decode  lazy ξ硢Buffer ˤ CDR 
+# ޤޥǡ񤭹ޤ졢read() ɤ߽Ф줿ǡΤߤޡ
+# 󥰤롣񤭤ɤ߽Фʤäǡϥޡ
+# 󥰤ʤǥեȤ eager ǡ񤭹߻˥ޡ
+# 󥰤롣
+#
 # @since 1.0.0
 #
 # @else
@@ -69,6 +76,12 @@ import OpenRTM_aist
 # InPortProvider::put() by OutPortConnector.  The data is written
 # into the buffer in the connector.
 #
+# If the connector property inport.decode is lazy, data are written
+# into the buffer as CDR, and only the data read by read() are
+# unmarshaled.  Data overwritten before being read are never
+# unmarshaled.  The default is eager, which unmarshals data when they
+# are written.
+#
 # @since 1.0.0
 #
 # @endif
@@ -121,6 +134,9 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
     OpenRTM_aist.InPortConnector.__init__(self, info, buffer)
     self._provider = provider
     self._listeners = listeners
+    self._typecode = None
+    decode = [info.properties.getProperty("inport.decode", "eager")]
+    self._lazy = (OpenRTM_aist.normalize(decode) == "lazy")
 
     if buffer:
       self._deleteBuffer = True
@@ -217,6 +233,12 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
             
             
     if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      if type(data) == list and type(data[0]) == tuple:
+        try:
+          data[0] = self.unmarshal(data[0][0], data[0][1])
+        except:
+          self._rtcout.RTC_ERROR("unmarshaling data failed: %s", sys.exc_info()[0])
+          return self.PORT_ERROR
       return self.PORT_OK
 
     elif ret == OpenRTM_aist.BufferStatus.BUFFER_EMPTY:
@@ -229,7 +251,68 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
       return self.PRECONDITION_NOT_MET
     
     return self.PORT_ERROR
-        
+
+
+  ##
+  # @if jp
+  # @brief ʣǡɤ߽Ф
+  #
+  # Хåե n ĤΥǡ򡢥ХåեΥå٤
+  # ɤ߽Фn ξɤ߽Фǽʥǡ򤹤٤ɤ߽Ф
+  # ɤ߽Ф硢ͤ PORT_OK Ȥʤꡢdata ɤ߽Ф
+  # ǡΥꥹȤ֤롣
+  #
+  # @param data ɤ߽ФǡΥꥹ
+  # @param n ɤ߽ФΥǡ (default -1: ٤)
+  #
+  # @return PORT_OK              ｪλ
+  #         BUFFER_EMPTY         Хåե϶Ǥ
+  #         PRECONDITION_NOT_MET ʤ
+  #
+  # @else
+  #
+  # @brief Reading a number of data
+  #
+  # This function reads up to n data from the buffer, taking the
+  # lock of the buffer only once.  If n is negative, all the
+  # readable data are read.  If data is read properly, this function
+  # will return PORT_OK and data is replaced with the list of read
+  # data.
+  #
+  # @param data The list of read data
+  # @param n The maximum number of data to read (default -1: all)
+  #
+  # @return PORT_OK              Normal return
+  #         BUFFER_EMPTY         Buffer empty
+  #         PRECONDITION_NOT_MET Preconditin not met
+  #
+  # @endif
+  #
+  # virtual ReturnCode readN(std::vector<DataType>& data, long int n = -1);
+  def readN(self, data, n = -1):
+    self._rtcout.RTC_TRACE("readN()")
+    if not self._buffer:
+      return self.PRECONDITION_NOT_MET
+
+    del data[:]
+    ret = self._buffer.readN(data, n)
+
+    if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      try:
+        for i in range(len(data)):
+          if type(data[i]) == tuple:
+            data[i] = self.unmarshal(data[i][0], data[i][1])
+      except:
+        self._rtcout.RTC_ERROR("unmarshaling data failed: %s", sys.exc_info()[0])
+        del data[:]
+        return self.PORT_ERROR
+      return self.PORT_OK
+
+    elif ret == OpenRTM_aist.BufferStatus.BUFFER_EMPTY:
+      return self.BUFFER_EMPTY
+
+    return self.PORT_ERROR
+
 
   ##
   # @if jp
@@ -255,6 +338,7 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
     self._rtcout.RTC_TRACE("disconnect()")
     # delete consumer
     if self._provider:
+      self._provider.exit()
       cfactory = OpenRTM_aist.InPortProviderFactory.instance()
       cfactory.deleteObject(self._provider)
 
@@ -368,15 +452,44 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
       return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
 
     _data = None
-    # CDR -> (conversion) -> data
-    if self._endian is not None:
-      _data = cdrUnmarshal(any.to_any(self._dataType).typecode(),data,self._endian)
-
-    else:
+    if self._endian is None:
       self._rtcout.RTC_ERROR("unknown endian from connector")
       return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
 
+    # CDR -> (conversion) -> data
+    if self._lazy:
+      # unmarshaled by read()
+      return self._buffer.write((data, self._endian))
+
+    _data = self.unmarshal(data, self._endian)
     return self._buffer.write(_data)
+
+
+  ##
+  # @if jp
+  #
+  # @brief CDR ǡ򥢥ޡ󥰤
+  #
+  # @param cdr CDR ǡ
+  # @param endian ǥ (True: little, False: big)
+  #
+  # @return ޡ󥰤ǡ
+  #
+  # @else
+  #
+  # @brief Unmarshal CDR data
+  #
+  # @param cdr CDR data
+  # @param endian Endian (True: little, False: big)
+  #
+  # @return Unmarshaled data
+  #
+  # @endif
+  #
+  def unmarshal(self, cdr, endian):
+    if self._typecode is None:
+      self._typecode = any.to_any(self._dataType).typecode()
+    return cdrUnmarshal(self._typecode, cdr, endian)
         
     
   ##
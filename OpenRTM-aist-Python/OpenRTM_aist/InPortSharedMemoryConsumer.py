@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortSharedMemoryConsumer.py
+# @brief InPortSharedMemoryConsumer class
+# @date  $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+import os
+import errno
+import OpenRTM_aist
+
+##
+# @if jp
+#
+# @class InPortSharedMemoryConsumer
+#
+# @brief InPortSharedMemoryConsumer 饹
+#
+# 󥿡ե shared_memory ϥݡȥ󥷥塼ޡ
+# InPortSharedMemoryProvider 󥰥ե˥ǡ񤭹ߡ
+# ̾դѥפΤ롣CORBA θƤӽФȼʤᡢƱۥȾ
+# ³ǤΤ߻ѤǤ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class InPortSharedMemoryConsumer
+#
+# @brief InPortSharedMemoryConsumer class
+#
+# The input port consumer of the shared_memory interface type.
+# Data are written into the ring file published by
+# InPortSharedMemoryProvider and notified through the named pipe.
+# Since no CORBA invocation is involved, it can be used only for
+# connections on the same host.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class InPortSharedMemoryConsumer(OpenRTM_aist.InPortConsumer):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortSharedMemoryConsumer")
+    self._properties = None
+    self._ring = None
+    self._fifofd = -1
+    return
+
+
+  ##
+  # @if jp
+  # @brief 
+  #
+  # @param prop 
+  #
+  # @else
+  # @brief Initializing configuration
+  #
+  # @param prop Configuration information
+  #
+  # @endif
+  #
+  # virtual void init(coil::Properties& prop);
+  def init(self, prop):
+    self._properties = prop
+    return
+
+
+  ##
+  # @if jp
+  # @brief ³ؤΥǡ
+  #
+  # ǡ󥰤˽񤭹ߡ̾դѥפΤ롣󥰤˶
+  # ʤ SEND_FULL󥰤礭ʥǡξ PORT_ERROR 
+  # ֤
+  #
+  # @param data ǡ
+  # @return ꥿󥳡
+  #
+  # @else
+  # @brief Send data to the destination port
+  #
+  # Writes data into the ring and notifies through the named pipe.
+  # SEND_FULL is returned if the ring has no space, and PORT_ERROR if
+  # the data is larger than the ring.
+  #
+  # @param data The data to be sent
+  # @return Return code
+  #
+  # @endif
+  #
+  # virtual ReturnCode put(const cdrMemoryStream& data);
+  def put(self, data):
+    self._rtcout.RTC_PARANOID("put()")
+    if self._ring is None:
+      return self.CONNECTION_LOST
+
+    try:
+      if not self._ring.write(data):
+        if len(data) + OpenRTM_aist.SHM_RING_LENGTH.size > self._ring.capacity():
+          self._rtcout.RTC_ERROR("data size %d exceeds the ring size",
+                                 len(data))
+          return self.PORT_ERROR
+        return self.SEND_FULL
+      os.write(self._fifofd, "\0")
+    except OSError:
+      # the reader has not consumed the notifications yet
+      if sys.exc_info()[1].errno == errno.EAGAIN:
+        return self.PORT_OK
+      self._rtcout.RTC_ERROR(sys.exc_info()[1])
+      return self.CONNECTION_LOST
+    except:
+      self._rtcout.RTC_ERROR(sys.exc_info()[0])
+      return self.CONNECTION_LOST
+
+    return self.PORT_OK
+
+
+  ##
+  # @if jp
+  # @brief InterfaceProfile
+  #
+  # @param properties InterfaceProfileץѥƥ
+  #
+  # @else
+  # @brief Publish InterfaceProfile information
+  #
+  # @param properties Properties to get InterfaceProfile information
+  #
+  # @endif
+  #
+  # virtual void publishInterfaceProfile(SDOPackage::NVList& properties);
+  def publishInterfaceProfile(self, properties):
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡΤؤϿ
+  #
+  # ץХ󥰥ե̾դѥפ򳫤
+  # ̤ΥۥȾΥץХʤɤǥե뤬ʤ false ֤
+  #
+  # @param properties Ͽ
+  #
+  # @return Ͽ(Ͽ:trueϿ:false)
+  #
+  # @else
+  # @brief Subscribe to the data sending notification
+  #
+  # Opens the ring file and the named pipe published by the provider.
+  # Returns false if they cannot be opened, e.g. the provider is on
+  # another host.
+  #
+  # @param properties Information for subscription
+  #
+  # @return Subscription result (Successful:true, Failed:false)
+  #
+  # @endif
+  #
+  # virtual bool subscribeInterface(const SDOPackage::NVList& properties);
+  def subscribeInterface(self, properties):
+    self._rtcout.RTC_TRACE("subscribeInterface()")
+    filename = self.findString(properties, "dataport.shared_memory.file")
+    fifo = self.findString(properties, "dataport.shared_memory.fifo")
+    if not filename or not fifo:
+      return False
+
+    self.unsubscribeInterface(properties)
+    try:
+      self._ring = OpenRTM_aist.SharedMemoryRing(filename)
+      self._fifofd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+    except:
+      self._rtcout.RTC_ERROR("opening shared memory failed: %s",
+                             sys.exc_info()[1])
+      self.unsubscribeInterface(properties)
+      return False
+
+    self._rtcout.RTC_DEBUG("shared memory: %s", filename)
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ǡΤϿ
+  #
+  # @param properties Ͽ
+  #
+  # @else
+  # @brief Unsubscribe the data send notification
+  #
+  # @param properties Information for unsubscription
+  #
+  # @endif
+  #
+  # virtual void unsubscribeInterface(const SDOPackage::NVList& properties);
+  def unsubscribeInterface(self, properties):
+    self._rtcout.RTC_TRACE("unsubscribeInterface()")
+    if self._fifofd >= 0:
+      os.close(self._fifofd)
+      self._fifofd = -1
+    if self._ring is not None:
+      self._ring.close()
+      self._ring = None
+    return
+
+
+  def findString(self, properties, name):
+    index = OpenRTM_aist.NVUtil.find_index(properties, name)
+    if index < 0:
+      self._rtcout.RTC_ERROR("%s not found", name)
+      return ""
+    return OpenRTM_aist.NVUtil.toString(properties, name)
+
+
+##
+# @if jp
+# @brief ⥸塼ؿ
+#
+# InPortSharedMemoryConsumer ΥեȥϿؿ
+#
+# @else
+# @brief Module initialization
+#
+# This initialization function registers InPortSharedMemoryConsumer's
+# factory.
+#
+# @endif
+#
+def InPortSharedMemoryConsumerInit():
+  factory = OpenRTM_aist.InPortConsumerFactory.instance()
+  factory.addFactory("shared_memory",
+                     OpenRTM_aist.InPortSharedMemoryConsumer,
+                     OpenRTM_aist.Delete)
@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortSharedMemoryProvider.py
+# @brief InPortSharedMemoryProvider class
+# @date  $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import sys
+import os
+import errno
+import select
+import binascii
+import threading
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class InPortSharedMemoryProvider
+# @brief InPortSharedMemoryProvider 饹
+#
+# 󥿡ե shared_memory ϥݡȥץХ
+# ޥåץɥեΥ (SharedMemoryRing) Ѥ
+# ̾դѥפΥѥ³ץեǸ롣
+# åɤΤԤ󥰤Фǡ
+# InPortCorbaCdrProvider Ʊͤ˥Хåե˽񤭹ࡣ
+# Хåեդξϥǡ󥰤˻ĤƺƻԤ뤿ᡢ
+# 󥰤դˤʤ¦ˤ SEND_FULL ֤롣
+# ƱۥȾ InPortSharedMemoryConsumer ȤΤ³Ǥ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class InPortSharedMemoryProvider
+# @brief InPortSharedMemoryProvider class
+#
+# The input port provider of the shared_memory interface type.
+# It creates a ring on a memory mapped file (SharedMemoryRing) and a
+# named pipe for notification, and publishes their paths in the
+# connector profile.  The receiver thread waits for the notification
+# and writes data taken from the ring into the buffer in the same way
+# as InPortCorbaCdrProvider.  If the buffer is full, the data is left in
+# the ring and retried, so the sender gets SEND_FULL once the ring is
+# full.
+# Only an InPortSharedMemoryConsumer on the same host can connect.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class InPortSharedMemoryProvider(OpenRTM_aist.InPortProvider):
+
+    ##
+    # @if jp
+    # @brief 󥰤ΥǥեȤ礭 [byte]
+    # @else
+    # @brief Default size of the ring [byte]
+    # @endif
+    DEFAULT_BUFFER_SIZE = 1048576
+
+
+    ##
+    # @if jp
+    # @brief ХåեդξκƻԤδֳ [s]
+    # @else
+    # @brief Interval of the retries while the buffer is full [s]
+    # @endif
+    RETRY_INTERVAL = 0.01
+
+
+    ##
+    # @if jp
+    # @brief 󥹥ȥ饯
+    # @else
+    # @brief Constructor
+    # @endif
+    #
+    def __init__(self):
+        OpenRTM_aist.InPortProvider.__init__(self)
+        self.setInterfaceType("shared_memory")
+        self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortSharedMemoryProvider")
+        self._buffer = None
+        self._profile = None
+        self._listeners = None
+        self._ring = None
+        self._fifo = ""
+        self._fifofd = -1
+        self._thread = None
+        self._running = False
+
+
+    ##
+    # @if jp
+    # @brief 
+    #
+    # θƤӽФǥ󥰥ե̾դѥפ
+    # åɤ򳫻Ϥ롣󥰤礭
+    # shared_memory.buffer_size ǻꤹ롣
+    #
+    # @param prop 
+    #
+    # @else
+    # @brief Initializing configuration
+    #
+    # The first call creates the ring file and the named pipe, and starts
+    # the receiver thread.  The size of the ring is given by
+    # shared_memory.buffer_size.
+    #
+    # @param prop Configuration information
+    #
+    # @endif
+    #
+    # virtual void init(coil::Properties& prop);
+    def init(self, prop):
+        if self._ring is not None:
+            return
+
+        size = self.DEFAULT_BUFFER_SIZE
+        size_str = prop.getProperty("shared_memory.buffer_size")
+        if size_str:
+            try:
+                size = int(size_str)
+            except ValueError:
+                self._rtcout.RTC_ERROR("invalid buffer_size: %s", size_str)
+
+        path = os.path.join(OpenRTM_aist.sharedMemoryDir(),
+                            "openrtm_%d_%s" % (os.getpid(),
+                                               binascii.hexlify(os.urandom(8))))
+        try:
+            self._ring = OpenRTM_aist.SharedMemoryRing(path + ".ring", size)
+            os.mkfifo(path + ".fifo", 0600)
+            self._fifo = path + ".fifo"
+            # opened for read and write so that open() never blocks and
+            # exit() can wake the receiver thread up
+            self._fifofd = os.open(self._fifo, os.O_RDWR)
+        except:
+            self._rtcout.RTC_ERROR("creating shared memory failed: %s",
+                                   sys.exc_info()[1])
+            self.exit()
+            return
+
+        self._rtcout.RTC_DEBUG("shared memory: %s (%d bytes)",
+                               (self._ring.filename(), size))
+        self._properties.append(OpenRTM_aist.NVUtil.newNV("dataport.shared_memory.file",
+                                                          self._ring.filename()))
+        self._properties.append(OpenRTM_aist.NVUtil.newNV("dataport.shared_memory.fifo",
+                                                          self._fifo))
+
+        self._running = True
+        self._thread = threading.Thread(target=self.svc)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+
+    ##
+    # @if jp
+    # @brief λ
+    #
+    # åɤߤ󥰥ե̾դѥפ롣
+    #
+    # @else
+    # @brief Finalization
+    #
+    # Stops the receiver thread, and removes the ring file and the
+    # named pipe.
+    #
+    # @endif
+    #
+    def exit(self):
+        self._rtcout.RTC_TRACE("exit()")
+        self._running = False
+        if self._fifofd >= 0:
+            try:
+                os.write(self._fifofd, "\0")
+            except OSError:
+                pass
+        if self._thread is not None and \
+                self._thread is not threading.currentThread():
+            self._thread.join()
+        self._thread = None
+
+        if self._fifofd >= 0:
+            os.close(self._fifofd)
+            self._fifofd = -1
+        if self._fifo:
+            try:
+                os.unlink(self._fifo)
+            except OSError:
+                pass
+            self._fifo = ""
+        if self._ring is not None:
+            self._ring.unlink()
+            self._ring = None
+
+
+    def setBuffer(self, buffer):
+        self._buffer = buffer
+
+
+    def setListener(self, info, listeners):
+        self._profile = info
+        self._listeners = listeners
+
+
+    ##
+    # @if jp
+    # @brief åɤν
+    #
+    # ̾դѥפؤΤԤΤȤ˥󥰤ˤʤޤ
+    # ǡФХåե˽񤭹ʤäǡĤäƤ
+    # ֤ RETRY_INTERVAL Ȥ˺ƻԤ롣
+    #
+    # @else
+    # @brief Processing of the receiver thread
+    #
+    # Waits for notifications on the named pipe, and takes data from the
+    # ring until it becomes empty for each notification.  While data
+    # which could not be written into the buffer is left, it is retried
+    # every RETRY_INTERVAL.
+    #
+    # @endif
+    #
+    def svc(self):
+        timeout = None
+        while self._running:
+            try:
+                if select.select([self._fifofd], [], [], timeout)[0]:
+                    os.read(self._fifofd, 512)
+            except (OSError, select.error):
+                if sys.exc_info()[1].args[0] == errno.EINTR:
+                    continue
+                self._rtcout.RTC_ERROR("reading fifo failed: %s",
+                                       sys.exc_info()[1])
+                break
+
+            if not self._running:
+                break
+
+            if self.receive():
+                timeout = None
+            else:
+                timeout = self.RETRY_INTERVAL
+
+
+    ##
+    # @if jp
+    # @brief 󥰤ΥǡХåե˽񤭹
+    #
+    # 󥰤ˤʤޤǥǡФƥХåե˽񤭹ࡣ
+    # ХåեդޤϽ񤭹ߤॢȤϡΥǡ
+    # 󥰤˻ĤǤ롣¾Υ顼ξϥǡ˴롣
+    # 󥰤Ƥ̤ɤΥǡ˴Ʋ롣
+    #
+    # @return 󥰤ˤʤä TrueǡĤäƤ False
+    #
+    # @else
+    # @brief Write data in the ring into the buffer
+    #
+    # Takes data from the ring until it becomes empty, and writes them
+    # into the buffer.  If the buffer is full or the write times out, the
+    # data is left in the ring and the rest are not taken.  The data is
+    # dropped on the other errors.  If the ring is corrupted, all the
+    # unread data are dropped to recover.
+    #
+    # @return True if the ring became empty, False if data is left
+    #
+    # @endif
+    #
+    def receive(self):
+        while True:
+            try:
+                data = self._ring.get()
+            except ValueError:
+                self._rtcout.RTC_ERROR("%s: unread data dropped",
+                                       sys.exc_info()[1])
+                self.onReceiverError("")
+                self._ring.clear()
+                return True
+            if data is None:
+                return True
+
+            ret = self.put(data)
+            if ret == self.BUFFER_FULL or ret == self.BUFFER_TIMEOUT:
+                return False
+            if ret != self.PORT_OK:
+                self._rtcout.RTC_WARN("data dropped: %s",
+                                      OpenRTM_aist.DataPortStatus.toString(ret))
+            self._ring.advanceRptr()
+
+
+    ##
+    # @if jp
+    # @brief Хåե˥ǡ񤭹
+    #
+    # 󥰤ФǡХåե˽񤭹ࡣ
+    #
+    # @param data оݥǡ
+    #
+    # @return ꥿󥳡
+    #
+    # @else
+    # @brief Write data into the buffer
+    #
+    # Writes data taken from the ring into the buffer.
+    #
+    # @param data The data to be written
+    #
+    # @return Return code
+    #
+    # @endif
+    #
+    def put(self, data):
+        try:
+            self._rtcout.RTC_PARANOID("InPortSharedMemoryProvider.put()")
+
+            if not self._buffer:
+                self.onReceiverError(data)
+                return self.PORT_ERROR
+
+            self._rtcout.RTC_PARANOID("received data size: %d", len(data))
+
+            self.onReceived(data)
+
+            if not self._connector:
+                return self.PORT_ERROR
+
+            ret = self._connector.write(data)
+
+            return self.convertReturn(ret, data)
+
+        except:
+            self._rtcout.RTC_TRACE(sys.exc_info()[0])
+            return self.UNKNOWN_ERROR
+
+        return self.UNKNOWN_ERROR
+
+
+    def convertReturn(self, status, data):
+        if status == OpenRTM_aist.BufferStatus.BUFFER_OK:
+            self.onBufferWrite(data)
+            return self.PORT_OK
+
+        elif status == OpenRTM_aist.BufferStatus.BUFFER_ERROR:
+            self.onReceiverError(data)
+            return self.PORT_ERROR
+
+        elif status == OpenRTM_aist.BufferStatus.BUFFER_FULL:
+            self.onBufferFull(data)
+            self.onReceiverFull(data)
+            return self.BUFFER_FULL
+
+        elif status == OpenRTM_aist.BufferStatus.BUFFER_EMPTY:
+            return self.BUFFER_EMPTY
+
+        elif status == OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET:
+            self.onReceiverError(data)
+            return self.PORT_ERROR
+
+        elif status == OpenRTM_aist.BufferStatus.TIMEOUT:
+            self.onBufferWriteTimeout(data)
+            self.onReceiverTimeout(data)
+            return self.BUFFER_TIMEOUT
+
+        else:
+            self.onReceiverError(data)
+            return self.UNKNOWN_ERROR
+
+
+    def onBufferWrite(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE].notify(self._profile, data)
+
+
+    def onBufferFull(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_FULL].notify(self._profile, data)
+
+
+    def onBufferWriteTimeout(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE_TIMEOUT].notify(self._profile, data)
+
+
+    def onReceived(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED].notify(self._profile, data)
+
+
+    def onReceiverFull(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL].notify(self._profile, data)
+
+
+    def onReceiverTimeout(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_TIMEOUT].notify(self._profile, data)
+
+
+    def onReceiverError(self, data):
+        if self._listeners is not None and self._profile is not None:
+            self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_ERROR].notify(self._profile, data)
+
+
+
+def InPortSharedMemoryProviderInit():
+    factory = OpenRTM_aist.InPortProviderFactory.instance()
+    factory.addFactory("shared_memory",
+                       OpenRTM_aist.InPortSharedMemoryProvider,
+                       OpenRTM_aist.Delete)
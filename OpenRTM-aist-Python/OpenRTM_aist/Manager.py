@@ -50,6 +50,48 @@ manager = None
 mutex = threading.RLock()
 
 
+##
+# @if jp
+# @brief ݡͥȽѤΥåɥס
+#
+# createComponents() ǤޤȤݡͥȤ initialize() ϡ
+# ¾ƱƤӽФȶͭʤѤ PeriodicTaskPool Ǽ¹Ԥ롣
+# ǽθƤӽФ rtc.conf 
+# manager.components.pool.size ǻꤹ롣
+#
+# @return PeriodicTaskPool Υ󥹥
+#
+# @else
+# @brief Get the thread pool for component initialization
+#
+# initialize() of the components created in a batch by
+# createComponents() is executed by a dedicated PeriodicTaskPool which
+# is not shared with other asynchronous invocations.  It is created by
+# the first call, and the number of workers is given by
+# manager.components.pool.size in rtc.conf.
+#
+# @return Instance of PeriodicTaskPool
+#
+# @endif
+#
+def componentInitPool():
+  global componentinitpool
+
+  if componentinitpool is None:
+    guard = OpenRTM_aist.ScopedLock(componentinitpool_mutex)
+    if componentinitpool is None:
+      size = [4]
+      conf = OpenRTM_aist.Manager.instance().getConfig()
+      OpenRTM_aist.stringTo(size, conf.getProperty("manager.components.pool.size"))
+      componentinitpool = OpenRTM_aist.PeriodicTaskPool(max(size[0], 1))
+
+  return componentinitpool
+
+
+componentinitpool = None
+componentinitpool_mutex = threading.RLock()
+
+
 ##
 # @if jp
 # @brief λ
@@ -391,15 +433,24 @@ class Manager:
       self._initProc(self)
 
     comps = [s.strip() for s in self._config.getProperty("manager.components.precreate").split(",")]
+    precreate = []
     for i in range(len(comps)):
       if comps[i] is None or comps[i] == "":
         continue
       tmp = [comps[i]]
       OpenRTM_aist.eraseHeadBlank(tmp)
       OpenRTM_aist.eraseTailBlank(tmp)
-      comps[i] = tmp[0]
+      precreate.append(tmp[0])
 
-      self.createComponent(comps[i])
+    mode = OpenRTM_aist.normalize([self._config.getProperty("manager.components.precreate_mode",
+                                                            "serial")])
+    if mode == "parallel":
+      self.createComponents(precreate)
+    else:
+      if mode != "serial":
+        self._rtcout.RTC_ERROR("invalid precreate_mode value: %s", mode)
+      for comp_args in precreate:
+        self.createComponent(comp_args)
 
     return True
 
@@ -755,6 +806,143 @@ class Manager:
   #
   def createComponent(self, comp_args):
     self._rtcout.RTC_TRACE("Manager.createComponent(%s)", comp_args)
+    comp = self.createComponentObject(comp_args)
+    if not comp:
+      return comp
+
+    # Component initialization
+    if comp.initialize() != RTC.RTC_OK:
+      self._rtcout.RTC_TRACE("RTC initialization failed: %s", comp.getTypeName())
+      comp.exit()
+      self._rtcout.RTC_TRACE("%s was finalized", comp.getTypeName())
+      return None
+      
+    self._rtcout.RTC_TRACE("RTC initialization succeeded: %s", comp.getTypeName())
+    self.registerComponent(comp)
+    return comp
+
+
+  ##
+  # @if jp
+  # @brief ʣRTݡͥȤ礷
+  #
+  # createComponent() ƱΰΥꥹȤꡢRTݡͥ
+  # 礷롣եȥβϽ˹Ԥɤ߹߲ǽ
+  # ⥸塼ΰϺǽɬפˤʤä1롣
+  # initialize()  componentInitPool() ѤΥåɥס¹Ԥ
+  # ¹Ԥ롣¾νȶͭƱƤӽФѤΥåɥס
+  # ȤʤᡢΥסνڤäƤƤⵯư˸ʤ
+  # ݡͥȤΥ͡ߥ󥰥ӥؤϿϤޤȤƹԤ
+  #
+  # @param self
+  # @param comp_args_list оRTݡͥID
+  #                       ե졼Υꥹ
+  #
+  # @return RTݡͥȤΥ󥹥󥹤Υꥹȡ
+  #         Ʊǡ˼ԤΤ None Ȥʤ롣
+  #
+  # @else
+  # @brief Create RT-Components in a batch
+  #
+  # Takes a list of arguments in the same format as createComponent()
+  # and creates the RT-Components in a batch.  Factories are resolved
+  # and components created in order, and the list of loadable modules
+  # is obtained only once when it is first needed.  initialize() is run
+  # concurrently on the dedicated thread pool of componentInitPool().
+  # The thread pool for asynchronous invocations shared with other
+  # processing is not used, so that jobs stuck in it do not block the
+  # startup.  The components that succeeded are registered to the naming
+  # services in a batch.
+  #
+  # @param self
+  # @param comp_args_list List of target RT-Component IDs and
+  #                       configuration arguments
+  #
+  # @return List of created RT-Component's instances, in the same order
+  #         as the arguments.  None for the ones that failed.
+  #
+  # @endif
+  #
+  def createComponents(self, comp_args_list):
+    self._rtcout.RTC_TRACE("Manager.createComponents(%d components)",
+                           len(comp_args_list))
+    loadables = [None]
+    comps = []
+    for comp_args in comp_args_list:
+      comp = self.createComponentObject(comp_args, loadables)
+      if not comp:
+        comp = None
+      comps.append(comp)
+
+    pool = componentInitPool()
+    invokers = []
+    for comp in comps:
+      if comp is None:
+        invokers.append(None)
+        continue
+      invoker = OpenRTM_aist.Async_tInvoker(comp, lambda obj: obj.initialize())
+      invoker.invoke(pool)
+      invokers.append(invoker)
+
+    for i in range(len(comps)):
+      if comps[i] is None:
+        continue
+      try:
+        ret = invokers[i].result()
+      except:
+        self._rtcout.RTC_ERROR("RTC initialization raised an exception: %s: %s",
+                               (comps[i].getTypeName(), sys.exc_info()[1]))
+        ret = RTC.RTC_ERROR
+
+      if ret != RTC.RTC_OK:
+        self._rtcout.RTC_TRACE("RTC initialization failed: %s", comps[i].getTypeName())
+        comps[i].exit()
+        self._rtcout.RTC_TRACE("%s was finalized", comps[i].getTypeName())
+        comps[i] = None
+        continue
+      self._rtcout.RTC_TRACE("RTC initialization succeeded: %s", comps[i].getTypeName())
+
+    self.registerComponents([comp for comp in comps if comp is not None])
+    return comps
+
+
+  ##
+  # @if jp
+  # @brief RTݡͥȤΥ󥹥󥹤ե졼
+  #        Ԥ
+  #
+  # createComponent() Τβϡեȥβ衢
+  # 󥹥󥹤ȥե졼ԤϹԤʤ
+  #
+  # @param self
+  # @param comp_args оRTݡͥIDӥե졼
+  # 
+  # @param loadables ɤ߹߲ǽʥ⥸塼ΰΥå塣
+  #                  [None] Ϥȡǽɬפˤʤä˼
+  #                  ݻ롣ά롣
+  #
+  # @return RTݡͥȤΥ󥹥󥹡Ԥ
+  #         None ޤ 0
+  #
+  # @else
+  # @brief Create and configure an instance of RT-Component
+  #
+  # The part of createComponent() that parses the arguments, resolves
+  # the factory, creates the instance and configures it.  It is not
+  # initialized.
+  #
+  # @param self
+  # @param comp_args Target RT-Component ID and configuration arguments
+  # @param loadables Cache of the list of loadable modules.  If [None]
+  #                  is given, the list obtained when first needed is
+  #                  kept in it.  If omitted, the list is obtained every
+  #                  time.
+  #
+  # @return Created RT-Component's instance.  None or 0 on failure.
+  #
+  # @endif
+  #
+  def createComponentObject(self, comp_args, loadables=None):
     comp_prop = OpenRTM_aist.Properties()
     comp_id   = OpenRTM_aist.Properties()
 
@@ -784,7 +972,12 @@ class Manager:
       self._rtcout.RTC_ERROR("createComponent: Factory not found: %s", comp_id.getProperty("implementation_id"))
 
       # automatic module loading
-      mp = self._module.getLoadableModules()
+      if loadables is None:
+        mp = self._module.getLoadableModules()
+      else:
+        if loadables[0] is None:
+          loadables[0] = self._module.getLoadableModules()
+        mp = loadables[0]
       self._rtcout.RTC_INFO("%d loadable modules found", len(mp))
 
       found_obj = None
@@ -849,15 +1042,6 @@ class Manager:
     # The property specified by the parameter of createComponent() is set.
     # comp.setProperties(comp_prop)
 
-    # Component initialization
-    if comp.initialize() != RTC.RTC_OK:
-      self._rtcout.RTC_TRACE("RTC initialization failed: %s", comp_id.getProperty("implementation_id"))
-      comp.exit()
-      self._rtcout.RTC_TRACE("%s was finalized", comp_id.getProperty("implementation_id"))
-      return None
-      
-    self._rtcout.RTC_TRACE("RTC initialization succeeded: %s", comp_id.getProperty("implementation_id"))
-    self.registerComponent(comp)
     return comp
 
 
@@ -889,6 +1073,43 @@ class Manager:
 
     return True
 
+
+  ##
+  # @if jp
+  # @brief ʣRTݡͥȤľ Manager Ͽ
+  #
+  # ͡ߥ󥰥ӥؤϿϥ͡ߥ󥰥ӥȤˤޤȤƹԤ
+  #
+  # @param self
+  # @param comps ϿоRTݡͥȤΥ󥹥󥹤Υꥹ
+  #
+  # @return Ͽ(Ͽ:true:false)
+  #
+  # @else
+  # @brief Register RT-Components directly without Factory
+  #
+  # The names are bound to each naming service in a batch.
+  #
+  # @param self
+  # @param comps List of target RT-Component's instances
+  #
+  # @return Registration result (Successful:true, Failed:false)
+  #
+  # @endif
+  def registerComponents(self, comps):
+    self._rtcout.RTC_TRACE("Manager.registerComponents(%d components)",
+                           len(comps))
+
+    objects = []
+    for comp in comps:
+      self._compManager.registerObject(comp)
+      for name in comp.getNamingNames():
+        self._rtcout.RTC_TRACE("Bind name: %s", name)
+        objects.append((name, comp))
+
+    self._namingManager.bindObjects(objects)
+    return True
+
   
   ##
   # @if jp
@@ -1151,6 +1372,13 @@ class Manager:
                                       OpenRTM_aist.Manager.cleanupComponents,
                                       tm)
 
+    intr = [0.0]
+    OpenRTM_aist.stringTo(intr, self._config.getProperty("port.liveness.interval"))
+    if self._timer and intr[0] > 0.0:
+      self._timer.registerListenerObj(self,
+                                      OpenRTM_aist.Manager.probePortConnectors,
+                                      OpenRTM_aist.TimeValue(intr[0]))
+
     return
 
 
@@ -1228,6 +1456,7 @@ class Manager:
 
     if not OpenRTM_aist.toBool(self._config.getProperty("logger.enable"), "YES", "NO", True):
       self._rtcout = OpenRTM_aist.LogStream()
+      self._rtcout.stripDisabledLevels(self.isStripDisabledLogLevels())
       return True
 
     logfile = "./rtc.log"
@@ -1261,6 +1490,7 @@ class Manager:
     self._rtcout.setLogLevel(self._config.getProperty("logger.log_level"))
     self._rtcout.setLogLock(OpenRTM_aist.toBool(self._config.getProperty("logger.stream_lock"),
                                                 "enable", "disable", False))
+    self._rtcout.stripDisabledLevels(self.isStripDisabledLogLevels())
 
     self._rtcout.RTC_INFO("%s", self._config.getProperty("openrtm.version"))
     self._rtcout.RTC_INFO("Copyright (C) 2003-2010")
@@ -1794,6 +2024,36 @@ class Manager:
     return
 
 
+  ##
+  # @if jp
+  # @brief  RTݡͥȤΥݡȤ¸ǧ򳫻Ϥ
+  #
+  # port.liveness.interval [sec] Ȥ˥ޤƤФ졢
+  # RTݡͥȤݡȤΥͥ¸ǧƱ˳Ϥ롣
+  # ¸ߤʤݡȤ³Ƥ륳ͥϳǧǤ롣
+  #
+  # @else
+  # @brief Start liveness checks of the ports of all RT-Components
+  #
+  # Called by the timer every port.liveness.interval [sec], and starts
+  # liveness checks of the connectors of all ports of each RT-Component
+  # asynchronously.  Connectors to ports that do not exist are
+  # disconnected in the checks.
+  #
+  # @endif
+  #
+  # void probePortConnectors();
+  def probePortConnectors(self):
+    self._rtcout.RTC_VERBOSE("Manager.probePortConnectors()")
+    for comp in self.getComponents():
+      try:
+        comp.probePortConnectors()
+      except:
+        self._rtcout.RTC_WARN("probing ports of %s failed: %s",
+                              (comp.getInstanceName(), sys.exc_info()[1]))
+    return
+
+
   ##
   # @if jp
   # @brief RTݡͥȤκ
@@ -2088,13 +2348,43 @@ class Manager:
   # @endif
   def getLogbuf(self,name="manager"):
     if not OpenRTM_aist.toBool(self._config.getProperty("logger.enable"), "YES", "NO", True):
-      return OpenRTM_aist.LogStream()
+      logbuf = OpenRTM_aist.LogStream()
+      logbuf.stripDisabledLevels(self.isStripDisabledLogLevels())
+      return logbuf
 
     logbuf = OpenRTM_aist.LogStream(name)
     logbuf.setLogLevel(self._config.getProperty("logger.log_level"))
+    logbuf.stripDisabledLevels(self.isStripDisabledLogLevels())
     return logbuf
 
 
+  ##
+  # @if jp
+  # @brief ̵ʥ٥ؿˤ뤫ɤ
+  #
+  # logger.strip_disabled_levels  YES ξ硢ȥ꡼̵
+  # ʥ٥νϴؿ϶ؿ֤롣
+  #
+  # @param self
+  #
+  # @return true: ֤, false: ֤ʤ
+  #
+  # @else
+  # @brief Whether disabled log levels are made no-op
+  #
+  # If logger.strip_disabled_levels is YES, the output functions of
+  # disabled log levels of the log streams are replaced with no-op.
+  #
+  # @param self
+  #
+  # @return true: replaced, false: not replaced
+  #
+  # @endif
+  def isStripDisabledLogLevels(self):
+    return OpenRTM_aist.toBool(self._config.getProperty("logger.strip_disabled_levels"),
+                               "YES", "NO", False)
+
+
   ##
   # @if jp
   # @brief ޥ͡㥳ե졼μ
@@ -18,6 +18,7 @@
 import string
 import sys,os
 import glob
+import marshal
 
 import OpenRTM_aist
 
@@ -33,6 +34,9 @@ ALLOW_URL     = "manager.modules.download_allowed"
 MOD_DWNDIR    = "manager.modules.download_dir"
 MOD_DELMOD    = "manager.modules.download_cleanup"
 MOD_PRELOAD   = "manager.modules.preload"
+MOD_INDEX     = "manager.modules.index_file"
+
+MOD_INDEX_VERSION = 1
 
 
 
@@ -98,6 +102,12 @@ class ModuleManager:
     self._modules = OpenRTM_aist.ObjectManager(self.DLLPred)
     self._rtcout = None
 
+    self._indexFile = prop.getProperty(MOD_INDEX)
+    if self._indexFile:
+      self._indexFile = os.path.expanduser(self._indexFile)
+    self._index = None
+    self._indexChanged = False
+
 
   ##
   # @if jp
@@ -438,23 +448,97 @@ class ModuleManager:
     return modules
 
 
-  def __getRtcProfile(self, fname):
-    # file name with full path
-    fullname  = fname
+  def __getRtcProfile(self, fname, factories=None):
+    comp_spec = self.__getRtcSpec(fname)
+    if not comp_spec:
+      return None
+    newp = OpenRTM_aist.Properties(defaults_str=comp_spec)
+
+    # loaded profile = old profiles - new profiles
+    if factories is None:
+      factories = self.__getFactoryKeys()
+
+    # loaded component profile have to be one
+    if self.__profileKey(newp) in factories:
+      return OpenRTM_aist.Properties()
+
+    return newp
+
+
+  def __profileKey(self, prop):
+    return (prop.getProperty("implementation_id"),
+            prop.getProperty("type_name"),
+            prop.getProperty("description"),
+            prop.getProperty("version"))
+
+
+  def __getFactoryKeys(self):
+    keys = {}
+    for prop in OpenRTM_aist.Manager.instance().getFactoryProfiles():
+      keys[self.__profileKey(prop)] = None
+    return keys
+
+
+  ##
+  # @if jp
+  # @brief ⥸塼 *_spec 
+  #
+  # ⥸塼륤ǥå˥եΥѥ礭פ
+  # ȥ꤬ФƤ֤ʤХ⥸塼 import 
+  # *_spec ɤ߹ߡǥå˵Ͽ롣
+  #
+  # @param self
+  # @param fname ⥸塼ե̾
+  #
+  # @return *_spec ʸΥꥹȡ*_spec ʤ import ˼Ԥ
+  #          None
+  #
+  # @else
+  # @brief Get *_spec of a module
+  #
+  # Returns the content of the module index if it has an entry whose
+  # path, modification time and size match the file.  Otherwise the
+  # module is imported to read *_spec, and the result is recorded in the
+  # index.
+  #
+  # @param self
+  # @param fname Module file name
+  #
+  # @return List of strings of *_spec.  None if there is no *_spec or
+  #         the import failed.
+  #
+  # @endif
+  def __getRtcSpec(self, fname):
+    if self._index is None:
+      self.loadIndex()
+
+    try:
+      st = os.stat(fname)
+    except OSError:
+      # not a file path, e.g. a module name
+      return self.__importRtcSpec(fname)
+
+    path = os.path.abspath(fname)
+    entry = self._index.get(path)
+    if entry is not None and entry[0] == st.st_mtime and entry[1] == st.st_size:
+      return entry[2]
+
+    comp_spec = self.__importRtcSpec(fname)
+    self._index[path] = (st.st_mtime, st.st_size, comp_spec)
+    self._indexChanged = True
+    return comp_spec
+
+
+  def __importRtcSpec(self, fname):
     # directory name
     dirname   = os.path.dirname(fname)
-    sys.path.append(dirname)
+    if dirname not in sys.path:
+      sys.path.append(dirname)
     # basename
     basename  = os.path.basename(fname)
     # classname
     classname  = basename.split(".")[0].lower()
 
-    # loaded profile = old profiles - new profiles
-    mgr = OpenRTM_aist.Manager.instance()
-    # for old
-    oldp = mgr.getFactoryProfiles()
-
-    # for new
     comp_spec_name = classname+"_spec"
 
     try:
@@ -464,29 +548,93 @@ class ModuleManager:
     comp_spec = getattr(imp_file,comp_spec_name,None)
     if not comp_spec:
       return None
-    newp = OpenRTM_aist.Properties(defaults_str=comp_spec)
+    return [str(s) for s in comp_spec]
 
-    profs = []
-    
-    exists = False
-    for i in range(len(oldp)):
-      if    oldp[i].getProperty("implementation_id") == newp.getProperty("implementation_id") and \
-            oldp[i].getProperty("type_name") == newp.getProperty("type_name") and \
-            oldp[i].getProperty("description") == newp.getProperty("description") and \
-            oldp[i].getProperty("version") == newp.getProperty("version"):
-        exists = True
-    if not exists:
-      profs.append(newp)
-
-        
-    # loaded component profile have to be one
-    if len(profs) == 0:
-      return OpenRTM_aist.Properties()
 
-    if len(profs) > 1:
-      return None
+  ##
+  # @if jp
+  # @brief ⥸塼륤ǥåɤ߹
+  #
+  # manager.modules.index_file ǻꤷե뤫⥸塼륤ǥå
+  # ɤ߹ࡣե뤬ʤۤʤ϶ΥǥåȤʤ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Load the module index
+  #
+  # Loads the module index from the file given by
+  # manager.modules.index_file.  The index becomes empty if the file
+  # does not exist or has a different format.
+  #
+  # @param self
+  #
+  # @endif
+  def loadIndex(self):
+    self._index = {}
+    self._indexChanged = False
+    if not self._indexFile:
+      return
+
+    try:
+      f = open(self._indexFile, "rb")
+      try:
+        data = marshal.load(f)
+      finally:
+        f.close()
+    except (IOError, EOFError, ValueError, TypeError):
+      return
+
+    if isinstance(data, dict) and data.get("version") == MOD_INDEX_VERSION:
+      self._index = data.get("modules", {})
+    return
+
+
+  ##
+  # @if jp
+  # @brief ⥸塼륤ǥå¸
+  #
+  # ǥåѹƤ manager.modules.index_file ǻꤷ
+  # ե¸롣եϰե˽񤭹Ǥ֤롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Save the module index
+  #
+  # Saves the index to the file given by manager.modules.index_file if
+  # it has been changed.  The file is written to a temporary file and
+  # then replaced.
+  #
+  # @param self
+  #
+  # @endif
+  def saveIndex(self):
+    if not self._indexChanged or not self._indexFile:
+      return
 
-    return profs[0]
+    tmpfile = "%s.%d" % (self._indexFile, os.getpid())
+    try:
+      dirname = os.path.dirname(self._indexFile)
+      if dirname and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+      f = open(tmpfile, "wb")
+      try:
+        marshal.dump({"version": MOD_INDEX_VERSION, "modules": self._index}, f)
+      finally:
+        f.close()
+      if os.name == "nt" and os.path.exists(self._indexFile):
+        os.remove(self._indexFile)
+      os.rename(tmpfile, self._indexFile)
+    except (IOError, OSError):
+      try:
+        os.remove(tmpfile)
+      except OSError:
+        pass
+      return
+
+    self._indexChanged = False
+    return
 
 
   ##
@@ -494,6 +642,8 @@ class ModuleManager:
   # @brief ɲǽ⥸塼ꥹȤ(̤)
   #
   # ɲǽʥ⥸塼ΥꥹȤ롣
+  # ƥ⥸塼 *_spec ϥ⥸塼륤ǥå˵Ͽ졢
+  # Ƥʤ⥸塼 import ʤ
   #
   # @param self
   #
@@ -501,28 +651,48 @@ class ModuleManager:
   #
   # @else
   # @brief Get loadable module names
+  #
+  # *_spec of each module is recorded in the module index, and modules
+  # that have not been modified are not imported.
+  #
   # @endif
   def getLoadableModules(self):
+    if self._index is None:
+      self.loadIndex()
+
     # getting loadable module file path list.
     modules_ = []
+    dirs_ = {}
     for path in self._loadPath:
       if path == "":
         continue
 
+      dirs_[os.path.abspath(path)] = None
       flist = glob.glob(path+"/"+'*.py')
       for file in flist:
         if file.find("__init__.py") == -1:
           modules_.append(file)
     
     props = []
+    factories = self.__getFactoryKeys()
     # getting module properties from loadable modules
     for mod_ in modules_:
-      prop = self.__getRtcProfile(mod_)
+      prop = self.__getRtcProfile(mod_, factories)
       if prop:
         prop.setProperty("module_file_name",os.path.basename(mod_))
         prop.setProperty("module_file_path", mod_)
         props.append(prop)
-    
+
+    # removing the entries of deleted files in the load path
+    found_ = {}
+    for mod_ in modules_:
+      found_[os.path.abspath(mod_)] = None
+    for path in self._index.keys():
+      if os.path.dirname(path) in dirs_ and path not in found_:
+        del self._index[path]
+        self._indexChanged = True
+
+    self.saveIndex()
     return props
 
 
@@ -116,6 +116,14 @@ def copyFromProperties(nv, prop):
 # @endif
 # void copyToProperties(coil::Properties& prop, const SDOPackage::NVList& nv);
 def copyToProperties(prop, nvlist):
+  if isinstance(nvlist, NVListView):
+    for i in range(len(nvlist)):
+      try:
+        prop.setProperty(str(nvlist[i].name), str(nvlist.valueAt(i)))
+      except:
+        traceback.print_exception(*sys.exc_info())
+    return
+
   for nv in nvlist:
     try:
       val = str(any.from_any(nv.value, keep_structs=True))
@@ -202,7 +210,7 @@ class nv_find:
 #
 # @endif
 def find(nv, name):
-  index = OpenRTM_aist.CORBA_SeqUtil.find(nv, nv_find(name))
+  index = find_index(nv, name)
 
   if index < 0:
     raise "Not found."
@@ -227,6 +235,8 @@ def find(nv, name):
 #
 # @endif
 def find_index(nv, name):
+  if isinstance(nv, NVListView):
+    return nv.find_index(name)
   return OpenRTM_aist.CORBA_SeqUtil.find(nv, nv_find(name))
 
 
@@ -248,6 +258,8 @@ def find_index(nv, name):
 # @endif
 def isString(nv, name):
   try:
+    if isinstance(nv, NVListView):
+      return type(nv.value(name)) == str
     value = find(nv, name)
     val = any.from_any(value, keep_structs=True)
     return type(val) == str
@@ -311,8 +323,11 @@ def isStringValue(nv, name, value):
 def toString(nv, name):
   str_value = ""
   try:
-    ret_value = find(nv, name)
-    val = any.from_any(ret_value, keep_structs=True)
+    if isinstance(nv, NVListView):
+      val = nv.value(name)
+    else:
+      ret_value = find(nv, name)
+      val = any.from_any(ret_value, keep_structs=True)
     if type(val) == str:
       str_value = val
   except:
@@ -404,3 +419,268 @@ def dump(nv):
       print nv[i].name, ": ", nv[i].value
     else:
       print nv[i].name, ": not a string value"
+
+
+##
+# @if jp
+#
+# @class NVListView
+# @brief NVList κդӥ塼
+#
+# NVList ֤̾ؤκȡAny ФͤΥå
+# ĥӥ塼NVUtil δؿ NVList Ϥȡõ
+# any.from_any() η֤Ԥ鷺֤ͤNVList Ʊͤź
+# len()append() Ǹ NVList Ǥ롣
+#
+#  NVList ؤǤɲäϼθ˺ȿǤ롣Ǥͤ
+# ֤ͤΥåξȹǸФ롣
+#
+# @since 1.0.0
+#
+# @else
+#
+# @class NVListView
+# @brief Indexed view of NVList
+#
+# A view which has an index from the names of an NVList to the
+# positions, and a cache of the values extracted from the Anys.  Passed
+# to NVUtil functions in place of the NVList, it returns values without
+# repeating the linear search and any.from_any().  Like an NVList, the
+# original NVList can be accessed by subscripts, len() and append().
+#
+# Elements appended to the original NVList are indexed on the next
+# lookup.  Replaced values are detected when the value cache is checked.
+#
+# @since 1.0.0
+#
+# @endif
+class NVListView:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  # @param nvlist оݤ NVList
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param nvlist Target NVList
+  #
+  # @endif
+  def __init__(self, nvlist):
+    self._nv = nvlist
+    self._index = {}
+    self._values = {}
+    self._count = 0
+    self._prop = None
+    self._propValues = None
+    self.update()
+
+
+  def __len__(self):
+    return len(self._nv)
+
+
+  def __getitem__(self, index):
+    return self._nv[index]
+
+
+  def __iter__(self):
+    return iter(self._nv)
+
+
+  def append(self, nv):
+    self._nv.append(nv)
+
+
+  ##
+  # @if jp
+  # @brief оݤ NVList 
+  # @else
+  # @brief Get the target NVList
+  # @endif
+  def nvlist(self):
+    return self._nv
+
+
+  ##
+  # @if jp
+  # @brief ꤷ NVList Υӥ塼ɤ
+  # @else
+  # @brief Whether this is a view of the given NVList
+  # @endif
+  def isViewOf(self, nvlist):
+    return self._nv is nvlist
+
+
+  ##
+  # @if jp
+  # @brief 򹹿
+  #
+  # NVList ûʤäƤкľɲä줿Ǥ
+  # ä롣Ʊ̾Ǥʣ find_index() ƱͤƬ
+  # Ǥؤ
+  #
+  # @else
+  # @brief Update the index
+  #
+  # Rebuilds the index if the NVList became shorter, and adds appended
+  # elements to the index.  If several elements have the same name, the
+  # first one is indexed as find_index() does.
+  #
+  # @endif
+  def update(self):
+    count = len(self._nv)
+    if count < self._count:
+      self._index = {}
+      self._values = {}
+      self._count = 0
+
+    for i in range(self._count, count):
+      name = str(self._nv[i].name)
+      if not self._index.has_key(name):
+        self._index[name] = i
+    self._count = count
+
+
+  ##
+  # @if jp
+  # @brief name ǻꤵ줿ǤΥǥå֤
+  #
+  # @param self
+  # @param name ̾
+  #
+  # @return оݤΥǥåĤʤ -1
+  #
+  # @else
+  # @brief Get the index of the element specified by name
+  #
+  # @param self
+  # @param name Name to search
+  #
+  # @return Index of the element.  -1 if not found.
+  #
+  # @endif
+  def find_index(self, name):
+    name = str(name)
+    if len(self._nv) != self._count:
+      self.update()
+
+    index = self._index.get(name, -1)
+    if index >= 0 and str(self._nv[index].name) != name:
+      # an element was replaced
+      self._count = len(self._nv) + 1
+      self.update()
+      index = self._index.get(name, -1)
+    return index
+
+
+  ##
+  # @if jp
+  # @brief name ǻꤵ줿Ǥͤ Any Ф֤
+  #
+  # Фͤϥå夵졢Ǥ Any ֤ޤ
+  # Ѥ롣
+  #
+  # @param self
+  # @param name ̾
+  #
+  # @return Ǥ
+  #
+  # @exception KeyError ꤷ̾Ǥ¸ߤʤ
+  #
+  # @else
+  # @brief Get the value extracted from Any of the element specified by name
+  #
+  # The extracted value is cached and reused until the Any of the
+  # element is replaced.
+  #
+  # @param self
+  # @param name Name to search
+  #
+  # @return Value of the element
+  #
+  # @exception KeyError The element of the name does not exist
+  #
+  # @endif
+  def value(self, name):
+    index = self.find_index(name)
+    if index < 0:
+      raise KeyError(name)
+    return self.valueAt(index)
+
+
+  ##
+  # @if jp
+  # @brief ꤷ֤Ǥͤ Any Ф֤
+  # @else
+  # @brief Get the value extracted from Any of the element at the index
+  # @endif
+  def valueAt(self, index):
+    value = self._nv[index].value
+    cached = self._values.get(index)
+    if cached is None or cached[0] is not value:
+      cached = (value, any.from_any(value, keep_structs=True))
+      self._values[index] = cached
+    return cached[1]
+
+
+  ##
+  # @if jp
+  # @brief Properties Ѵ
+  #
+  # copyToProperties() ƱͤͤʸѴ Properties ֤
+  # ̤ϥå夵졢NVList ǤѤޤƱ֥Ȥ
+  # ֤뤿ᡢƤӽФ¦ѹƤϤʤʤ
+  #
+  # @return Ѵ̤ Properties
+  #
+  # @else
+  # @brief Convert to Properties
+  #
+  # Returns Properties of the values converted to strings as
+  # copyToProperties() does.  The result is cached and the same object
+  # is returned until the elements of the NVList change, so the caller
+  # must not modify it.
+  #
+  # @return Properties converted
+  #
+  # @endif
+  def toProperties(self):
+    values = [nv.value for nv in self._nv]
+    if self._prop is not None and len(values) == len(self._propValues):
+      for i in range(len(values)):
+        if values[i] is not self._propValues[i]:
+          break
+      else:
+        return self._prop
+
+    prop = OpenRTM_aist.Properties()
+    copyToProperties(prop, self)
+    self._prop = prop
+    self._propValues = values
+    return prop
+
+
+
+##
+# @if jp
+# @brief NVList Υӥ塼
+#
+# nv  NVListView ǤФΤޤޡǤʤпӥ塼֤
+#
+# @else
+# @brief Get a view of NVList
+#
+# Returns nv if it is an NVListView, or a new view otherwise.
+#
+# @endif
+def view(nv):
+  if isinstance(nv, NVListView):
+    return nv
+  return NVListView(nv)
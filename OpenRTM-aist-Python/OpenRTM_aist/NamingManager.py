@@ -18,6 +18,9 @@
 import threading
 import traceback
 import sys
+import time
+import omniORB
+from omniORB import CORBA
 
 import OpenRTM_aist
 
@@ -138,13 +141,51 @@ class NamingOnCorba(NamingBase):
     self._endpoint = ""
     self._replaceEndpoint = False
 
+    timeout = [0.0]
+    conf = OpenRTM_aist.Manager.instance().getConfig()
+    OpenRTM_aist.stringTo(timeout, conf.getProperty("naming.timeout"))
+    if timeout[0] > 0.0:
+      self.setTimeout(timeout[0])
+
+    ttl = [0.0]
+    OpenRTM_aist.stringTo(ttl, conf.getProperty("naming.cache.ttl"))
+    self._cosnaming.setCacheTTL(ttl[0])
+
+
+  ##
+  # @if jp
+  #
+  # @brief NamingService ؤθƤӽФΥॢȤꤹ
+  #
+  # 롼ȥƥȤؤθƤӽФϻ֤ TRANSIENT 㳰Ȥʤ롣
+  #
+  # @param self
+  # @param timeout ॢ [sec]
+  #
+  # @else
+  #
+  # @brief Set the timeout of invocations to NamingService
+  #
+  # Invocations to the root context raise TRANSIENT after the given
+  # time.
+  #
+  # @param self
+  # @param timeout Timeout [sec]
+  #
+  # @endif
+  def setTimeout(self, timeout):
+    root = self._cosnaming.getRootContext()
+    if CORBA.is_nil(root):
+      return
+    omniORB.setClientCallTimeout(root, int(timeout * 1000))
+
   ##
   # @if jp
   #
   # @brief ꤷ CORBA ֥ȤNamingServiceإХ
   # 
   # ꤷ CORBA ֥Ȥꤷ̾Τ CORBA NamingService 
-  # Хɤ롣
+  # Хɤ롣Хɤ˼Ԥ㳰Ф롣
   # 
   # @param self
   # @param name Хɻ̾
@@ -152,13 +193,23 @@ class NamingOnCorba(NamingBase):
   #
   # @else
   #
+  # @brief Bind the specified CORBA object to NamingService
+  #
+  # Binds the specified CORBA object to CORBA NamingService with the
+  # specified name.  An exception is raised if the binding failed.
+  #
+  # @param self
+  # @param name Name of the binding
+  # @param rtobj or mgr Object to be bound
+  #
   # @endif
   def bindObject(self, name, rtobj):
     self._rtcout.RTC_TRACE("bindObject(name = %s, rtobj or mgr)", name)
     try:
       self._cosnaming.rebindByString(name, rtobj.getObjRef(), True)
     except:
-      pass
+      self._rtcout.RTC_ERROR("binding %s failed: %s", (name, sys.exc_info()[0]))
+      raise
 
 
   ##
@@ -211,6 +262,9 @@ class NamingOnCorba(NamingBase):
 #
 # NamingServer ѥ饹
 # ݡͥȤNamingServiceؤϿʤɤ롣
+# NameServer ؤθƤӽФ NameServer Ȥ˥åɥס¹Ԥ
+# Ԥ졢ʤ NameServer äƤϿθƤӽФ
+# ¾ NameServer Ԥʤ
 #
 # @since 0.4.0
 #
@@ -218,6 +272,11 @@ class NamingOnCorba(NamingBase):
 #
 # @biref ModuleManager class
 #
+# Invocations to the NameServers are made in parallel for each
+# NameServer in the thread pool, so that an unresponsive NameServer
+# blocks neither the callers of binding and unbinding nor the other
+# NameServers.
+#
 # @endif
 class NamingManager:
   """
@@ -245,11 +304,22 @@ class NamingManager:
     #self._rtcout.setLogLock(OpenRTM_aist.toBool(manager.getConfig().getProperty("logger.stream_lock"), "enable", "disable", False))
     self._names = []
     self._namesMutex = threading.RLock()
+    self._namesCond = threading.Condition(self._namesMutex)
     self._compNames = []
     self._mgrNames  = []
     self._compNamesMutex = threading.RLock()
     self._mgrNamesMutex = threading.RLock()
 
+    conf = manager.getConfig()
+    self._retryInterval = [10.0]
+    OpenRTM_aist.stringTo(self._retryInterval,
+                          conf.getProperty("naming.update.interval"))
+    self._maxRetryInterval = [300.0]
+    OpenRTM_aist.stringTo(self._maxRetryInterval,
+                          conf.getProperty("naming.update.max_retry_interval"))
+    self._timeout = [3.0]
+    OpenRTM_aist.stringTo(self._timeout, conf.getProperty("naming.timeout"))
+
 
   ##
   # @if jp
@@ -258,6 +328,7 @@ class NamingManager:
   #
   # ꤷ NameServer Ͽ롣
   # ߻ǽʷ CORBA Τߡ
+  # NameServer ؤ³ϥåɥסǹԤ졢δؿ³Ԥʤ
   #
   # @param self
   # @param method NamingService η
@@ -265,12 +336,25 @@ class NamingManager:
   #
   # @else
   #
+  # @brief Register the NameServer
+  #
+  # Registers the NameServer of the specified type.  Only CORBA is
+  # available currently.  The connection to the NameServer is made in
+  # the thread pool, and this function does not wait for it.
+  #
+  # @param self
+  # @param method Type of NamingService
+  # @param name_server Name of the NameServer
+  #
   # @endif
   def registerNameServer(self, method, name_server):
     self._rtcout.RTC_TRACE("NamingManager::registerNameServer(%s, %s)",
                            (method, name_server))
-    name = self.createNamingObj(method, name_server)
-    self._names.append(self.Names(method, name_server, name))
+    guard = OpenRTM_aist.ScopedLock(self._namesMutex)
+    ns = self.Names(method, name_server, None)
+    self._names.append(ns)
+    ns.check = True
+    self.dispatch(ns)
 
 
   ##
@@ -279,6 +363,8 @@ class NamingManager:
   # @brief ꤷ֥ȤNamingServiceإХ
   # 
   # ꤷ֥Ȥꤷ̾Τ CORBA NamingService إХɤ롣
+  # Хɤ NameServer Ȥ˥åɥסǹԤ졢δؿ
+  # NameServer αԤʤ
   # 
   # @param self
   # @param name Хɻ̾
@@ -286,33 +372,57 @@ class NamingManager:
   #
   # @else
   #
+  # @brief Bind the specified object to NamingService
+  #
+  # Binds the specified object to CORBA NamingService with the specified
+  # name.  The binding is made for each NameServer in the thread pool,
+  # and this function does not wait for the NameServers.
+  #
+  # @param self
+  # @param name Name of the binding
+  # @param rtobj Object to be bound
+  #
   # @endif
   def bindObject(self, name, rtobj):
     self._rtcout.RTC_TRACE("NamingManager::bindObject(%s)", name)
     guard = OpenRTM_aist.ScopedLock(self._namesMutex)
-    for i in range(len(self._names)):
-      if self._names[i].ns:
-        try:
-          self._names[i].ns.bindObject(name, rtobj)
-        except:
-          del self._names[i].ns
-          self._names[i].ns = 0
-
     self.registerCompName(name, rtobj)
+    self.dispatchAll()
+
+
+  ##
+  # @if jp
+  # @brief ꤷʣΥ֥ȤNamingServiceؤޤȤƥХ
+  #
+  # NamingService ȤƤ̾Хɤ롣bindObject() Ʊͤ
+  # NameServer αԤʤ
+  #
+  # @param self
+  # @param objects Хɻ̾Τȥ֥ȤȤΥꥹ
+  #
+  # @else
+  # @brief Bind the specified objects to NamingService in a batch
+  #
+  # All the names are bound to each NamingService.  As with
+  # bindObject(), it does not wait for the NameServers.
+  #
+  # @param self
+  # @param objects List of pairs of the name and the object
+  #
+  # @endif
+  def bindObjects(self, objects):
+    self._rtcout.RTC_TRACE("NamingManager::bindObjects(%d objects)", len(objects))
+    guard = OpenRTM_aist.ScopedLock(self._namesMutex)
+    for name, rtobj in objects:
+      self.registerCompName(name, rtobj)
+    self.dispatchAll()
 
 
   def bindManagerObject(self, name, mgr):
     self._rtcout.RTC_TRACE("NamingManager::bindManagerObject(%s)", name)
     guard = OpenRTM_aist.ScopedLock(self._namesMutex)
-    for i in range(len(self._names)):
-      if self._names[i].ns:
-        try:
-          self._names[i].ns.bindObject(name, mgr)
-        except:
-          del self._names[i].ns
-          self._names[i].ns = 0
-
     self.registerMgrName(name, mgr)
+    self.dispatchAll()
 
 
   ##
@@ -321,42 +431,45 @@ class NamingManager:
   # @brief NamingServer ξι
   # 
   # ꤵƤ NameServer ϿƤ륪֥Ȥξ
-  # 롣
+  # 롣NameServer Ȥ¸ǧ¹ԤƹԤ
+  # naming.update.rebind  YES ξϥХɤƤʤ̾Τߤ
+  # Хɤľü NameServer ؤκ³ϼԤ뤴Ȥ
+  # naming.update.max_retry_interval ޤǴֳ֤ܤˤƹԤ
+  # δؿ NameServer αԤʤ
   # 
   # @param self
   # 
   # @else
   #
+  # @brief Update the information of NamingServer
+  #
+  # Updates the information of the objects registered in the
+  # NameServers.  The NameServers are checked in parallel, and if
+  # naming.update.rebind is YES, only the names that are not bound are
+  # bound again.  Reconnection to a disappeared NameServer is retried
+  # with the interval doubled on each failure, up to
+  # naming.update.max_retry_interval.  This function does not wait for
+  # the NameServers.
+  #
+  # @param self
+  #
   # @endif
   def update(self):
     self._rtcout.RTC_TRACE("NamingManager::update()")
     guard = OpenRTM_aist.ScopedLock(self._namesMutex)
     rebind = OpenRTM_aist.toBool(self._manager.getConfig().getProperty("naming.update.rebind"),
                                  "YES","NO",False)
-    for i in range(len(self._names)):
-      if self._names[i].ns is None:
+    now = time.time()
+    for ns in self._names:
+      if ns.ns is None:
+        if now < ns.nextRetry:
+          continue
         self._rtcout.RTC_DEBUG("Retrying connection to %s/%s",
-                               (self._names[i].method,
-                                self._names[i].nsname))
-        self.retryConnection(self._names[i])
-
-      else:
-        try:
-          if rebind:
-            self.bindCompsTo(self._names[i].ns)
-          if not self._names[i].ns.isAlive():
-            self._rtcout.RTC_INFO("Name server: %s (%s) disappeared.",
-                                  (self._names[i].nsname,
-                                   self._names[i].method))
-            del self._names[i].ns
-            self._names[i].ns = None
-        except:
-          self._rtcout.RTC_INFO("Name server: %s (%s) disappeared.",
-                                (self._names[i].nsname,
-                                 self._names[i].method))
-          del self._names[i].ns
-          self._names[i].ns = None
-
+                               (ns.method, ns.nsname))
+      ns.check = True
+      if rebind:
+        ns.pending = True
+      self.dispatch(ns)
 
     return
 
@@ -367,19 +480,30 @@ class NamingManager:
   # @brief ꤷ֥ȤNamingService饢Х
   # 
   # ꤷ֥Ȥ NamingService 饢Хɤ롣
+  # bindObject() Ʊͤ NameServer αԤʤ
   # 
   # @param self
   # @param name Хоݥ֥
   #
   # @else
   #
+  # @brief Unbind the specified object from NamingService
+  #
+  # Unbinds the specified object from NamingService.  As with
+  # bindObject(), it does not wait for the NameServers.
+  #
+  # @param self
+  # @param name Name of the object to be unbound
+  #
   # @endif
   def unbindObject(self, name):
     self._rtcout.RTC_TRACE("NamingManager::unbindObject(%s)", name)
     guard = OpenRTM_aist.ScopedLock(self._namesMutex)
-    for i in range(len(self._names)):
-      if self._names[i].ns:
-        self._names[i].ns.unbindObject(name)
+    for ns in self._names:
+      if ns.ns is not None:
+        ns.bound.pop(name, None)
+        ns.unbinds.append(name)
+        self.dispatch(ns)
     self.unregisterCompName(name)
     self.unregisterMgrName(name)
 
@@ -390,11 +514,19 @@ class NamingManager:
   # @brief ƤΥ֥ȤNamingService饢Х
   # 
   # ƤΥ֥Ȥ CORBA NamingService 饢Хɤ롣
+  # Хɤδλ naming.timeout ޤԤġ
   # 
   # @param self
   # 
   # @else
   #
+  # @brief Unbind all the objects from NamingService
+  #
+  # Unbinds all the objects from CORBA NamingService, and waits for the
+  # completion up to naming.timeout.
+  #
+  # @param self
+  #
   # @endif
   def unbindAll(self):
     self._rtcout.RTC_TRACE("NamingManager::unbindAll(): %d names.", len(self._compNames))
@@ -411,6 +543,9 @@ class NamingManager:
       idx = (len_ - 1) - i
       self.unbindObject(self._mgrNames[idx].name)
 
+    if not self.wait(self._timeout[0]):
+      self._rtcout.RTC_WARN("Unbinding from name servers timed out.")
+
 
   ##
   # @if jp
@@ -434,6 +569,50 @@ class NamingManager:
     return comps
 
 
+  ##
+  # @if jp
+  #
+  # @brief NameServer ȤƱδλԤ
+  #
+  # åɥסǹԤƤƤ NameServer ȤƱ
+  # λޤԤġ
+  #
+  # @param self
+  # @param timeout ॢ [sec]None ξϴλޤԤġ
+  #
+  # @return λƤ True
+  #
+  # @else
+  #
+  # @brief Wait for the synchronization with NameServers
+  #
+  # Waits until the synchronization with all the NameServers made in
+  # the thread pool is completed.
+  #
+  # @param self
+  # @param timeout Timeout [sec].  Waits until completed if None.
+  #
+  # @return True if completed
+  #
+  # @endif
+  def wait(self, timeout=None):
+    self._namesCond.acquire()
+    try:
+      if timeout is not None:
+        end = time.time() + timeout
+      while [ns for ns in self._names if ns.busy]:
+        if timeout is None:
+          self._namesCond.wait()
+          continue
+        remain = end - time.time()
+        if remain <= 0:
+          return False
+        self._namesCond.wait(remain)
+      return True
+    finally:
+      self._namesCond.release()
+
+
   ##
   # @if jp
   #
@@ -558,48 +737,258 @@ class NamingManager:
   ##
   # @if jp
   #
-  # @brief ݥͥȤХɤ
+  # @brief NameServer غ³
   # 
-  # ͡ॵФ³ƥݥͥȤХɤ롣
+  # ͡ॵФ³롣ݥͥȤΥХɤϸƤӽФ¦ǹԤ
   #
   # @param ns NameServer
   # 
+  # @return ³ NameServer ѥ֥ȡԤ None
+  #
   # @else
   #
-  # @brief Rebind the component to NameServer
+  # @brief Reconnect to the NameServer
   # 
-  # Connect with the NameServer and rebind the component. 
+  # Connect with the NameServer.  The components are rebound by the
+  # caller.
   #
   # @param ns NameServer
+  #
+  # @return Object managing the connected NameServer.  None if failed.
   # 
   # @endif
   #
   # void retryConnection(Names* ns);
   def retryConnection(self, ns):
     # recreate NamingObj
-    nsobj = 0
-    try:
-      nsobj = self.createNamingObj(ns.method, ns.nsname)
-      if nsobj != 0: # if succeed
-        self._rtcout.RTC_INFO("Connected to a name server: %s/%s",
-                              (ns.method, ns.nsname))
-        ns.ns = nsobj
-        self.bindCompsTo(nsobj) # rebind all comps to new NS
-        return
-      else:
-        self._rtcout.RTC_DEBUG("Name service: %s/%s still not available.",
-                               (ns.method, ns.nsname))
-
-    except:
-      self._rtcout.RTC_DEBUG("Name server: %s/%s disappeared again.",
+    nsobj = self.createNamingObj(ns.method, ns.nsname)
+    if nsobj is not None: # if succeed
+      self._rtcout.RTC_INFO("Connected to a name server: %s/%s",
+                            (ns.method, ns.nsname))
+    else:
+      self._rtcout.RTC_DEBUG("Name service: %s/%s still not available.",
                              (ns.method, ns.nsname))
-      if nsobj != 0:
-        del ns.ns
-        ns.ns = 0
+    return nsobj
+
+
+  ##
+  # @if jp
+  #
+  # @brief Ƥ³ NameServer ȤƱ׵᤹
+  #
+  # _namesMutex ֤ǸƤ֡
+  #
+  # @param self
+  #
+  # @else
+  #
+  # @brief Request synchronization with all the connected NameServers
+  #
+  # Called with _namesMutex acquired.
+  #
+  # @param self
+  #
+  # @endif
+  def dispatchAll(self):
+    for ns in self._names:
+      if ns.ns is not None:
+        ns.pending = True
+        self.dispatch(ns)
+    return
+
 
+  ##
+  # @if jp
+  #
+  # @brief NameServer ȤƱ򥹥åɥסǼ¹Ԥ
+  #
+  # Ʊ¹ξϡδλ˲ƱԤ롣
+  # _namesMutex ֤ǸƤ֡
+  #
+  # @param self
+  # @param ns NameServer
+  #
+  # @else
+  #
+  # @brief Execute the synchronization with the NameServer in the pool
+  #
+  # If the synchronization is running, it is made again after that.
+  # Called with _namesMutex acquired.
+  #
+  # @param self
+  # @param ns NameServer
+  #
+  # @endif
+  def dispatch(self, ns):
+    if ns.busy:
+      return
+    ns.busy = True
+    OpenRTM_aist.Async_tInvoker(ns, self.syncNameServer).invoke()
     return
 
 
+  ##
+  # @if jp
+  #
+  # @brief NameServer Ʊ
+  #
+  # åɥסΥåɤǼ¹Ԥ롣׵᤬ʤʤޤ
+  # ¸ǧ³Хɡѹ줿̾ΥХɤԤ
+  # NameServer ؤθƤӽФϥåƹԤ֥ƥȤؤ
+  # ƤӽФޤơΥåɤθƤӽФ naming.timeout 
+  # ॢȤ롣
+  #
+  # @param self
+  # @param ns NameServer
+  #
+  # @else
+  #
+  # @brief Synchronize with the NameServer
+  #
+  # Executed by a worker thread of the thread pool.  Until there is no
+  # request, checks or reconnects the NameServer, unbinds names and
+  # binds the changed names.  The NameServer is invoked with the lock
+  # released.  The invocations from this thread, including those to the
+  # sub-contexts, time out after naming.timeout.
+  #
+  # @param self
+  # @param ns NameServer
+  #
+  # @endif
+  def syncNameServer(self, ns):
+    # the timeout for the thread bounds the invocations to any object,
+    # such as the sub-contexts resolved while binding
+    timeout = int(self._timeout[0] * 1000)
+    if timeout > 0:
+      omniORB.setClientThreadCallTimeout(timeout)
+    self._namesCond.acquire()
+    try:
+      while ns.check or ns.pending or ns.unbinds:
+        check   = ns.check
+        pending = ns.pending
+        unbinds = ns.unbinds
+        naming  = ns.ns
+        ns.check   = False
+        ns.pending = False
+        ns.unbinds = []
+
+        self._namesCond.release()
+        try:
+          connected = False
+          alive = naming is not None
+          if naming is None:
+            if check:
+              naming = self.retryConnection(ns)
+              alive = connected = naming is not None
+          elif check and not naming.isAlive():
+            alive = False
+            self._rtcout.RTC_INFO("Name server: %s (%s) disappeared.",
+                                  (ns.nsname, ns.method))
+          if alive:
+            for name in unbinds:
+              naming.unbindObject(name)
+        except:
+          self._rtcout.RTC_INFO("Name server: %s (%s) disappeared.",
+                                (ns.nsname, ns.method))
+          alive = False
+        self._namesCond.acquire()
+
+        if alive and connected:
+          ns.ns = naming
+          ns.bound = {}
+          ns.failures = 0
+        if alive and (pending or connected):
+          alive = self.bindChangedNames(ns, naming)
+
+        if not alive:
+          if ns.ns is not None:
+            # disappeared: retry at the next update
+            ns.ns = None
+            ns.bound = {}
+            ns.failures = 0
+            ns.nextRetry = 0.0
+          elif check:
+            ns.failures += 1
+            interval = min(self._retryInterval[0] * (2 ** (ns.failures - 1)),
+                           self._maxRetryInterval[0])
+            ns.nextRetry = time.time() + interval
+            self._rtcout.RTC_DEBUG("Next retry to %s/%s in %f [s]",
+                                   (ns.method, ns.nsname, interval))
+          ns.pending = False
+          ns.unbinds = []
+    finally:
+      ns.busy = False
+      self._namesCond.notifyAll()
+      self._namesCond.release()
+      # the worker is shared with other invocations
+      if timeout > 0:
+        omniORB.setClientThreadCallTimeout(0)
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief NameServer ˥ХɤƤʤ̾Хɤ
+  #
+  # _namesMutex ֤ǸƤӡХϥå롣
+  # Хɤ˼Ԥ̾ϼƱǺ٥Хɤ롣
+  #
+  # @param self
+  # @param ns NameServer
+  # @param naming NameServer ѥ֥
+  #
+  # @return NameServer ¸Ƥ True
+  #
+  # @else
+  #
+  # @brief Bind the names not bound to the NameServer
+  #
+  # Called with _namesMutex acquired, and the lock is released while
+  # binding.  Names that failed are bound again in the next
+  # synchronization.
+  #
+  # @param self
+  # @param ns NameServer
+  # @param naming Object managing the NameServer
+  #
+  # @return True if the NameServer is alive
+  #
+  # @endif
+  def bindChangedNames(self, ns, naming):
+    objects = [(comp.name, comp.rtobj) for comp in self._compNames] + \
+        [(mgr.name, mgr.mgr) for mgr in self._mgrNames]
+    objects = [(name, obj) for name, obj in objects
+               if ns.bound.get(name) is not obj]
+    if not objects:
+      return True
+
+    bound = []
+    alive = True
+    self._namesCond.release()
+    try:
+      for name, obj in objects:
+        try:
+          naming.bindObject(name, obj)
+          bound.append((name, obj))
+        except:
+          if not naming.isAlive():
+            self._rtcout.RTC_INFO("Name server: %s (%s) disappeared.",
+                                  (ns.nsname, ns.method))
+            alive = False
+            break
+    finally:
+      self._namesCond.acquire()
+
+    if alive:
+      for name, obj in bound:
+        # unbound while binding
+        if name in ns.unbinds:
+          continue
+        ns.bound[name] = obj
+    return alive
+
+
   # Name Servers' method/name and object
   ##
   # @if jp
@@ -613,6 +1002,18 @@ class NamingManager:
       self.method = meth
       self.nsname = name
       self.ns     = naming
+      # names bound to the NameServer and their objects
+      self.bound     = {}
+      # names to be unbound
+      self.unbinds   = []
+      # liveness check or reconnection requested
+      self.check     = False
+      # binding of changed names requested
+      self.pending   = False
+      # synchronization scheduled or running in the thread pool
+      self.busy      = False
+      self.failures  = 0
+      self.nextRetry = 0.0
 
 
   # Components' name and object
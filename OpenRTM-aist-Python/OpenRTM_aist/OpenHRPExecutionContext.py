@@ -25,8 +25,7 @@ class OpenHRPExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
 
 
     def tick(self):
-        for comp in self._comps:
-            comp._sm.worker()
+        self.invokeWorker()
 
     def svc(self):
         return 0
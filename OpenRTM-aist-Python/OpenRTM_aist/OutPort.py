@@ -205,9 +205,21 @@ class OutPort(OpenRTM_aist.OutPortBase):
       
     result = True
 
+    # The data is marshalled once per endian and the CDR data is
+    # shared among the connectors.
+    cdr_data = {}
     guard = OpenRTM_aist.ScopedLock(self._connector_mutex)
     for con in self._connectors:
-      ret = con.write(value)
+      if isinstance(con, OpenRTM_aist.OutPortConnector) and \
+            con.endian() is not None:
+        endian = con.endian()
+        if not cdr_data.has_key(endian):
+          cdr_data[endian] = cdrMarshal(OpenRTM_aist.toTypeCode(value),
+                                        value, endian)
+        ret = con.writeCdr(cdr_data[endian])
+      else:
+        ret = con.write(value)
+
       if ret != self.PORT_OK:
         result = False
         if ret == self.CONNECTION_LOST:
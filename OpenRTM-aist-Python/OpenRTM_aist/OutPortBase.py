@@ -878,9 +878,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
     # prop: [port.outport].
     prop = copy.deepcopy(self._properties)
 
-    conn_prop = OpenRTM_aist.Properties()
-
-    OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
+    conn_prop = self.getPropertiesView(cprof).toProperties()
     prop.mergeProperties(conn_prop.getNode("dataport")) # marge ConnectorProfile
 
     """
@@ -941,8 +939,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
     # prop: [port.outport].
     prop = copy.deepcopy(self._properties)
 
-    conn_prop = OpenRTM_aist.Properties()
-    OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
+    conn_prop = self.getPropertiesView(cprof).toProperties()
     prop.mergeProperties(conn_prop.getNode("dataport")) # marge ConnectorProfile
     """
     #  marge ConnectorProfile for buffer property.
@@ -1178,7 +1175,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
       self._rtcout.RTC_DEBUG("consumer created")
       consumer.init(prop.getNode("consumer"))
 
-      if not consumer.subscribeInterface(cprof.properties):
+      if not consumer.subscribeInterface(self.getPropertiesView(cprof)):
         self._rtcout.RTC_ERROR("interface subscription failed.")
         OpenRTM_aist.InPortConsumerFactory.instance().deleteObject(consumer)
         return 0
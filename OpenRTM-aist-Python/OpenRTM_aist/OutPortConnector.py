@@ -18,6 +18,8 @@
 #     All rights reserved.
 #
 
+from omniORB import *
+
 import OpenRTM_aist
 import RTC
 
@@ -124,6 +126,92 @@ class OutPortConnector(OpenRTM_aist.ConnectorBase):
     return self.profile().name
 
 
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # Υͥ CDR ޡ󥰤Ѥ륨ǥ֤
+  #
+  # @return True: little endian, False: big endian,
+  #         None: ݡȤʤǥ
+  #
+  # @else
+  # @brief Getting endian
+  #
+  # This operation returns the endian used by this connector for CDR
+  # marshalling.
+  #
+  # @return True: little endian, False: big endian,
+  #         None: unsupported endian
+  #
+  # @endif
+  #
+  # bool endian();
+  def endian(self):
+    return self._endian
+
+
+  ##
+  # @if jp
+  # @brief ǡν񤭹
+  #
+  # ǡ򤳤ΥͥΥǥ CDR ˥ޡ󥰤
+  # writeCdr() Ϥ
+  #
+  # @param data 񤭹ǡ
+  # @return ReturnCode
+  #
+  # @else
+  # @brief Writing data
+  #
+  # This operation marshals the data into CDR with the endian of this
+  # connector and passes it to writeCdr().
+  #
+  # @param data Data to be written
+  # @return ReturnCode
+  #
+  # @endif
+  #
+  # template<class DataType>
+  # virtual ReturnCode write(const DataType& data);
+  def write(self, data):
+    # data -> (conversion) -> CDR stream
+    if self._endian is None:
+      self._rtcout.RTC_ERROR("write(): endian %s is not support.",self._endian)
+      return self.UNKNOWN_ERROR
+
+    cdr_data = cdrMarshal(OpenRTM_aist.toTypeCode(data), data, self._endian)
+    return self.writeCdr(cdr_data)
+
+
+  ##
+  # @if jp
+  # @brief ޡ󥰺Ѥߥǡν񤭹
+  #
+  # CDR ˥ޡ󥰺ѤߤΥǡ񤭹ࡣOutPort Ʊǥ
+  # Υ֤ͥǰĤ CDR ǡͭ뤿ᡢΥڥ졼
+  # μϥǡѹƤϤʤʤ
+  #
+  # @param cdr_data CDR ǡ
+  # @return ReturnCode
+  #
+  # @else
+  # @brief Writing marshalled data
+  #
+  # This operation writes data already marshalled into CDR. Since
+  # OutPort shares one CDR data among the connectors with the same
+  # endian, implementations must not modify the data.
+  #
+  # @param cdr_data CDR data
+  # @return ReturnCode
+  #
+  # @endif
+  #
+  # virtual ReturnCode write(const cdrMemoryStream& data);
+  def writeCdr(self, cdr_data):
+    pass
+
+
   # void setConnectorInfo(ConnectorInfo info);
   def setConnectorInfo(self, info):
     self._profile = info
@@ -179,15 +179,7 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
   # @endif
   #
   # virtual ReturnCode write(const cdrMemoryStream& data);
-  def write(self, data):
-    # data -> (conversion) -> CDR stream
-    cdr_data = None
-    if self._endian is not None:
-      cdr_data = cdrMarshal(any.to_any(data).typecode(), data, self._endian)
-    else:
-      self._rtcout.RTC_ERROR("write(): endian %s is not support.",self._endian)
-      return self.UNKNOWN_ERROR
-    
+  def writeCdr(self, cdr_data):
     self._buffer.write(cdr_data)
     return self.PORT_OK
 
@@ -229,19 +229,9 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
   #
   # @endif
   #
-  # template<class DataType>
-  # virtual ReturnCode write(const DataType& data);
-  def write(self, data):
-    self._rtcout.RTC_TRACE("write()")
-
-    # data -> (conversion) -> CDR stream
-    cdr_data = None
-    if self._endian is not None:
-      cdr_data = cdrMarshal(any.to_any(data).typecode(), data, self._endian)
-    else:
-      self._rtcout.RTC_ERROR("write(): endian %s is not support.",self._endian)
-      return self.UNKNOWN_ERROR
-
+  # virtual ReturnCode write(const cdrMemoryStream& data);
+  def writeCdr(self, cdr_data):
+    self._rtcout.RTC_TRACE("writeCdr()")
     return self._publisher.write(cdr_data, 0, 0)
 
 
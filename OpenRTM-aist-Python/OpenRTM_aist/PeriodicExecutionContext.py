@@ -26,6 +26,20 @@ import RTC
 
 DEFAULT_PERIOD = 0.000001
 
+##
+# @if jp
+# @brief ñĴûμؿ
+#
+# time.monotonic() ѤǤʤ time.time() Ѥ롣
+#
+# @else
+# @brief Function returning monotonic time
+#
+# time.time() is used if time.monotonic() is not available.
+#
+# @endif
+_monotonic = getattr(time, "monotonic", time.time)
+
 ##
 # @if jp
 # @class PeriodicExecutionContext
@@ -377,6 +391,228 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     self._profile = RTC.ExecutionContextProfile(RTC.PERIODIC, rate_, None, [], [])
     self._ref = self._this()
 
+    self._deadline = False
+    self._catchup = True
+    self._overrun = 0
+    self._measure = False
+    self.init(OpenRTM_aist.Manager.instance().getConfig().getNode("exec_cxt.periodic"))
+
+    return
+
+
+  ##
+  # @if jp
+  # @brief 塼
+  #
+  # ʲΥץѥƥɤ߹ࡣrtc.conf Ǥ exec_cxt.periodic.
+  # ʲ˻ꤹ롣
+  #
+  # - scheduling: Ԥ
+  #     sleep: ݡͥȤμ¹Ը˼ʬ sleep  (ǥե)
+  #     deadline: ñĴûŪڤޤ sleep 롣
+  #       ¹Ի֤ˤäƼʤ
+  # - overrun_policy: deadline ˼¹Ԥڤۤư
+  #     catchup: ٤줿Ԥ³Ƽ¹Ԥ (ǥե)
+  #     skip: ٤줿ФڤޤԤ
+  # - measure: YES ξ硢ݡͥȤȤμ¹Ի֤¬롣
+  #     ǥեȤ NO
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the scheduling mode
+  #
+  # The following properties are read.  In rtc.conf they are given
+  # under exec_cxt.periodic.
+  #
+  # - scheduling: How the period is waited for.
+  #     sleep: Sleep for one period after executing all components
+  #       (default)
+  #     deadline: Sleep until an absolute deadline on monotonic time.
+  #       The period does not drift with the execution time.
+  # - overrun_policy: What deadline mode does when execution passes the
+  #     next deadline.
+  #     catchup: Execute the late ticks back to back (default)
+  #     skip: Drop the late ticks and wait for the next deadline
+  # - measure: If YES, the execution time of each component is
+  #     measured.  The default is NO.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  #
+  # void init(coil::Properties& props);
+  def init(self, props):
+    self._rtcout.RTC_TRACE("init()")
+
+    scheduling = OpenRTM_aist.normalize([props.getProperty("scheduling",
+                                                           "sleep")])
+    if scheduling in ("sleep", "deadline"):
+      self._deadline = (scheduling == "deadline")
+    else:
+      self._rtcout.RTC_ERROR("invalid scheduling value: %s", scheduling)
+      self._deadline = False
+
+    policy = OpenRTM_aist.normalize([props.getProperty("overrun_policy",
+                                                       "catchup")])
+    if policy in ("catchup", "skip"):
+      self._catchup = (policy == "catchup")
+    else:
+      self._rtcout.RTC_ERROR("invalid overrun_policy value: %s", policy)
+      self._catchup = True
+
+    self._rtcout.RTC_DEBUG("scheduling: %s, overrun_policy: %s",
+                           (scheduling, policy))
+
+    self.executionMeasure(OpenRTM_aist.toBool(props.getProperty("measure"),
+                                              "YES", "NO", False))
+    return
+
+
+  ##
+  # @if jp
+  # @brief Сβ
+  #
+  # deadline ˤơ¹Ԥμڤ֤ۤ
+  #
+  # @param self
+  #
+  # @return Сβ
+  #
+  # @else
+  # @brief Getting the number of overruns
+  #
+  # Returns how many times the execution passed the deadline of the
+  # next period in deadline mode.
+  #
+  # @param self
+  #
+  # @return The number of overruns
+  #
+  # @endif
+  def getOverrunCount(self):
+    return self._overrun
+
+
+  ##
+  # @if jp
+  # @brief ¹Իַ¬ͭ/̵ꤹ
+  #
+  # @param self
+  # @param value True ξ硢ݡͥȤȤμ¹Ի֤¬
+  #
+  # @else
+  # @brief Enable/disable the execution time measurement
+  #
+  # @param self
+  # @param value If True, the execution time of each component is
+  #              measured
+  #
+  # @endif
+  def executionMeasure(self, value):
+    self._measure = value
+    return
+
+
+  ##
+  # @if jp
+  # @brief ݡͥȤȤμ¹Իפ
+  #
+  # @param self
+  #
+  # @return 󥹥̾򥭡ExecutionStatistics ͤȤ뼭
+  #
+  # @else
+  # @brief Get the execution time statistics of each component
+  #
+  # @param self
+  #
+  # @return Dictionary of ExecutionStatistics keyed by instance name
+  #
+  # @endif
+  def getComponentExecStat(self):
+    stats = {}
+    for comp in self._comps:
+      stats[comp.getName()] = comp._stat
+    return stats
+
+
+  ##
+  # @if jp
+  # @brief ¹ԻפץѥƥȤƼ
+  #
+  # <󥹥̾>.<̾> ηݡͥȤפꤷ
+  # ץѥƥ֤̾ ExecutionStatistics.toProperties() 򻲾ȡ
+  # ¬ͭʾ硢get_profile() ϤƤץե
+  # properties ꤹ롣
+  #
+  # @param self
+  #
+  # @return ¹ԻפΥץѥƥ
+  #
+  # @else
+  # @brief Get the execution time statistics as properties
+  #
+  # Returns properties holding the statistics of all the components as
+  # <instance name>.<statistic>.  See ExecutionStatistics.toProperties()
+  # for the statistics.  While the measurement is enabled,
+  # get_profile() sets them to the properties of the profile.
+  #
+  # @param self
+  #
+  # @return Properties of the execution time statistics
+  #
+  # @endif
+  def getExecStatProperties(self):
+    prop = OpenRTM_aist.Properties()
+    for comp in self._comps:
+      comp._stat.toProperties(prop.getNode(comp.getName()))
+    return prop
+
+
+  ##
+  # @if jp
+  # @brief ¹ԻפꥻåȤ
+  # @else
+  # @brief Reset the execution time statistics
+  # @endif
+  def resetExecStat(self):
+    for comp in self._comps:
+      comp._stat.reset()
+    self._overrun = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief ݡͥȤξܤ1¹Ԥ
+  #
+  # ¬ͭʾϳƥݡͥȤμ¹Ի֤Ͽ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Execute the state machine of all the components once
+  #
+  # The execution time of each component is recorded while the
+  # measurement is enabled.
+  #
+  # @param self
+  #
+  # @endif
+  def invokeWorker(self):
+    if not self._measure:
+      for comp in self._comps:
+        comp._sm.worker()
+      return
+
+    period = float(self._usec)/1000000.0
+    for comp in self._comps:
+      start = _monotonic()
+      comp._sm.worker()
+      comp._stat.update(_monotonic() - start, period)
     return
 
 
@@ -428,6 +664,9 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
   # @endif
   def svc(self):
     self._rtcout.RTC_TRACE("svc()")
+    if self._deadline:
+      return self.svcDeadline()
+
     flag = True
 
     while flag:
@@ -436,8 +675,7 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
         self._worker._cond.wait()
 
       if self._worker._running:
-        for comp in self._comps:
-          comp._sm.worker()
+        self.invokeWorker()
 
       self._worker._cond.release()
 
@@ -450,6 +688,65 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     return 0
 
 
+  ##
+  # @if jp
+  # @brief deadline Υƥӥƥåɴؿ
+  #
+  # ڤñĴûǼĿʤᡢλޤ sleep 롣
+  # ¹ԤڤۤϥСȤƿ
+  # overrun_policy ˽ä٤줿³Ƽ¹Ԥ뤫Ф
+  # Ԥä郎äϡڤ򸽺߻˹碌ľ
+  #
+  # @param self
+  #
+  # @else
+  # @brief Activity thread function for deadline mode
+  #
+  # The deadline is advanced by one period on monotonic time and the
+  # thread sleeps until it.  When execution passes the next deadline it
+  # is counted as an overrun, and the late ticks are either executed
+  # back to back or dropped according to overrun_policy.  The deadline
+  # is resynchronized to the current time after waiting while stopped
+  # or when the clock goes backwards.
+  #
+  # @endif
+  def svcDeadline(self):
+    self._rtcout.RTC_TRACE("svcDeadline()")
+    flag = True
+    deadline = _monotonic()
+
+    while flag:
+      self._worker._cond.acquire()
+      if not self._worker._running:
+        while not self._worker._running:
+          self._worker._cond.wait()
+        deadline = _monotonic()
+
+      if self._worker._running:
+        self.invokeWorker()
+
+      self._worker._cond.release()
+
+      if not self._nowait:
+        period = float(self._usec)/1000000.0
+        deadline += period
+        now = _monotonic()
+
+        if now > deadline:
+          self._overrun += 1
+          if not self._catchup:
+            deadline += (int((now - deadline) / period) + 1) * period
+        elif deadline - now > period:
+          deadline = now + period
+
+        if deadline > now:
+          time.sleep(deadline - now)
+
+      flag = self._running
+
+    return 0
+
+
   ##
   # @if jp
   # @brief ExecutionContext ѤΥåɼ¹Դؿ
@@ -595,6 +892,8 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     self._running = False
     self._worker._cond.acquire()
     self._worker._running = False
+    # wakes up the threads waiting for a tick in ExtTrigExecutionContext
+    self._worker._cond.notifyAll()
     self._worker._cond.release()
 
     for comp in self._comps:
@@ -970,6 +1269,9 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
   # @endif
   def get_profile(self):
     self._rtcout.RTC_TRACE("get_profile()")
+    if self._measure:
+      OpenRTM_aist.NVUtil.copyFromProperties(self._profile.properties,
+                                             self.getExecStatProperties())
     return self._profile
 
 
@@ -996,6 +1298,16 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
       else:
         self._ref = comp._ref
         self._sm  = PeriodicExecutionContext.DFP(comp._sm._obj,comp._sm.ec_id)
+      self._stat = OpenRTM_aist.ExecutionStatistics()
+      self._name = None
+
+    def getName(self):
+      if self._name is None:
+        try:
+          self._name = self._ref.get_component_profile().instance_name
+        except:
+          return "ec_id" + str(self._sm.ec_id)
+      return self._name
 
   ##
   # @if jp
@@ -0,0 +1,456 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+
+##
+# @file PooledPeriodicTask.py
+# @brief Periodic task executed by a shared worker thread pool
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import threading
+import time
+import traceback
+import heapq
+import collections
+import OpenRTM_aist
+
+
+_monotonic = getattr(time, "monotonic", time.time)
+
+
+##
+# @if jp
+# @class PeriodicTaskPool
+# @brief ѥåɥס
+#
+# ץǶͭΥåɤ PooledPeriodicTask 
+# ¹Ԥ롣¹Բǽˤʤäϼ¹ԥ塼ˡμԤĥ
+# ϥޡΥҡפ֤졢ϥ塼Ƭ˼¹Ԥ롣
+#  publisher.pool.size ǻꤹ롣
+#
+# @since 1.0.0
+#
+# @else
+# @class PeriodicTaskPool
+# @brief Worker thread pool for periodic tasks
+#
+# Runs PooledPeriodicTask objects on a fixed number of worker threads
+# shared in the process.  Ready tasks are put into the run queue, and
+# tasks waiting for their next period into the timer heap, and the
+# workers run tasks from the head of the queue.  The number of workers
+# is given by the configuration publisher.pool.size.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class PeriodicTaskPool:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  # @param size åɿ
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param size Number of worker threads
+  #
+  # @endif
+  #
+  def __init__(self, size):
+    self._rtcout  = OpenRTM_aist.Manager.instance().getLogbuf("PeriodicTaskPool")
+    self._cond    = threading.Condition()
+    self._queue   = collections.deque()
+    self._timers  = []
+    self._seq     = 0
+    self._threads = []
+    for i in range(max(size, 1)):
+      thread = threading.Thread(target=self.svc)
+      thread.setDaemon(True)
+      thread.start()
+      self._threads.append(thread)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥹥󥹼
+  #
+  # θƤӽФǥס롣
+  #
+  # @return PeriodicTaskPool Υ󥹥
+  #
+  # @else
+  # @brief Get instance
+  #
+  # The first call creates the pool.
+  #
+  # @return Instance of PeriodicTaskPool
+  #
+  # @endif
+  #
+  def instance():
+    global periodictaskpool
+
+    if periodictaskpool is None:
+      guard = OpenRTM_aist.ScopedLock(periodictaskpool_mutex)
+      if periodictaskpool is None:
+        size = [4]
+        conf = OpenRTM_aist.Manager.instance().getConfig()
+        OpenRTM_aist.stringTo(size, conf.getProperty("publisher.pool.size"))
+        periodictaskpool = PeriodicTaskPool(size[0])
+
+    return periodictaskpool
+
+  instance = staticmethod(instance)
+
+
+  ##
+  # @if jp
+  # @brief åɿ
+  # @else
+  # @brief Get the number of worker threads
+  # @endif
+  #
+  def size(self):
+    return len(self._threads)
+
+
+  ##
+  # @if jp
+  # @brief ¹ԥ塼
+  # @else
+  # @brief Put a task into the run queue
+  # @endif
+  #
+  def schedule(self, task):
+    self._cond.acquire()
+    self._queue.append(task)
+    self._cond.notify()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ˥¹ԥ塼
+  #
+  # @param self
+  # @param task 
+  # @param tm  (time.monotonic() ޤ time.time() )
+  #
+  # @else
+  # @brief Put a task into the run queue at the given time
+  #
+  # @param self
+  # @param task Task
+  # @param tm Time (value of time.monotonic() or time.time())
+  #
+  # @endif
+  #
+  def scheduleAt(self, task, tm):
+    self._cond.acquire()
+    self._seq += 1
+    heapq.heappush(self._timers, (tm, self._seq, task))
+    self._cond.notify()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief åɤν
+  # @else
+  # @brief Processing of the worker threads
+  # @endif
+  #
+  def svc(self):
+    while True:
+      self._cond.acquire()
+      while True:
+        now = _monotonic()
+        while self._timers and self._timers[0][0] <= now:
+          self._queue.append(heapq.heappop(self._timers)[2])
+        if self._queue:
+          task = self._queue.popleft()
+          break
+        if self._timers:
+          self._cond.wait(self._timers[0][0] - now)
+        else:
+          self._cond.wait()
+      self._cond.release()
+
+      # an exception must not terminate the worker
+      try:
+        task.run()
+      except:
+        self._rtcout.RTC_ERROR("task.run() failed:\n%s", traceback.format_exc())
+    return
+
+
+periodictaskpool = None
+periodictaskpool_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @class PooledPeriodicTask
+# @brief åɥסǼ¹Ԥ
+#
+# PeriodicTask Ʊ󥿡եĤѤΥåɤ
+# PeriodicTaskPool ΥåɤǼ¹Ԥ롣signal() β
+# ؿ¹ԤڥɤƤʤмȤ˼¹Ԥ롣Ʊ
+# ʣΥƱ˼¹Ԥ뤳ȤϤʤ
+#
+# @since 1.0.0
+#
+# @else
+# @class PooledPeriodicTask
+# @brief Periodic task executed by a worker thread pool
+#
+# It has the same interface as PeriodicTask, but has no dedicated
+# thread and is executed by the worker threads of PeriodicTaskPool.
+# The function is executed as many times as signal() is called, and
+# periodically unless suspended.  The same task is never executed by
+# several workers at a time.
+#
+# @since 1.0.0
+#
+# @endif
+#
+class PooledPeriodicTask(OpenRTM_aist.PeriodicTask):
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self, pool=None):
+    OpenRTM_aist.PeriodicTask.__init__(self)
+    self._rtcout  = OpenRTM_aist.Manager.instance().getLogbuf("PooledPeriodicTask")
+    self._pool    = pool
+    self._cond    = threading.Condition()
+    self._pending = 0
+    self._queued  = False
+    self._runner  = None
+    self._next    = 0.0
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ԥ򳫻Ϥ
+  # @else
+  # @brief Starting the task
+  # @endif
+  #
+  def activate(self):
+    self._cond.acquire()
+    if self._func and not self._alive.value:
+      if self._pool is None:
+        self._pool = PeriodicTaskPool.instance()
+      self._alive.value = True
+      self._next = _monotonic()
+      self.dispatch()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ԥλ
+  # @else
+  # @brief Finalizing the task
+  # @endif
+  #
+  def finalize(self):
+    self._cond.acquire()
+    self._alive.value = False
+    self._suspend.suspend = False
+    self._pending = 0
+    self._cond.notifyAll()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹ԤǤ
+  # @else
+  # @brief Suspending the task
+  # @endif
+  #
+  def suspend(self):
+    self._cond.acquire()
+    self._suspend.suspend = True
+    self._cond.release()
+    return 0
+
+
+  ##
+  # @if jp
+  # @brief ǤƤ륿Ƴ
+  # @else
+  # @brief Resuming the suspended task
+  # @endif
+  #
+  def resume(self):
+    self._periodTime.reset()
+    self._execTime.reset()
+    self._cond.acquire()
+    self._suspend.suspend = False
+    self._next = _monotonic()
+    self.dispatch()
+    self._cond.release()
+    return 0
+
+
+  ##
+  # @if jp
+  # @brief ǤƤ륿1¹Ԥ
+  # @else
+  # @brief Executing the suspended task one tick
+  # @endif
+  #
+  def signal(self):
+    self._cond.acquire()
+    if self._alive.value:
+      self._pending += 1
+      self.dispatch()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹δؿνλԤ
+  #
+  # ؿ¹ΥåɤƤФ줿Ԥʤ
+  #
+  # @else
+  # @brief Waiting for the running function to finish
+  #
+  # Does not wait if called from the worker thread running the function.
+  #
+  # @endif
+  #
+  def wait(self):
+    self._cond.acquire()
+    while self._runner is not None and \
+          self._runner is not threading.currentThread():
+      self._cond.wait()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief åɤƤФ¹Դؿ
+  #
+  # signal() αƤФ1ʬ򡢥ڥɤƤʤ
+  # ʬ¹Ԥμ¹Ԥͽ󤹤롣ؿ㳰Ф
+  # ˽ϤƱͤ˼μ¹Ԥͽ󤹤롣
+  #
+  # @else
+  # @brief Execution function called by a worker thread
+  #
+  # Executes one pending signal() or, unless suspended, one period, and
+  # schedules the next execution.  An exception raised by the function
+  # is logged, and the next execution is scheduled as well.
+  #
+  # @endif
+  #
+  def run(self):
+    self._cond.acquire()
+    if not self._alive.value:
+      self._queued = False
+      self._cond.notifyAll()
+      self._cond.release()
+      return
+
+    if self._pending > 0:
+      self._pending -= 1
+    elif self._suspend.suspend:
+      self._queued = False
+      self._cond.release()
+      return
+    elif not self._nowait:
+      self._next += self._period.toDouble()
+    self._runner = threading.currentThread()
+    self._cond.release()
+
+    try:
+      if self._periodMeasure:
+        self._periodTime.tack()
+        self._periodTime.tick()
+      if self._execMeasure:
+        self._execTime.tick()
+      self._func()
+      if self._execMeasure:
+        self._execTime.tack()
+      self.updateExecStat()
+      self.updatePeriodStat()
+    except:
+      self._rtcout.RTC_ERROR("task function failed:\n%s", traceback.format_exc())
+    finally:
+      self._cond.acquire()
+      self._runner = None
+      self._queued = False
+      self.dispatch()
+      self._cond.notifyAll()
+      self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief μ¹Ԥͽ󤹤
+  #
+  # _cond ֤ǸƤ֡
+  #
+  # @else
+  # @brief Schedule the next execution
+  #
+  # Called with _cond acquired.
+  #
+  # @endif
+  #
+  def dispatch(self):
+    if not self._alive.value or self._queued:
+      return
+
+    if self._pending > 0 or (not self._suspend.suspend and self._nowait):
+      self._queued = True
+      self._pool.schedule(self)
+    elif not self._suspend.suspend:
+      now = _monotonic()
+      if self._next < now - self._period.toDouble():
+        # too late, skip the missed periods
+        self._next = now
+      self._queued = True
+      self._pool.scheduleAt(self, self._next)
+    return
+
+
+
+def PooledPeriodicTaskInit():
+  OpenRTM_aist.PeriodicTaskFactory.instance().addFactory("pool",
+                                                         OpenRTM_aist.PooledPeriodicTask,
+                                                         OpenRTM_aist.Delete)
@@ -390,6 +390,28 @@ class PortAdmin:
     return
 
 
+  ##
+  # @if jp
+  # @brief Ƥ Port Υͥ¸ǧ򳫻Ϥ
+  #
+  #  Port  PortBase.probeConnectors() ƤӽФǧδλ
+  # Ԥʤ
+  #
+  # @else
+  # @brief Start liveness checks of the connectors of all Ports
+  #
+  # Calls PortBase.probeConnectors() of each Port.  It does not wait for
+  # the checks to finish.
+  #
+  # @endif
+  def probeConnectors(self):
+    ports = self._portServants.getObjects()
+    for port in ports:
+      port.probeConnectors()
+
+    return
+
+
   ##
   # @if jp
   # @brief Ƥ Port Υ󥿡ե activates 
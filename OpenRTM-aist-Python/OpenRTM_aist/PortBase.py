@@ -15,13 +15,62 @@
 #     All rights reserved.
 
 
+import sys
 import threading
 import copy
+import time
+
+import omniORB
+from omniORB import CORBA
 
 import OpenRTM_aist
 import RTC, RTC__POA
 
 
+_monotonic = getattr(time, "monotonic", time.time)
+
+
+##
+# @if jp
+# @brief ¸ǧѤΥåɥס
+#
+# ͥ¸ǧϡ¾ƱƤӽФȶͭʤѤ
+# PeriodicTaskPool Ǽ¹Ԥ롣ʤݡȤγǧ¾ν
+# ˸ʤ褦ˤ뤿Ǥ롣ǽθƤӽФ
+# rtc.conf  port.liveness.pool.size ǻꤹ롣
+#
+# @return PeriodicTaskPool Υ󥹥
+#
+# @else
+# @brief Get the thread pool for liveness checks
+#
+# Liveness checks of connectors are executed by a dedicated
+# PeriodicTaskPool which is not shared with other asynchronous
+# invocations, so that checks of unresponsive ports do not hold up
+# other processing.  It is created by the first call, and the number of
+# workers is given by port.liveness.pool.size in rtc.conf.
+#
+# @return Instance of PeriodicTaskPool
+#
+# @endif
+#
+def livenessProbePool():
+  global livenessprobepool
+
+  if livenessprobepool is None:
+    guard = OpenRTM_aist.ScopedLock(livenessprobepool_mutex)
+    if livenessprobepool is None:
+      size = [4]
+      conf = OpenRTM_aist.Manager.instance().getConfig()
+      OpenRTM_aist.stringTo(size, conf.getProperty("port.liveness.pool.size"))
+      livenessprobepool = OpenRTM_aist.PeriodicTaskPool(size[0])
+
+  return livenessprobepool
+
+
+livenessprobepool = None
+livenessprobepool_mutex = threading.RLock()
+
 
 ##
 # @if jp
@@ -158,7 +207,18 @@ class PortBase(RTC__POA.PortService):
     self._profile.owner = RTC.RTObject._nil
     self._profile_mutex = threading.RLock()
     self._connection_mutex = threading.RLock()
+    self._propertiesView = None
     self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf(name)
+    self._liveness = {}
+    self._probes = {}
+    self._liveness_mutex = threading.RLock()
+    conf = OpenRTM_aist.Manager.instance().getConfig()
+    timeout = [1.0]
+    OpenRTM_aist.stringTo(timeout, conf.getProperty("port.liveness.timeout"))
+    self._livenessTimeout = timeout[0]
+    ttl = [1.0]
+    OpenRTM_aist.stringTo(ttl, conf.getProperty("port.liveness.ttl"))
+    self._livenessTTL = ttl[0]
     self._onPublishInterfaces = None
     self._onSubscribeInterfaces = None
     self._onConnected = None
@@ -673,6 +733,7 @@ class PortBase(RTC__POA.PortService):
     # publish owned interface information to the ConnectorProfile
     retval = [RTC.RTC_OK for i in range(3)]
 
+    self._propertiesView = OpenRTM_aist.NVUtil.NVListView(connector_profile.properties)
     retval[0] = self.publishInterfaces(connector_profile)
     if retval[0] != RTC.RTC_OK:
       self._rtcout.RTC_ERROR("publishInterfaces() in notify_connect() failed.")
@@ -691,6 +752,7 @@ class PortBase(RTC__POA.PortService):
     retval[2] = self.subscribeInterfaces(connector_profile)
     if retval[2] != RTC.RTC_OK:
       self._rtcout.RTC_ERROR("subscribeInterfaces() in notify_connect() failed.")
+    self._propertiesView = None
       #self.notify_disconnect(connector_profile.connector_id)
 
     self._rtcout.RTC_PARANOID("%d connectors are existing",
@@ -1767,6 +1829,7 @@ class PortBase(RTC__POA.PortService):
   # @brief UUID
   #
   # Υڥ졼 UUID 롣
+  #  manager.id_generator.type  ID ˤ롣
   #
   # @param self
   #
@@ -1777,13 +1840,14 @@ class PortBase(RTC__POA.PortService):
   # @brief Get the UUID
   #
   # This operation generates UUID.
+  # The format depends on the ID generator of manager.id_generator.type.
   #
   # @return uuid
   #
   # @endif
   # const std::string getUUID() const;
   def getUUID(self):
-    return str(OpenRTM_aist.uuid1())
+    return OpenRTM_aist.generateId()
 
 
   ##
@@ -1913,6 +1977,50 @@ class PortBase(RTC__POA.PortService):
                                            self.find_conn_id(id_))
 
 
+  ##
+  # @if jp
+  #
+  # @brief ConnectorProfile  properties Υӥ塼
+  #
+  # notify_connect() μ¹ properties Ȥ1Ĥ
+  # NVUtil.NVListView ꡢpublishInterfaces() 
+  # subscribeInterfaces() ޤǤγƽǶͭ롣Τ³δ
+  # ƱǤθ Any ͤμФ1ǺѤࡣʳ
+  # Ͽӥ塼֤
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  #
+  # @return properties  NVUtil.NVListView
+  #
+  # @else
+  #
+  # @brief Get a view of the properties of ConnectorProfile
+  #
+  # While notify_connect() is running, one NVUtil.NVListView is created
+  # per properties and shared by the steps from publishInterfaces() to
+  # subscribeInterfaces().  The search for an element and the extraction
+  # of its value from Any are therefore done once during a connection.
+  # Otherwise a new view is returned.
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  #
+  # @return NVUtil.NVListView of the properties
+  #
+  # @endif
+  def getPropertiesView(self, connector_profile):
+    view = self._propertiesView
+    if view is not None and view.isViewOf(connector_profile.properties):
+      return view
+
+    view = OpenRTM_aist.NVUtil.NVListView(connector_profile.properties)
+    if self._propertiesView is not None:
+      # connectNext() returned a new profile
+      self._propertiesView = view
+    return view
+
+
   ##
   # @if jp
   #
@@ -2154,27 +2262,144 @@ class PortBase(RTC__POA.PortService):
   #
   # @brief ¸ߤʤݡȤdisconnect롣
   #
+  # probeConnectors() ͥ¸ǧ¹ԤƳϤ
+  # port.liveness.timeout [sec] ޤǴλԤġ˽ʤä
+  # ǧϼ¹Ԥ³ʹߤθƤӽФǷ̤Ȥ롣
+  #
   # @else
   #
   # @brief Disconnect ports that doesn't exist. 
   #
+  # Starts the liveness checks of all connectors concurrently by
+  # probeConnectors(), and waits for them until port.liveness.timeout
+  # [sec].  Checks which did not finish in time keep running, and their
+  # results are used by later calls.
+  #
   # @endif
   # void updateConnectors()
   def updateConnectors(self):
+    probes = self.probeConnectors()
+    deadline = _monotonic() + self._livenessTimeout
+    for probe in probes:
+      if not probe.wait(max(deadline - _monotonic(), 0.0)):
+        self._rtcout.RTC_DEBUG("liveness check is still running.")
+
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ͥ¸ǧ򳫻Ϥ롣
+  #
+  # ƥͥˤĤơport.liveness.ttl [sec] γǧ̤
+  # Ȥʤ livenessProbePool()  checkPorts() 
+  # ¹Ԥǧ򳫻Ϥ롣Ʊͥγǧ¹Ǥпˤ
+  # Ϥʤ¸ߤʤݡȤޤॳͥϳǧ disconnect
+  # 롣⡼ȸƤӽФδ profile Υåݻʤ
+  #
+  # @param self
+  #
+  # @return ¹γǧ(Async_t)Υꥹ
+  #
+  # @else
+  #
+  # @brief Start liveness checks of connectors
+  #
+  # For each connector, the result of the check is used if it is newer
+  # than port.liveness.ttl [sec].  Otherwise a check which executes
+  # checkPorts() in livenessProbePool() is started,
+  # unless one is already running for the connector.  Connectors
+  # including ports that do not exist are disconnected in the checks.
+  # The profile lock is not held during remote invocations.
+  #
+  # @param self
+  #
+  # @return List of running checks (Async_t)
+  #
+  # @endif
+  def probeConnectors(self):
     guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
+    targets = [(cprof.connector_id, cprof.ports)
+               for cprof in self._profile.connector_profiles]
+    del guard
     
-    connector_ids = []
-    clist = self._profile.connector_profiles
+    now = _monotonic()
+    probes = []
+    guard = OpenRTM_aist.ScopedLock(self._liveness_mutex)
+    ids = {}
+    for cid, ports in targets:
+      ids[cid] = None
+      cached = self._liveness.get(cid)
+      if cached is not None and now - cached[0] < self._livenessTTL:
+        continue
+
+      probe = self._probes.get(cid)
+      if probe is None:
+        probe = OpenRTM_aist.Async_tInvoker(self, PortBase.probeConnector,
+                                            cid, ports)
+        self._probes[cid] = probe
+        probe.invoke(livenessProbePool())
+      probes.append(probe)
+
+    # forget connectors which no longer exist
+    for cid in self._liveness.keys():
+      if not ids.has_key(cid):
+        del self._liveness[cid]
+    del guard
+
+    return probes
 
-    for cprof in clist:
-      if not self.checkPorts(cprof.ports):
-        connector_ids.append(cprof.connector_id)
-        self._rtcout.RTC_WARN("Dead connection: %s", cprof.connector_id)
 
-    for cid in connector_ids:
+  ##
+  # @if jp
+  #
+  # @brief ͥ¸ǧ
+  #
+  # livenessProbePool() Ǽ¹Ԥ졢̤Ͽ롣
+  # ¸ߤʤݡȤХͥ disconnect 롣Υåɤ
+  # ⡼ȸƤӽФ port.liveness.timeout [sec] ǥॢȤ롣
+  #
+  # @param self
+  # @param args (ͥID, ݡȤΥꥹ)
+  #
+  # @return true:¸ߤ,false:¸ߤʤ
+  #
+  # @else
+  #
+  # @brief Liveness check of a connector
+  #
+  # Executed in livenessProbePool(), and records the result.  The
+  # connector is disconnected if a port does not exist.  Remote
+  # invocations from this thread time out in port.liveness.timeout
+  # [sec].
+  #
+  # @param self
+  # @param args (connector ID, list of ports)
+  #
+  # @return true:existent,false:non existent
+  #
+  # @endif
+  def probeConnector(self, args):
+    cid, ports = args
+    # the workers of livenessProbePool() run only the checks, so the
+    # timeout for the thread bounds checkPorts() and disconnect() here
+    timeout = int(self._livenessTimeout * 1000)
+    if timeout > 0:
+      omniORB.setClientThreadCallTimeout(timeout)
+    alive = self.checkPorts(ports)
+
+    guard = OpenRTM_aist.ScopedLock(self._liveness_mutex)
+    self._liveness[cid] = (_monotonic(), alive)
+    if self._probes.has_key(cid):
+      del self._probes[cid]
+    del guard
+
+    if not alive:
+      self._rtcout.RTC_WARN("Dead connection: %s", cid)
       self.disconnect(cid)
 
-    return
+    return alive
 
 
   ##
@@ -2182,6 +2407,8 @@ class PortBase(RTC__POA.PortService):
   #
   # @brief ݡȤ¸ߤǧ롣
   #
+  # ƤӽФॢȤݡȤ¸ߤΤȤߤʤ
+  #
   # @param ports ǧݡ
   # @return true:¸ߤ,false:¸ߤʤ
   #
@@ -2189,6 +2416,8 @@ class PortBase(RTC__POA.PortService):
   #
   # @brief Existence of ports
   #
+  # Ports whose invocations timed out are regarded as existent.
+  #
   # @param ports Checked ports
   # @return true:existent,false:non existent
   #
@@ -2200,6 +2429,10 @@ class PortBase(RTC__POA.PortService):
         if port._non_existent():
           self._rtcout.RTC_WARN("Dead Port reference detected.")
           return False
+      except CORBA.TRANSIENT:
+        if sys.exc_info()[1].minor != omniORB.TRANSIENT_CallTimedout:
+          return False
+        self._rtcout.RTC_WARN("Port reference did not respond in time.")
       except:
         return False
 
@@ -84,6 +84,9 @@ class Properties:
   """
   """
 
+  _keycache = {}
+  _keycache_size = 1024
+
   ##
   # @if jp
   #
@@ -166,6 +169,7 @@ class Properties:
     self.root = None
     self.empty = ""
     self.leaf = []
+    self._leafmap = {}
 
     # Properties::Properties(const Properties& prop)
     if prop:
@@ -384,9 +388,7 @@ class Properties:
   # @endif
   def getProperty(self, key, default=None):
     if default is None:
-      keys = []
-      #keys = string.split(key, ".")
-      self.split(key, ".", keys)
+      keys = self._splitKey(key)
 
       node = None
       node = self._getNode(keys, 0, self)
@@ -421,9 +423,7 @@ class Properties:
   # @brief Set value as the default value to specified key's property
   # @endif
   def getDefault(self, key):
-    keys = []
-    #keys = string.split(key, ".")
-    self.split(key, ".", keys)
+    keys = self._splitKey(key)
     node = None
     node = self._getNode(keys, 0, self)
     if node:
@@ -462,16 +462,13 @@ class Properties:
   #@endif
   def setProperty(self, key, value=None):
     if value is not None:
-      keys = []
-      #keys = string.split(key, ".")
-      self.split(key, ".", keys)
+      keys = self._splitKey(key)
       curr = self
       for _key in keys:
         next = curr.hasKey(_key)
         if next is None:
           next = OpenRTM_aist.Properties(key=_key)
-          next.root = curr
-          curr.leaf.append(next)
+          curr._addLeaf(next)
         curr = next
       retval = curr.value
       curr.value = value
@@ -499,17 +496,14 @@ class Properties:
   # @brief Sets a default value associated with key in the property list
   # @endif
   def setDefault(self, key, value):
-    keys = []
-    self.split(key, ".", keys)
-    #keys = string.split(key, ".")
+    keys = self._splitKey(key)
 
     curr = self
     for _key in keys:
       next = curr.hasKey(_key)
       if next is None:
         next = OpenRTM_aist.Properties(key=_key)
-        next.root = curr
-        curr.leaf.append(next)
+        curr._addLeaf(next)
       curr = next
     if value != "" and value[-1] == "\n":
       value = value[0:len(value)-1]
@@ -972,9 +966,7 @@ class Properties:
     if not key:
       return None
 
-    keys = []
-    self.split(key, '.', keys)
-    return self._getNode(keys, 0, self)
+    return self._getNode(self._splitKey(key), 0, self)
 
 
   ##
@@ -1052,6 +1044,8 @@ class Properties:
       if self.leaf[idx].name == leaf_name:
         prop = self.leaf[idx]
         del self.leaf[idx]
+        if self._leafmap.get(leaf_name) is prop:
+          del self._leafmap[leaf_name]
         return prop
     return None
 
@@ -1072,11 +1066,7 @@ class Properties:
   # @brief If key exists in the children
   # @endif
   def hasKey(self, key):
-    for leaf in self.leaf:
-      if leaf.name == key:
-        return leaf
-
-    return None
+    return self._leafmap.get(key)
 
 
   ##
@@ -1089,6 +1079,7 @@ class Properties:
   # @brief If key exists in the children
   # @endif
   def clear(self):
+    self._leafmap.clear()
     len_ = len(self.leaf)
     for i in range(len_):
       if self.leaf[-1]:
@@ -1236,6 +1227,68 @@ class Properties:
     return None
 
 
+  ##
+  # @if jp
+  # @brief ҥΡɤɲä
+  #
+  # ҥΡɤꥹȤɲä̾ˤϿ롣
+  #
+  # @param self
+  # @param leaf ɲäҥΡ
+  #
+  # @else
+  # @brief Append a child node
+  #
+  # Appends a child node to the end of the list and registers it in
+  # the name index.
+  #
+  # @param self
+  # @param leaf The child node to be appended
+  #
+  # @endif
+  def _addLeaf(self, leaf):
+    leaf.root = self
+    self.leaf.append(leaf)
+    self._leafmap[leaf.name] = leaf
+    return
+
+
+  ##
+  # @if jp
+  # @brief '.'ʬ䤹
+  #
+  # split() ˤʬ̤򡢥ʸ󤴤Ȥ˥å夹롣
+  # å夬 _keycache_size Ķˤ˴ƺľ
+  #
+  # @param self
+  # @param key ʬоݤΥ
+  #
+  # @return ʬ̤Υץ
+  #
+  # @else
+  # @brief Split a key by '.'
+  #
+  # The result of split() is cached per key string. The cache is
+  # discarded when it grows beyond _keycache_size.
+  #
+  # @param self
+  # @param key The key to be split
+  #
+  # @return Tuple of the split key
+  #
+  # @endif
+  def _splitKey(self, key):
+    keys = Properties._keycache.get(key)
+    if keys is None:
+      value = []
+      self.split(key, ".", value)
+      keys = tuple(value)
+      if len(Properties._keycache) >= Properties._keycache_size:
+        Properties._keycache = {}
+      Properties._keycache[key] = keys
+    return keys
+
+
   ##
   # @if jp
   # @brief ץѥƥ̾ΥꥹȤ
@@ -80,6 +80,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     self._leftskip   = 0
     self._profile    = None
     self._listeners  = None
+    self._batch      = False
+    self._batchMax   = OpenRTM_aist.RingBuffer.RINGBUFFER_DEFAULT_LENGTH
+    self._batchLen   = self._batchMax
 
   ##
   # @if jp
@@ -169,11 +172,12 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     th = factory.getIdentifiers()
     self._rtcout.RTC_DEBUG("available task types: %s", OpenRTM_aist.flatten(th))
 
-    self._task = factory.createObject(prop.getProperty("thread_type", "default"))
+    thread_type = prop.getProperty("publisher.thread_type",
+                                   prop.getProperty("thread_type", "default"))
+    self._task = factory.createObject(thread_type)
 
     if not self._task:
-      self._rtcout.RTC_ERROR("Task creation failed: %s",
-                             prop.getProperty("thread_type", "default"))
+      self._rtcout.RTC_ERROR("Task creation failed: %s", thread_type)
       return self.INVALID_ARGS
 
     self._rtcout.RTC_PARANOID("Task creation succeeded.")
@@ -213,7 +217,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # 
   # ʲΥץͿ뤳ȤǤ롣
   # 
-  # - thread_type: åɤΥ (ʸ󡢥ǥե: default)
+  # - publisher.thread_type: åɤΥ (ʸ󡢥ǥե: default)
+  #   pool ξϥץǶͭåɤǼ¹Ԥ롣
+  #   thread_type Ʊ̣ǻѤǤ롣
   # - publisher.push_policy: Pushݥꥷ (all, fifo, skip, new)
   # - publisher.skip_count: 嵭ݥꥷ skip ΤȤΥå׿
   # - measurement.exec_time: ¹Իַ¬ (enable/disable)
@@ -236,7 +242,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # The following options are available.
   # 
-  # - thread_type: Thread type (string, default: default)
+  # - publisher.thread_type: Thread type (string, default: default)
+  #   "pool" runs the publisher on the worker threads shared in the
+  #   process.  thread_type is also accepted.
   # - publisher.push_policy: Push policy (all, fifo, skip, new)
   # - publisher.skip_count: The number of skip count in the "skip" policy
   # - measurement.exec_time: Task execution time measurement (enable/disable)
@@ -256,6 +264,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   def init(self, prop):
     self._rtcout.RTC_TRACE("init()")
     self.setPushPolicy(prop)
+    self.setBatchLength(prop)
     return self.createTask(prop)
 
   ##
@@ -292,6 +301,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
       return self.INVALID_ARGS
 
     self._consumer = consumer
+    self._batch = isinstance(consumer, OpenRTM_aist.InPortCorbaCdrBatchConsumer)
     return self.PORT_OK
 
   ##
@@ -613,6 +623,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # PublisherNew::ReturnCode PublisherNew::pushAll()
   def pushAll(self):
     self._rtcout.RTC_TRACE("pushAll()")
+    if self._batch:
+      return self.pushAllBatch()
+
     try:
 
       while self._buffer.readable() > 0:
@@ -635,6 +648,63 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
 
     return self.PORT_ERROR
 
+  ##
+  # @brief Setting the maximum length of a batch
+  #
+  # The maximum is the buffer length of the InPort, given by
+  # inport.buffer.length or buffer.length of the connector.
+  def setBatchLength(self, prop):
+    length = [OpenRTM_aist.RingBuffer.RINGBUFFER_DEFAULT_LENGTH]
+    OpenRTM_aist.stringTo(length,
+                          prop.getProperty("inport.buffer.length",
+                                           prop.getProperty("buffer.length",
+                                                            str(length[0]))))
+    self._batchMax = max(length[0], 1)
+    self._batchLen = self._batchMax
+    self._rtcout.RTC_DEBUG("batch length: %d", self._batchMax)
+    return
+
+  ##
+  # @brief push all policy with a batch consumer
+  #
+  # The readable data are sent by consumer.putN() calls of at most
+  # the buffer length of the InPort, and the read pointer is advanced
+  # by each batch that succeeded, as pushAll() does for each data.  The
+  # InPort rejects a batch which does not fit in its buffer as a whole,
+  # so the length is halved on SEND_FULL or SEND_TIMEOUT and doubled
+  # again on success.
+  def pushAllBatch(self):
+    self._rtcout.RTC_TRACE("pushAllBatch()")
+    try:
+      while self._buffer.readable() > 0:
+        n = min(self._buffer.readable(), self._batchLen)
+        cdrs = [self._buffer.rptr(i) for i in range(n)]
+
+        for cdr in cdrs:
+          self.onBufferRead(cdr)
+          self.onSend(cdr)
+
+        ret = self._consumer.putN(cdrs)
+
+        if ret != self.PORT_OK:
+          self._rtcout.RTC_DEBUG("%s = consumer.putN()", OpenRTM_aist.DataPortStatus.toString(ret))
+          if ret == self.SEND_FULL or ret == self.SEND_TIMEOUT:
+            self._batchLen = max(n / 2, 1)
+          for cdr in cdrs:
+            status = self.invokeListener(ret, cdr)
+          return status
+
+        for cdr in cdrs:
+          self.onReceived(cdr)
+        self._buffer.advanceRptr(n)
+        self._batchLen = min(self._batchLen * 2, self._batchMax)
+
+      return self.PORT_OK
+    except:
+      return self.CONNECTION_LOST
+
+    return self.PORT_ERROR
+
   ##
   # @brief push "fifo" policy
   #
@@ -3055,6 +3055,30 @@ class RTObject_impl(OpenRTM__POA.DataFlowComponent):
     return
 
 
+  ##
+  # @if jp
+  #
+  # @brief  Port Υͥ¸ǧ򳫻Ϥ
+  #
+  # ¸ߤʤݡȤ³Ƥ륳ͥϥХå饦ɤ
+  # disconnect 롣
+  #
+  # @param self
+  #
+  # @else
+  #
+  # @brief Start liveness checks of the connectors of all Ports
+  #
+  # Connectors to ports that do not exist are disconnected in the
+  # background.
+  #
+  # @endif
+  def probePortConnectors(self):
+    self._rtcout.RTC_TRACE("probePortConnectors()")
+    self._portAdmin.probeConnectors()
+    return
+
+
   def finalizeContexts(self):
     self._rtcout.RTC_TRACE("finalizeContexts()")
     len_ = len(self._eclist)
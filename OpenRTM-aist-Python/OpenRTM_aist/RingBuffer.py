@@ -645,6 +645,66 @@ class RingBuffer(OpenRTM_aist.BufferBase):
     return OpenRTM_aist.BufferStatus.BUFFER_OK
 
     
+  ##
+  # @if jp
+  #
+  # @brief ХåեʣΥǡɤ߽Ф
+  #
+  # Хåեɤ߽Фǽʥǡ n ɤ߽Фvalue ɲ
+  # 롣n ξɤ߽Фǽʥǡ򤹤٤ɤ߽Фå
+  # ϰ٤readback  block ϹԤʤ
+  #
+  # @param value ɤ߽Фǡɲäꥹ
+  # @param n ɤ߽Фǿ (default -1: ٤)
+  #
+  # @return BUFFER_OK: 1İʾΥǡɤ߽Ф
+  #         BUFFER_EMPTY: Хåե
+  #
+  # @else
+  #
+  # @brief Read a number of data from the buffer
+  #
+  # This operation reads up to n readable data from the buffer and
+  # appends them to value.  If n is negative, all the readable data
+  # are read.  The lock is taken only once, and neither readback nor
+  # block is done.
+  #
+  # @param value The list to which the read data are appended
+  # @param n The maximum number of data to read (default -1: all)
+  #
+  # @return BUFFER_OK: One or more data were read
+  #         BUFFER_EMPTY: The buffer is empty
+  #
+  # @endif
+  #
+  # ReturnCode readN(std::vector<DataType>& value, long int n = -1)
+  def readN(self, value, n = -1):
+    self._empty_cond.acquire()
+    self._pos_mutex.acquire()
+    full_ = self._length == self._fillcount
+    count = self._fillcount
+    if not (n < 0) and n < count:
+      count = n
+
+    for i in range(count):
+      value.append(self._buffer[self._rpos])
+      self._rpos = (self._rpos + 1) % self._length
+    self._fillcount -= count
+    self._pos_mutex.release()
+
+    if count == 0:
+      self._empty_cond.release()
+      return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+
+    if full_:
+      self._full_cond.acquire()
+      self._full_cond.notify()
+      self._full_cond.release()
+
+    self._empty_cond.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
   ##
   # @if jp
   #
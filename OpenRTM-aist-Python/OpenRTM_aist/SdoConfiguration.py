@@ -1240,7 +1240,7 @@ class Configuration_impl(SDOPackage__POA.Configuration):
   #
   # @endif
   def getUUID(self):
-    return OpenRTM_aist.uuid1()
+    return OpenRTM_aist.generateId()
 
 
   # functor for NVList
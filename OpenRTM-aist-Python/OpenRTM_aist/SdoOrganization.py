@@ -57,7 +57,7 @@ class Organization_impl(SDOPackage__POA.Organization):
   # 
   # @endif
   def __init__(self, sdo):
-    self._pId         = str(OpenRTM_aist.uuid1())
+    self._pId         = OpenRTM_aist.generateId()
     self._org_mutex   = threading.RLock()
 
     self._orgProperty = SDOPackage.OrganizationProperty([])
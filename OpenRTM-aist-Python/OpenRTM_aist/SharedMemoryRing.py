@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file SharedMemoryRing.py
+# @brief Ring buffer on a memory mapped file
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+
+import os
+import mmap
+import struct
+import tempfile
+
+
+##
+# @if jp
+# @brief 󥰥եإåη
+#
+# [ޥå][С][][ͽ][][ɽа]
+#
+# @else
+# @brief Format of the control header of the ring file
+#
+# [magic][version][capacity][reserved][write position][read position]
+#
+# @endif
+SHM_RING_HEADER = struct.Struct("<4sIIIQQ")
+SHM_RING_MAGIC = "RTSM"
+SHM_RING_VERSION = 1
+SHM_RING_POSITION = struct.Struct("<Q")
+SHM_RING_LENGTH = struct.Struct("<I")
+SHM_RING_WPOS_OFFSET = 16
+SHM_RING_RPOS_OFFSET = 24
+
+
+##
+# @if jp
+# @brief 󥰥եǥ쥯ȥ
+#
+# /dev/shm ¸ߤФ򡢤ʤаǥ쥯ȥ֤
+#
+# @else
+# @brief Get the directory where ring files are created
+#
+# Returns /dev/shm if it exists, or the temporary directory otherwise.
+#
+# @endif
+def sharedMemoryDir():
+  if os.path.isdir("/dev/shm"):
+    return "/dev/shm"
+  return tempfile.gettempdir()
+
+
+##
+# @if jp
+# @class SharedMemoryRing
+# @brief ޥåץɥեΥ󥰥Хåե
+#
+# ƱۥȾ1Ĥν񤭹¦1Ĥɤ߽Ф¦δ֤ǡĹդ
+# ե졼Ϥ󥰥ХåեեƬإå֤
+# ֤Ͻ񤭹¦Τߡɽа֤ɤ߽Ф¦Τߤ롣
+# ֤ϥեñĴäХȿǡե졼ϥǡΰ
+# ޤ֤
+#
+# @since 1.0.0
+#
+# @else
+# @class SharedMemoryRing
+# @brief Ring buffer on a memory mapped file
+#
+# A ring buffer that passes length-prefixed frames between one writer
+# and one reader on the same host.  The control header is placed at the
+# top of the file, and the write position is updated only by the
+# writer, and the read position only by the reader.  The positions are
+# monotonically increasing byte counts, and frames wrap around at the
+# end of the data area.
+#
+# @since 1.0.0
+#
+# @endif
+class SharedMemoryRing:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # capacity  0 礭ϥե򿷵˺0 ξ
+  # ¸Υե򳫤
+  #
+  # @param self
+  # @param filename 󥰥եΥѥ
+  # @param capacity ǡΰ礭 [byte]
+  #
+  # @exception ValueError ¸Υե뤬󥰥եǤϤʤ
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Creates a new file if capacity is greater than 0, or opens the
+  # existing file if capacity is 0.
+  #
+  # @param self
+  # @param filename Path of the ring file
+  # @param capacity Size of the data area [byte]
+  #
+  # @exception ValueError The existing file is not a ring file
+  #
+  # @endif
+  def __init__(self, filename, capacity=0):
+    self._filename = filename
+    hsize = SHM_RING_HEADER.size
+
+    if capacity > 0:
+      fd = os.open(filename, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0600)
+      try:
+        os.ftruncate(fd, hsize + capacity)
+        self._map = mmap.mmap(fd, hsize + capacity)
+      finally:
+        os.close(fd)
+      self._map[0:hsize] = SHM_RING_HEADER.pack(SHM_RING_MAGIC,
+                                                SHM_RING_VERSION,
+                                                capacity, 0, 0, 0)
+    else:
+      fd = os.open(filename, os.O_RDWR)
+      try:
+        size = os.fstat(fd).st_size
+        if size <= hsize:
+          raise ValueError("not a shared memory ring: %s" % filename)
+        self._map = mmap.mmap(fd, size)
+      finally:
+        os.close(fd)
+      magic, version, capacity, reserved, wpos, rpos = \
+          SHM_RING_HEADER.unpack_from(self._map, 0)
+      if magic != SHM_RING_MAGIC or version != SHM_RING_VERSION or \
+            hsize + capacity != size:
+        self._map.close()
+        raise ValueError("not a shared memory ring: %s" % filename)
+
+    self._capacity = capacity
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥰥եΥѥ
+  # @else
+  # @brief Get the path of the ring file
+  # @endif
+  def filename(self):
+    return self._filename
+
+
+  ##
+  # @if jp
+  # @brief ǡΰ礭
+  # @else
+  # @brief Get the size of the data area
+  # @endif
+  def capacity(self):
+    return self._capacity
+
+
+  ##
+  # @if jp
+  # @brief ̤ɤΥХȿ
+  # @else
+  # @brief Get the number of unread bytes
+  # @endif
+  def readable(self):
+    return self._getPosition(SHM_RING_WPOS_OFFSET) - \
+        self._getPosition(SHM_RING_RPOS_OFFSET)
+
+
+  ##
+  # @if jp
+  # @brief ̤ɤΥե졼बʤɤ
+  # @else
+  # @brief Whether there is no unread frame
+  # @endif
+  def empty(self):
+    return self.readable() == 0
+
+
+  ##
+  # @if jp
+  # @brief ե졼񤭹
+  #
+  # ǡĹȤȤ˽񤭹ߡθǽ֤ʤ롣
+  # ΰ褬­ʤϲ⤷ʤ
+  #
+  # @param self
+  # @param data 񤭹ǡ(ʸ)
+  #
+  # @return 񤭹᤿ Trueΰ褬­ʤ False
+  #
+  # @else
+  # @brief Write a frame
+  #
+  # Writes the data with its length, and then advances the write
+  # position.  Nothing is done if the free space is not enough.
+  #
+  # @param self
+  # @param data Data to be written (string)
+  #
+  # @return True if written, False if the free space is not enough
+  #
+  # @endif
+  def write(self, data):
+    wpos = self._getPosition(SHM_RING_WPOS_OFFSET)
+    rpos = self._getPosition(SHM_RING_RPOS_OFFSET)
+    size = SHM_RING_LENGTH.size + len(data)
+    if size > self._capacity - (wpos - rpos):
+      return False
+
+    self._copyIn(wpos, SHM_RING_LENGTH.pack(len(data)))
+    self._copyIn(wpos + SHM_RING_LENGTH.size, data)
+    self._setPosition(SHM_RING_WPOS_OFFSET, wpos + size)
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ե졼ɤ߽Ф
+  #
+  # ƬΥե졼ɤ߽Фθɽа֤ʤ롣
+  #
+  # @param self
+  #
+  # @return ɤ߽Фǡ(ʸ)̤ɤΥե졼बʤ None
+  #
+  # @exception ValueError ե졼Ĺʾ
+  #
+  # @else
+  # @brief Read a frame
+  #
+  # Reads the first frame, and then advances the read position.
+  #
+  # @param self
+  #
+  # @return Data read (string).  None if there is no unread frame.
+  #
+  # @exception ValueError The frame length is invalid
+  #
+  # @endif
+  def read(self):
+    data = self.get()
+    if data is not None:
+      self.advanceRptr()
+    return data
+
+
+  ##
+  # @if jp
+  # @brief ɽа֤ʤ᤺˥ե졼ɤ߽Ф
+  #
+  # 񤭹¦ advanceRptr() ƤФޤǤΰȤʤ
+  #
+  # @param self
+  #
+  # @return ɤ߽Фǡ(ʸ)̤ɤΥե졼बʤ None
+  #
+  # @exception ValueError ե졼Ĺʾ
+  #
+  # @else
+  # @brief Read a frame without advancing the read position
+  #
+  # The writer does not use the area until advanceRptr() is called.
+  #
+  # @param self
+  #
+  # @return Data read (string).  None if there is no unread frame.
+  #
+  # @exception ValueError The frame length is invalid
+  #
+  # @endif
+  def get(self):
+    rpos = self._getPosition(SHM_RING_RPOS_OFFSET)
+    length = self._frameLength(rpos)
+    if length is None:
+      return None
+    return self._copyOut(rpos + SHM_RING_LENGTH.size, length)
+
+
+  ##
+  # @if jp
+  # @brief ɽа֤ƬΥե졼μ˿ʤ
+  #
+  # @param self
+  #
+  # @exception ValueError ե졼Ĺʾ
+  #
+  # @else
+  # @brief Advance the read position past the first frame
+  #
+  # @param self
+  #
+  # @exception ValueError The frame length is invalid
+  #
+  # @endif
+  def advanceRptr(self):
+    rpos = self._getPosition(SHM_RING_RPOS_OFFSET)
+    length = self._frameLength(rpos)
+    if length is not None:
+      self._setPosition(SHM_RING_RPOS_OFFSET,
+                        rpos + SHM_RING_LENGTH.size + length)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ̤ɤΥե졼˴
+  #
+  # ɽа֤֤ޤǿʤ롣줿󥰤β˻Ȥ
+  #
+  # @else
+  # @brief Discard all the unread frames
+  #
+  # Advances the read position to the write position.  It is used to
+  # recover from a corrupted ring.
+  #
+  # @endif
+  def clear(self):
+    self._setPosition(SHM_RING_RPOS_OFFSET,
+                      self._getPosition(SHM_RING_WPOS_OFFSET))
+    return
+
+
+  ##
+  # @if jp
+  # @brief ޥåԥ󥰤
+  # @else
+  # @brief Unmap the file
+  # @endif
+  def close(self):
+    if self._map is not None:
+      self._map.close()
+      self._map = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ޥåԥ󥰤ե
+  # @else
+  # @brief Unmap and remove the file
+  # @endif
+  def unlink(self):
+    self.close()
+    try:
+      os.unlink(self._filename)
+    except OSError:
+      pass
+    return
+
+
+  def _frameLength(self, rpos):
+    wpos = self._getPosition(SHM_RING_WPOS_OFFSET)
+    if wpos == rpos:
+      return None
+
+    length = SHM_RING_LENGTH.unpack(self._copyOut(rpos,
+                                                  SHM_RING_LENGTH.size))[0]
+    if SHM_RING_LENGTH.size + length > wpos - rpos:
+      raise ValueError("shared memory ring corrupted: %s" % self._filename)
+    return length
+
+
+  def _getPosition(self, offset):
+    return SHM_RING_POSITION.unpack_from(self._map, offset)[0]
+
+
+  def _setPosition(self, offset, pos):
+    self._map[offset:offset + SHM_RING_POSITION.size] = \
+        SHM_RING_POSITION.pack(pos)
+    return
+
+
+  def _copyIn(self, pos, data):
+    base = SHM_RING_HEADER.size
+    offset = pos % self._capacity
+    first = min(len(data), self._capacity - offset)
+    self._map[base + offset:base + offset + first] = data[:first]
+    if first < len(data):
+      self._map[base:base + len(data) - first] = data[first:]
+    return
+
+
+  def _copyOut(self, pos, length):
+    base = SHM_RING_HEADER.size
+    offset = pos % self._capacity
+    first = min(length, self._capacity - offset)
+    data = self._map[base + offset:base + offset + first]
+    if first < length:
+      data += self._map[base:base + length - first]
+    return data
@@ -166,6 +166,7 @@ class StateMachine:
     self.setNullFunc(self._postdo, None)
     self._transit = None
     self._mutex = threading.RLock()
+    self._work = StateHolder()
 
 
   ##
@@ -446,32 +447,48 @@ class StateMachine:
   # ơȥޥζưؿ
   # ºݤξܤӾȯγƥθƤӤ¹Ԥ롣
   #
+  # ܤʤϡå餺˾֤ɤߡϤ
+  # StateHolder Ѥ롣߾֤򹹿ΤܴؿΤߤǡ
+  # ֤ goTo() ˤ1ǹ뤿ᡢåʤǤ
+  # Ӥͤɤ롣
+  #
   # @param self
   #
   # @else
   # @brief Worker function
+  #
+  # If no state transition is required, the states are read without
+  # locking, and the StateHolder passed to the actions is reused.  Since
+  # only this function updates the current state and goTo() updates the
+  # next state by a single assignment, consistent values are read
+  # without the lock.
+  #
   # @endif
   def worker(self):
-    states = StateHolder()
-    self.sync(states)
+    states = self._work
+    shared = self._states
+    states.prev = shared.prev
+    states.curr = shared.curr
+    states.next = shared.next
 
     # If no state transition required, execute set of do-actions
     if states.curr == states.next:
+      curr = states.curr
       # pre-do
-      if self._predo[states.curr]:
-        self._predo[states.curr](states)
-      if self.need_trans():
+      if self._predo[curr]:
+        self._predo[curr](states)
+      if shared.next != curr:
         return
 
       # do
-      if self._do[states.curr]:
-        self._do[states.curr](states)
-      if self.need_trans():
+      if self._do[curr]:
+        self._do[curr](states)
+      if shared.next != curr:
         return
 
       # post-do
-      if self._postdo[states.curr]:
-        self._postdo[states.curr](states)
+      if self._postdo[curr]:
+        self._postdo[curr](states)
     # If state transition required, exit current state and enter next state
     else:
       if self._exit[states.curr]:
@@ -266,6 +266,16 @@ class Logger:
 # @endif
 class LogStream:
 
+  # (method, level name) pairs which stripDisabledLevels() replaces
+  _levelMethods = [("RTC_FATAL",    "FATAL"),
+                   ("RTC_ERROR",    "ERROR"),
+                   ("RTC_WARN",     "WARNING"),
+                   ("RTC_INFO",     "INFO"),
+                   ("RTC_DEBUG",    "DEBUG"),
+                   ("RTC_TRACE",    "TRACE"),
+                   ("RTC_VERBOSE",  "VERBOSE"),
+                   ("RTC_PARANOID", "PARANOID")]
+
   ##
   # @if jp
   #
@@ -285,6 +295,9 @@ class LogStream:
     self._LogLock = False
     self._log_enable = False
     self._loggerObj = None
+    self._mutex = threading.RLock()
+    self._level = logging.NOTSET
+    self._strip = False
     name = ""
 
     if len(args) == 0:
@@ -337,6 +350,46 @@ class LogStream:
     else:
       self.logger.setLevel(logging.INFO)
 
+    self._level = self.logger.getEffectiveLevel()
+    if self._strip:
+      self.stripDisabledLevels()
+
+
+  ##
+  # @if jp
+  #
+  # @brief ̵ʥ٥νϴؿؿ֤
+  #
+  # ߤΥ٥ǽϤʤ RTC_FATAL  RTC_PARANOID 򡢲
+  # ⤷ʤ«᥽åɤ֤롣ƤӽФΥ٥Ƚʤ
+  # 롣ʸ setLogLevel() ƤФ֤Ϥľ롣
+  # strip  False Ϳȸ᤹
+  #
+  # @param self
+  # @param strip ֤ե饰(ǥե:True)
+  #
+  # @else
+  #
+  # @brief Replace the output functions of disabled levels with no-op
+  #
+  # RTC_FATAL ... RTC_PARANOID which never output at the current log
+  # level are replaced with bound methods doing nothing, so even the
+  # level check is skipped on call.  The replacement is redone when
+  # setLogLevel() is called.  Passing False as strip restores them.
+  #
+  # @param self
+  # @param strip replacement flag (default: True)
+  #
+  # @endif
+  def stripDisabledLevels(self, strip=True):
+    self._strip = strip
+    for (method, level) in LogStream._levelMethods:
+      if self.__dict__.has_key(method):
+        del self.__dict__[method]
+      if strip and (not self._log_enable or
+                    getattr(logging, level) < self._level):
+        self.__dict__[method] = self.__nop
+
 
   ##
   # @if jp
@@ -403,7 +456,7 @@ class LogStream:
   # @endif
   def acquire(self):
     if self._LogLock:
-      self.guard = OpenRTM_aist.ScopedLock(self._mutex)
+      self._mutex.acquire()
 
 
   ##
@@ -419,7 +472,49 @@ class LogStream:
   # @endif
   def release(self):
     if self._LogLock:
-      del self.guard
+      self._mutex.release()
+
+
+  ##
+  # @if jp
+  #
+  # @brief 
+  #
+  # ååƥϤ롣٥
+  # ȽϸƤӽФ¦ǹԤ졢Ϥʤʤ
+  #
+  # @param self
+  # @param LV ٥
+  # @param name ƤӽФδؿ̾
+  # @param msg å
+  # @param opt ץ
+  #
+  # @else
+  #
+  # @brief Log output
+  #
+  # The message is formatted and logged with the lock.  The log level
+  # is checked by the caller, so that messages never output are not
+  # formatted.
+  #
+  # @endif
+  def __log(self, LV, name, msg, opt):
+    if opt is None:
+      messages = msg
+    else:
+      try:
+        messages = msg%(opt)
+      except:
+        print name + " : argument error"
+        return
+
+    self.acquire()
+    self.logger.log(LV,messages)
+    self.release()
+
+
+  def __nop(self, msg, opt=None):
+    pass
 
 
   ##
@@ -441,21 +536,8 @@ class LogStream:
   #
   # @endif
   def RTC_LOG(self, LV, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_LOG : argument error"
-          return
-
-      self.logger.log(LV,messages)
-
-      self.release()
+    if self._log_enable and LV >= self._level:
+      self.__log(LV, "RTC_LOG", msg, opt)
 
 
   ##
@@ -477,21 +559,8 @@ class LogStream:
   #
   # @endif
   def RTC_FATAL(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_FATAL : argument error"
-          return
-
-      self.logger.log(logging.FATAL,messages)
-
-      self.release()
+    if self._log_enable and logging.FATAL >= self._level:
+      self.__log(logging.FATAL, "RTC_FATAL", msg, opt)
 
 
   ##
@@ -513,21 +582,8 @@ class LogStream:
   #
   # @endif
   def RTC_ERROR(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_ERROR : argument error"
-          return
-
-      self.logger.error(messages)
-
-      self.release()
+    if self._log_enable and logging.ERROR >= self._level:
+      self.__log(logging.ERROR, "RTC_ERROR", msg, opt)
 
 
   ##
@@ -553,21 +609,8 @@ class LogStream:
   #
   # @endif
   def RTC_WARN(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_WARN : argument error"
-          return
-
-      self.logger.warning(messages)
-
-      self.release()
+    if self._log_enable and logging.WARNING >= self._level:
+      self.__log(logging.WARNING, "RTC_WARN", msg, opt)
 
 
   ##
@@ -593,21 +636,8 @@ class LogStream:
   #
   # @endif
   def RTC_INFO(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_INFO : argument error"
-          return
-
-      self.logger.info(messages)
-    
-      self.release()
+    if self._log_enable and logging.INFO >= self._level:
+      self.__log(logging.INFO, "RTC_INFO", msg, opt)
 
 
   ##
@@ -633,21 +663,8 @@ class LogStream:
   #
   # @endif
   def RTC_DEBUG(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_DEBUG : argument error"
-          return
-        
-      self.logger.debug(messages)
-      
-      self.release()
+    if self._log_enable and logging.DEBUG >= self._level:
+      self.__log(logging.DEBUG, "RTC_DEBUG", msg, opt)
 
 
   ##
@@ -673,22 +690,8 @@ class LogStream:
   #
   # @endif
   def RTC_TRACE(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_TRACE : argument error"
-          return
-
-      self.logger.log(logging.TRACE,messages)
-    
-      self.release()
+    if self._log_enable and logging.TRACE >= self._level:
+      self.__log(logging.TRACE, "RTC_TRACE", msg, opt)
 
 
   ##
@@ -715,21 +718,8 @@ class LogStream:
   #
   # @endif
   def RTC_VERBOSE(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_VERBOSE : argument error"
-          return
-
-      self.logger.log(logging.VERBOSE,messages)
-    
-      self.release()
+    if self._log_enable and logging.VERBOSE >= self._level:
+      self.__log(logging.VERBOSE, "RTC_VERBOSE", msg, opt)
 
 
 
@@ -757,20 +747,7 @@ class LogStream:
   #
   # @endif
   def RTC_PARANOID(self, msg, opt=None):
-    if self._log_enable:
-      self.acquire()
-
-      if opt is None:
-        messages = msg
-      else:
-        try:
-          messages = msg%(opt)
-        except:
-          print "RTC_PARANOID : argument error"
-          return
-
-      self.logger.log(logging.PARANOID,messages)
-    
-      self.release()
+    if self._log_enable and logging.PARANOID >= self._level:
+      self.__log(logging.PARANOID, "RTC_PARANOID", msg, opt)
 
 
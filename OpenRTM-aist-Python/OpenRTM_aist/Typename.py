@@ -24,3 +24,40 @@ import OpenRTM_aist
 ## const char* toTypename(value)
 def toTypename(value):
   return str(any.to_any(value).typecode().name())
+
+
+_typecode_cache = {}
+
+##
+# @if jp
+# @brief ǡ TypeCode 
+#
+# IDL 줿¤Τ TypeCode ϷȤ˥å夵졢Ʊ
+# Ф 2 ܰʹߤθƤӽФǤ Any ʤ
+#
+# @param value ǡ
+# @return TypeCode
+#
+# @else
+# @brief Get the TypeCode of data
+#
+# TypeCodes of IDL defined structs are cached per type, so that an Any
+# is built only at the first call for each type.
+#
+# @param value data
+# @return TypeCode
+#
+# @endif
+#
+## CORBA.TypeCode toTypeCode(value)
+def toTypeCode(value):
+  global _typecode_cache
+  cls_ = value.__class__
+  if not hasattr(cls_, "_NP_RepositoryId"):
+    return any.to_any(value).typecode()
+
+  tc_ = _typecode_cache.get(cls_)
+  if tc_ is None:
+    tc_ = any.to_any(value).typecode()
+    _typecode_cache[cls_] = tc_
+  return tc_
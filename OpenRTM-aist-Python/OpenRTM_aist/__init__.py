@@ -1,3 +1,5 @@
+# -*- coding: euc-jp -*-
+
 # Add path to OpenRTM_aist/RTM_IDL if need be 2008/06/06
 import sys,os
 _openrtm_idl_path = os.path.join(os.path.dirname(__file__), "RTM_IDL")
@@ -5,84 +7,272 @@ if _openrtm_idl_path not in sys.path:
     sys.path.append(_openrtm_idl_path)
 del _openrtm_idl_path
 
-from version import *
-from DefaultConfiguration import *
-import CORBA_SeqUtil
-import NVUtil
-from Process import *
-from Task import *
-from Async import *
-from CorbaNaming import *
-from ECFactory import *
-from StringUtil import *
-from Properties import *
-from ObjectManager import *
-from SystemLogger import *
-from TimeValue import *
-from TimeMeasure import *
-from Singleton import *
-from Factory import *
-from GlobalFactory import *
-from BufferStatus import *
-from BufferBase import *
-from RingBuffer import *
-from CdrBufferBase import *
-from CdrRingBuffer import *
-from DataPortStatus import *
-from NumberingPolicy import *
-from Listener import *
-from Typename import *
-from Guard import *
-from PeriodicTask import *
-from DefaultPeriodicTask import *
-from PeriodicTaskFactory import *
-from RTObject import *
-from ManagerServant import *
-from Manager import *
-from ManagerConfig import *
-from Timer import *
-from ModuleManager import *
-from NamingManager import *
-from ExecutionContextBase import *
-from StateMachine import *
-from PeriodicExecutionContext import *
-from OpenHRPExecutionContext import *
-from PortProfileHelper import *
-from PortAdmin import *
-from ConfigAdmin import *
-from DataFlowComponentBase import *
-from PortBase import *
-from CorbaConsumer import *
-from InPortBase import *
-from InPortConsumer import *
-from OutPortConsumer import *
-from OutPortProvider import *
-from PublisherBase import *
-from PublisherFlush import *
-from ExtTrigExecutionContext import *
-from uuid import *
-from SdoConfiguration import *
-from SdoOrganization import *
-from PeriodicECSharedComposite import *
-from RTCUtil import *
-from OutPortBase import *
-from InPort import *
-from InPortProvider import *
-from InPortCorbaCdrConsumer import *
-from InPortCorbaCdrProvider import *
-from ConnectorBase import *
-from ConnectorListener import *
-from InPortConnector import *
-from InPortPullConnector import *
-from InPortPushConnector import *
-from OutPort import *
-from PortCallBack import *
-from CorbaPort import *
-from OutPortConnector import *
-from OutPortCorbaCdrConsumer import *
-from OutPortCorbaCdrProvider import *
-from OutPortPullConnector import *
-from OutPortPushConnector import *
-from PublisherNew import *
-from PublisherPeriodic import *
-from FactoryInit import *
+import imp
+import types
+
+
+##
+# @if jp
+# @brief ٱɤ߹ߤ⥸塼ȸ̾ΰ
+#
+#  "from X import *" ɤ߹Ǥˡ⥸塼̾ȡΥ⥸塼
+# ѥå˸̾¤٤롣̾ None Υ⥸塼
+# "import X" Ȥƥ⥸塼뼫Τ롣ʣΥ⥸塼뤬Ʊ̾
+# ϸΤΤͥ褵롣⥸塼ɲä
+# ˤɲä뤳ȡ
+#
+# @else
+# @brief List of lazily loaded modules and their public names
+#
+# Lists the modules in the order they used to be loaded by
+# "from X import *", with the names each module exposes in the package.
+# Modules whose names are None are exposed as the module itself, as
+# "import X" did.  If several modules expose the same name, the later one
+# takes precedence.  New modules must be added here.
+#
+# @endif
+_lazy_modules = [
+  ("version", ("openrtm_name", "openrtm_version", "corba_name")),
+  ("DefaultConfiguration", ("default_config",)),
+  ("CORBA_SeqUtil", None),
+  ("NVUtil", None),
+  ("Process", ("launch_shell",)),
+  ("Task", ("Task",)),
+  ("Async", ("asyncInvokerPool", "asyncinvokerpool", "asyncinvokerpool_mutex",
+             "Async_t", "Async_ref_t", "Async_tInvoker", "Async_ref_tInvoker")),
+  ("CorbaNaming", ("CorbaNaming",)),
+  ("ECFactory", ("ECDelete", "ECFactoryBase", "ECFactoryPython")),
+  ("StringUtil", ("isEscaped", "escape_functor", "unescape_functor",
+                  "unique_strvec", "for_each", "escape", "unescape",
+                  "eraseBlank", "eraseHeadBlank", "eraseTailBlank",
+                  "normalize", "replaceString", "split", "toBool", "includes",
+                  "isAbsolutePath", "isURL", "otos", "stringTo", "unique_sv",
+                  "flatten", "toArgv")),
+  ("Properties", ("Properties",)),
+  ("ObjectManager", ("ObjectManager",)),
+  ("SystemLogger", ("logger", "Logger", "LogStream")),
+  ("TimeValue", ("TIMEVALUE_ONE_SECOND_IN_USECS", "TimeValue")),
+  ("TimeMeasure", ("ULLONG_MAX", "usec_per_sec", "Time", "TimeMeasure")),
+  ("ExecutionStatistics", ("ExecutionStatistics",)),
+  ("Singleton", ("Singleton",)),
+  ("Factory", ("Delete", "FactoryBase", "FactoryPython")),
+  ("GlobalFactory", ("Factory", "gfactory", "GlobalFactory")),
+  ("BufferStatus", ("BufferStatus",)),
+  ("BufferBase", ("BufferBase", "NullBuffer")),
+  ("RingBuffer", ("RingBuffer",)),
+  ("DequeBuffer", ("DequeBuffer",)),
+  ("CdrBufferBase", ("CdrBufferBase", "cdrbufferfactory", "CdrBufferFactory")),
+  ("CdrRingBuffer", ("CdrRingBuffer", "CdrRingBufferInit")),
+  ("CdrDequeBuffer", ("CdrDequeBuffer", "CdrDequeBufferInit")),
+  ("DataPortStatus", ("DataPortStatus",)),
+  ("NumberingPolicy", ("NumberingPolicy", "DefaultNumberingPolicy")),
+  ("Listener", ("ListenerBase", "ListenerObject", "ListenerFunc")),
+  ("Typename", ("toTypename", "toTypeCode")),
+  ("Guard", ("ScopedLock",)),
+  ("PeriodicTask", ("PeriodicTask",)),
+  ("DefaultPeriodicTask", ("DefaultPeriodicTaskInit",)),
+  ("PeriodicTaskFactory", ("periodictaskfactory", "PeriodicTaskFactory")),
+  ("PooledPeriodicTask", ("PeriodicTaskPool", "periodictaskpool",
+                          "periodictaskpool_mutex", "PooledPeriodicTask",
+                          "PooledPeriodicTaskInit")),
+  ("RTObject", ("ECOTHER_OFFSET", "default_conf", "RTObject_impl")),
+  ("ManagerServant", ("ManagerServant",)),
+  ("Manager", ("manager", "mutex", "componentInitPool", "componentinitpool",
+               "componentinitpool_mutex", "handler", "Manager")),
+  ("ManagerConfig", ("ManagerConfig",)),
+  ("Timer", ("Timer",)),
+  ("ModuleManager", ("CONFIG_EXT", "CONFIG_PATH", "DETECT_MOD", "MOD_LOADPTH",
+                     "INITFUNC_SFX", "INITFUNC_PFX", "ALLOW_ABSPATH",
+                     "ALLOW_URL", "MOD_DWNDIR", "MOD_DELMOD", "MOD_PRELOAD",
+                     "MOD_INDEX", "MOD_INDEX_VERSION", "ModuleManager")),
+  ("NamingManager", ("NamingBase", "NamingOnCorba", "NamingManager")),
+  ("ExecutionContextBase", ("ExecutionContextBase",)),
+  ("StateMachine", ("StateHolder", "StateMachine")),
+  ("PeriodicExecutionContext", ("DEFAULT_PERIOD", "PeriodicExecutionContext",
+                                "PeriodicExecutionContextInit")),
+  ("OpenHRPExecutionContext", ("OpenHRPExecutionContext",
+                               "OpenHRPExecutionContextInit")),
+  ("PortProfileHelper", ("PortProfileHelper",)),
+  ("PortAdmin", ("PortAdmin",)),
+  ("ConfigAdmin", ("OnUpdateCallback", "OnUpdateParamCallback",
+                   "OnSetConfigurationSetCallback",
+                   "OnAddConfigurationAddCallback",
+                   "OnRemoveConfigurationSetCallback",
+                   "OnActivateSetCallback", "Config", "ConfigAdmin")),
+  ("DataFlowComponentBase", ("DataFlowComponentBase",)),
+  ("PortBase", ("livenessProbePool", "livenessprobepool",
+                "livenessprobepool_mutex", "PortBase")),
+  ("CorbaConsumer", ("CorbaConsumerBase", "CorbaConsumer")),
+  ("InPortBase", ("InPortBase",)),
+  ("InPortConsumer", ("InPortConsumer", "inportconsumerfactory",
+                      "InPortConsumerFactory")),
+  ("OutPortConsumer", ("OutPortConsumer", "outportconsumerfactory",
+                       "OutPortConsumerFactory")),
+  ("OutPortProvider", ("OutPortProvider", "outportproviderfactory",
+                       "OutPortProviderFactory")),
+  ("PublisherBase", ("PublisherBase", "publisherfactory", "PublisherFactory")),
+  ("PublisherFlush", ("PublisherFlush", "PublisherFlushInit")),
+  ("ExtTrigExecutionContext", ("ExtTrigExecutionContext",
+                               "ExtTrigExecutionContextInit")),
+  ("IdGenerator", ("UUID_EPOCH_OFFSET", "getNodeId", "readNodeId", "nodeid",
+                   "IdGenerator", "Uuid1IdGenerator", "Uuid4IdGenerator",
+                   "CounterIdGenerator", "IdGeneratorFactory",
+                   "idgeneratorfactory", "idGenerator", "idgenerator",
+                   "idgenerator_mutex", "generateId", "IdGeneratorInit")),
+  ("uuid", ("RESERVED_NCS", "RFC_4122", "RESERVED_MICROSOFT",
+            "RESERVED_FUTURE", "UUID", "lib", "getnode", "uuid1", "uuid3",
+            "uuid4", "uuid5", "NAMESPACE_DNS", "NAMESPACE_URL",
+            "NAMESPACE_OID", "NAMESPACE_X500")),
+  ("SdoConfiguration", ("toProperties", "toConfigurationSet",
+                        "Configuration_impl")),
+  ("SdoOrganization", ("Organization_impl",)),
+  ("PeriodicECSharedComposite", ("periodicecsharedcomposite_spec",
+                                 "stringToStrVec", "setCallback",
+                                 "addCallback", "PeriodicECOrganization",
+                                 "PeriodicECSharedComposite",
+                                 "PeriodicECSharedCompositeInit")),
+  ("RTCUtil", ("isDataFlowComponent", "isFsmParticipant", "isFsmObject",
+               "isMultiModeObject")),
+  ("OutPortBase", ("OutPortBase",)),
+  ("InPort", ("TIMEOUT_TICK_USEC", "USEC_PER_SEC", "TIMEOUT_TICK_SEC", "Time",
+              "InPort")),
+  ("InPortProvider", ("InPortProvider", "inportproviderfactory",
+                      "InPortProviderFactory")),
+  ("CdrBatch", ("CDR_BATCH_LENGTH", "packCdrBatch", "unpackCdrBatch")),
+  ("SharedMemoryRing", ("SHM_RING_HEADER", "SHM_RING_MAGIC",
+                        "SHM_RING_VERSION", "SHM_RING_POSITION",
+                        "SHM_RING_LENGTH", "SHM_RING_WPOS_OFFSET",
+                        "SHM_RING_RPOS_OFFSET", "sharedMemoryDir",
+                        "SharedMemoryRing")),
+  ("InPortCorbaCdrConsumer", ("InPortCorbaCdrConsumer",
+                              "InPortCorbaCdrConsumerInit")),
+  ("InPortCorbaCdrBatchConsumer", ("InPortCorbaCdrBatchConsumer",
+                                   "InPortCorbaCdrBatchConsumerInit")),
+  ("InPortCorbaCdrProvider", ("InPortCorbaCdrProvider",
+                              "InPortCorbaCdrProviderInit")),
+  ("InPortCorbaCdrBatchProvider", ("InPortCorbaCdrBatchProvider",
+                                   "InPortCorbaCdrBatchProviderInit")),
+  ("InPortSharedMemoryConsumer", ("InPortSharedMemoryConsumer",
+                                  "InPortSharedMemoryConsumerInit")),
+  ("InPortSharedMemoryProvider", ("InPortSharedMemoryProvider",
+                                  "InPortSharedMemoryProviderInit")),
+  ("ConnectorBase", ("ConnectorInfo", "ConnectorBase")),
+  ("ConnectorListener", ("ConnectorDataListenerType", "ConnectorDataListener",
+                         "ConnectorDataListenerT", "ConnectorListenerType",
+                         "ConnectorListener", "ConnectorDataListenerHolder",
+                         "ConnectorListenerHolder", "ConnectorListeners")),
+  ("InPortConnector", ("InPortConnector",)),
+  ("InPortPullConnector", ("InPortPullConnector",)),
+  ("InPortPushConnector", ("InPortPushConnector",)),
+  ("OutPort", ("TIMEVALUE_ONE_SECOND_IN_USECS", "setTimestamp", "Time",
+               "OutPort")),
+  ("PortCallBack", ("ConnectionCallback", "DisconnectCallback", "OnWrite",
+                    "OnWriteConvert", "OnRead", "OnReadConvert")),
+  ("CorbaPort", ("CorbaPort",)),
+  ("OutPortConnector", ("OutPortConnector",)),
+  ("OutPortCorbaCdrConsumer", ("OutPortCorbaCdrConsumer",
+                               "OutPortCorbaCdrConsumerInit")),
+  ("OutPortCorbaCdrProvider", ("OutPortCorbaCdrProvider",
+                               "OutPortCorbaCdrProviderInit")),
+  ("OutPortPullConnector", ("OutPortPullConnector",)),
+  ("OutPortPushConnector", ("OutPortPushConnector",)),
+  ("PublisherNew", ("PublisherNew", "PublisherNewInit")),
+  ("PublisherPeriodic", ("PublisherPeriodic", "PublisherPeriodicInit")),
+  ("FactoryInit", ("FactoryInit",)),
+  ]
+
+_lazy_names = {}
+for _mod, _names in _lazy_modules:
+    # importing a submodule binds its name in the package
+    _lazy_names[_mod] = _mod
+    for _name in _names or ():
+        _lazy_names[_name] = _mod
+del _mod, _names, _name
+
+
+##
+# @if jp
+# @class _LazyPackage
+# @brief ٱɤ߹ߤԤѥå֥
+#
+# ѥå¸ߤʤ̾Ȥȡ̾
+# ⥸塼ɤ߹ߡ⥸塼θ̾ѥåꤹ롣
+# ˤʤ̾ __all__ Ȥ줿ϡƤΥ⥸塼
+# Ʊɤ߹ࡣ
+#
+# @else
+# @class _LazyPackage
+# @brief Package object that loads modules lazily
+#
+# When a name that does not exist in the package is referenced, the
+# module exposing the name is loaded and its public names are set in the
+# package.  When a name not in the list or __all__ is referenced, all the
+# modules are loaded in the same order as before.
+#
+# @endif
+class _LazyPackage(types.ModuleType):
+
+    def __getattr__(self, name):
+        if name in _lazy_names:
+            self._load(_lazy_names[name])
+        elif name == "__all__" or not name.startswith("__"):
+            self._loadAll()
+
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+
+
+    def _import(self, mod):
+        __import__(self.__name__ + "." + mod)
+        return sys.modules[self.__name__ + "." + mod]
+
+
+    def _load(self, mod):
+        imp.acquire_lock()
+        try:
+            module = self._import(mod)
+            for name, owner in _lazy_names.items():
+                if owner != mod:
+                    continue
+                if name in module.__dict__:
+                    self.__dict__[name] = module.__dict__[name]
+                else:
+                    self.__dict__[name] = module
+            if _lazy_names[mod] != mod:
+                # the submodule bound by import hides a name of another module
+                self.__dict__.pop(mod, None)
+        finally:
+            imp.release_lock()
+        return
+
+
+    def _loadAll(self):
+        if self.__dict__.get("_all_loaded"):
+            return
+
+        imp.acquire_lock()
+        try:
+            for mod, names in _lazy_modules:
+                module = self._import(mod)
+                self.__dict__[mod] = module
+                if names is None:
+                    continue
+                for name, value in module.__dict__.items():
+                    if not name.startswith("_"):
+                        self.__dict__[name] = value
+            self.__dict__["__all__"] = [name for name in self.__dict__.keys()
+                                        if not name.startswith("_")]
+            self.__dict__["_all_loaded"] = True
+        finally:
+            imp.release_lock()
+        return
+
+
+_module = sys.modules[__name__]
+_package = _LazyPackage(__name__, __doc__)
+# _module is kept in the package so that the globals used by
+# _LazyPackage are not cleared
+_package.__dict__.update(_module.__dict__)
+sys.modules[__name__] = _package
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_CreateComponents.py
+#  \brief benchmark for the startup time of many components
+#
+#  Registers a component whose onInitialize() waits for a given time,
+#  as a component setting up devices or files would, and reports the
+#  time to create 10 to 60 of them with createComponent() one by one
+#  and with createComponents() in a batch.
+#
+#  usage: bench_CreateComponents.py [init_time_ms] [manager options]
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+import OpenRTM_aist
+import RTC
+
+
+benchcomp_spec = ["implementation_id", "BenchComp",
+                  "type_name",         "BenchComp",
+                  "description",       "Component for startup benchmark",
+                  "version",           "1.0",
+                  "vendor",            "AIST",
+                  "category",          "bench",
+                  "activity_type",     "DataFlowComponent",
+                  "max_instance",      "1000",
+                  "language",          "Python",
+                  "lang_type",         "script",
+                  ""]
+
+init_time = 0.05
+
+
+class BenchComp(OpenRTM_aist.DataFlowComponentBase):
+  def __init__(self, manager):
+    OpenRTM_aist.DataFlowComponentBase.__init__(self, manager)
+
+  def onInitialize(self):
+    time.sleep(init_time)
+    return RTC.RTC_OK
+
+
+def measure(mgr, n, batch):
+  args = ["BenchComp"] * n
+  start = time.time()
+  if batch:
+    comps = mgr.createComponents(args)
+  else:
+    comps = [mgr.createComponent(arg) for arg in args]
+  elapsed = time.time() - start
+  for comp in comps:
+    comp.exit()
+  return elapsed
+
+
+def main():
+  global init_time
+  argv = sys.argv[:]
+  if len(argv) > 1 and not argv[1].startswith("-"):
+    init_time = float(argv.pop(1)) / 1000.0
+
+  mgr = OpenRTM_aist.Manager.init(argv)
+  mgr.activateManager()
+  profile = OpenRTM_aist.Properties(defaults_str=benchcomp_spec)
+  mgr.registerFactory(profile, BenchComp, OpenRTM_aist.Delete)
+
+  print "onInitialize: %.1f ms, manager.components.pool.size: %s" % \
+      (init_time * 1000.0,
+       mgr.getConfig().getProperty("manager.components.pool.size"))
+  print "%8s %16s %16s" % ("comps", "serial[s]", "batch[s]")
+  for n in [10, 30, 60]:
+    serial = measure(mgr, n, False)
+    batch = measure(mgr, n, True)
+    print "%8d %16.3f %16.3f" % (n, serial, batch)
+
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
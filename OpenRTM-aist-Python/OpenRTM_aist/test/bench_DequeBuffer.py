@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_DequeBuffer.py
+#  \brief benchmark for DequeBuffer against RingBuffer
+#
+#  Measures write()/read() pairs in one thread and with a separate
+#  producer thread, as a 1 kHz data port does per sample.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import threading
+import time
+
+import OpenRTM_aist
+
+
+def single_thread(buff, count):
+  data = [None]
+  start = time.time()
+  for i in range(count):
+    buff.write(i)
+    buff.read(data)
+  return (time.time() - start) / count * 1000000.0
+
+
+def producer_consumer(buff, count):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("write.full_policy", "block")
+  prop.setProperty("read.empty_policy", "block")
+  buff.init(prop)
+
+  def produce():
+    for i in range(count):
+      buff.write(i)
+
+  data = [None]
+  start = time.time()
+  producer = threading.Thread(target=produce)
+  producer.start()
+  for i in range(count):
+    buff.read(data)
+  producer.join()
+  return (time.time() - start) / count * 1000000.0
+
+
+def main():
+  count = 100000
+  print "%-15s %20s %20s" % ("buffer", "write+read[us]", "threaded[us]")
+  for name, cls in [("RingBuffer", OpenRTM_aist.RingBuffer),
+                    ("DequeBuffer", OpenRTM_aist.DequeBuffer)]:
+    print "%-15s %20.3f %20.3f" % (name,
+                                   single_thread(cls(), count),
+                                   producer_consumer(cls(), count / 10))
+
+
+if __name__ == '__main__':
+  main()
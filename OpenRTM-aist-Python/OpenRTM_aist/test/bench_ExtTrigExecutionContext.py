@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_ExtTrigExecutionContext.py
+#  \brief benchmark for the tick rate of ExtTrigExecutionContext
+#
+#  Drives a component that only counts its executions with back to
+#  back tick() calls at a 1 kHz execution rate, and reports the number
+#  of executed cycles per second for each combination of tick_mode and
+#  sync_tick.  With sync_tick NO the time until all the cycles have
+#  been executed is measured.  In the sleep tick_mode without sync_tick,
+#  ticks made during a cycle are merged, so each tick waits for the
+#  previous cycle.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+import threading
+
+import OpenRTM_aist
+
+
+class CompMock:
+  def __init__(self):
+    self._sm = self
+    self._cond = threading.Condition()
+    self._count = 0
+
+  def on_startup(self):
+    return
+
+  def on_shutdown(self):
+    return
+
+  def worker(self):
+    self._cond.acquire()
+    self._count += 1
+    self._cond.notify()
+    self._cond.release()
+
+  def waitCount(self, count):
+    self._cond.acquire()
+    while self._count < count:
+      self._cond.wait()
+    self._cond.release()
+
+
+def measure(tick_mode, sync_tick, count):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("tick_mode", tick_mode)
+  prop.setProperty("sync_tick", sync_tick)
+
+  ec = OpenRTM_aist.ExtTrigExecutionContext()
+  ec.set_rate(1000.0)
+  ec.setTickMode(prop)
+  comp = CompMock()
+  ec._comps.append(comp)
+  ec.start()
+
+  merged = tick_mode == "sleep" and sync_tick == "NO"
+  start = time.time()
+  for i in range(count):
+    ec.tick()
+    if merged:
+      comp.waitCount(i + 1)
+  comp.waitCount(count)
+  elapsed = time.time() - start
+
+  ec.stop()
+  return count / elapsed
+
+
+def main():
+  OpenRTM_aist.Manager.init(sys.argv)
+
+  print "%-10s %10s %8s %14s" % ("tick_mode", "sync_tick", "ticks",
+                                 "ticks/sec")
+  for tick_mode, count in [("sleep", 1000), ("immediate", 20000)]:
+    for sync_tick in ["NO", "YES"]:
+      rate = measure(tick_mode, sync_tick, count)
+      print "%-10s %10s %8d %14.1f" % (tick_mode, sync_tick, count, rate)
+
+  OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_IdGenerator.py
+#  \brief benchmark for the ID generators
+#
+#  Reports the startup time, i.e. the time to import the module and
+#  generate the first ID in a fresh interpreter, and the number of IDs
+#  generated per second one by one and in batches of 100.  "uuid.uuid1"
+#  is the bundled uuid module used for connector IDs formerly, which
+#  looks up libuuid and may run ifconfig to get the node ID.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import time
+import subprocess
+
+import OpenRTM_aist
+
+
+STARTUP = {
+  "uuid.uuid1": "import OpenRTM_aist.uuid\n"
+                "str(OpenRTM_aist.uuid.uuid1())",
+  "uuid1":      "import OpenRTM_aist.IdGenerator\n"
+                "OpenRTM_aist.IdGenerator.Uuid1IdGenerator().generate()",
+  "uuid4":      "import OpenRTM_aist.IdGenerator\n"
+                "OpenRTM_aist.IdGenerator.Uuid4IdGenerator().generate()",
+  "counter":    "import OpenRTM_aist.IdGenerator\n"
+                "OpenRTM_aist.IdGenerator.CounterIdGenerator().generate()",
+  }
+
+SCRIPT = """import sys, time
+sys.path.insert(1, %r)
+import OpenRTM_aist
+start = time.time()
+%s
+print time.time() - start
+"""
+
+
+def startup(code, count):
+  path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+  result = []
+  for i in range(count):
+    proc = subprocess.Popen([sys.executable, "-c", SCRIPT % (path, code)],
+                            stdout=subprocess.PIPE)
+    result.append(float(proc.communicate()[0]))
+  result.sort()
+  return result[len(result) / 2] * 1000.0
+
+
+def rate(func, count):
+  start = time.time()
+  for i in range(count):
+    func()
+  return count / (time.time() - start)
+
+
+def main():
+  count = 100000
+  gens = [("uuid.uuid1", lambda: str(OpenRTM_aist.uuid1()), None),
+          ("uuid1", None, OpenRTM_aist.Uuid1IdGenerator()),
+          ("uuid4", None, OpenRTM_aist.Uuid4IdGenerator()),
+          ("counter", None, OpenRTM_aist.CounterIdGenerator())]
+
+  print "%11s %12s %12s %14s" % ("type", "startup[ms]", "single[/s]",
+                                 "batch100[/s]")
+  for name, func, gen in gens:
+    if gen is not None:
+      func = gen.generate
+      batch = rate(lambda: gen.generateList(100), count / 100) * 100
+      batch = "%14.0f" % batch
+    else:
+      batch = "%14s" % "-"
+    print "%11s %12.2f %12.0f %s" % (name, startup(STARTUP[name], 11),
+                                     rate(func, count), batch)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_Import.py
+#  \brief benchmark for the startup time of OpenRTM_aist
+#
+#  Runs each statement in a new interpreter several times and reports
+#  the minimum and mean time of:
+#  - import OpenRTM_aist
+#  - import OpenRTM_aist and loading all the modules, as the package
+#    did on import before lazy loading
+#  - import OpenRTM_aist and Manager.init() (naming service disabled)
+#  The first run also includes reading the files from disk.
+#
+
+import sys
+import subprocess
+
+
+child = """
+import sys, time
+sys.path.insert(1, "../..")
+start = time.time()
+%s
+print time.time() - start
+"""
+
+cases = [("import",
+          "import OpenRTM_aist"),
+         ("import + load all",
+          "import OpenRTM_aist; OpenRTM_aist.__all__"),
+         ("import + Manager.init",
+          "import OpenRTM_aist\n"
+          "mgr = OpenRTM_aist.Manager.init(['bench', '-o', 'naming.enable:NO'])\n"
+          "mgr.shutdown()")]
+
+
+def measure(stmt, count):
+  times = []
+  for i in range(count):
+    proc = subprocess.Popen([sys.executable, "-c", child % stmt],
+                            stdout=subprocess.PIPE)
+    out = proc.communicate()[0]
+    times.append(float(out.strip().splitlines()[-1]))
+  return times
+
+
+def main():
+  count = 10
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  print "%-24s %10s %10s %10s" % ("case", "first[ms]", "min[ms]", "mean[ms]")
+  for name, stmt in cases:
+    times = measure(stmt, count)
+    print "%-24s %10.1f %10.1f %10.1f" % (name, times[0] * 1000.0,
+                                          min(times) * 1000.0,
+                                          sum(times) / len(times) * 1000.0)
+
+
+if __name__ == '__main__':
+  main()
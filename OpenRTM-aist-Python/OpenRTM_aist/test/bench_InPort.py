@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_InPort.py
+#  \brief benchmark for InPort::read() copy policies
+#
+#  Measures InPort.read() of large sequence types with each
+#  read.copy_policy.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+import RTC
+import OpenRTM_aist
+
+
+class ConnectorMock:
+  def __init__(self, value):
+    self._value = value
+
+  def read(self, data):
+    data[0] = self._value
+    return OpenRTM_aist.DataPortStatus.PORT_OK
+
+
+def measure(port, count):
+  start = time.time()
+  for i in range(count):
+    port.read()
+  return (time.time() - start) / count * 1000000.0
+
+
+def main():
+  OpenRTM_aist.Manager.init(sys.argv)
+  count = 200
+  values = [("TimedDoubleSeq(1081)",
+             RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 1081)),
+            ("TimedDoubleSeq(100000)",
+             RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 100000)),
+            ("TimedOctetSeq(640x480x3)",
+             RTC.TimedOctetSeq(RTC.Time(0,0), "\0" * (640 * 480 * 3)))]
+
+  print "%-25s %12s %12s %12s" % ("data", "deep[us]", "shallow[us]", "none[us]")
+  for name, value in values:
+    result = []
+    for policy in ["deep", "shallow", "none"]:
+      prop = OpenRTM_aist.Properties()
+      prop.setProperty("read.copy_policy", policy)
+      port = OpenRTM_aist.InPort("in", value)
+      port.init(prop)
+      port._connectors = [ConnectorMock(value)]
+      result.append(measure(port, count))
+    print "%-25s %12.1f %12.1f %12.1f" % tuple([name] + result)
+
+  OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
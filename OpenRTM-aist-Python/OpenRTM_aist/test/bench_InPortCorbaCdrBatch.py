@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_InPortCorbaCdrBatch.py
+#  \brief benchmark for corba_cdr_batch against corba_cdr
+#
+#  Sends backlogs of CDR data through a consumer to a provider in the
+#  same process over CORBA, one put() per data with corba_cdr and one
+#  putN() per backlog with corba_cdr_batch, and reports the throughput.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+from omniORB import *
+from omniORB import any
+
+import RTC
+import OpenRTM_aist
+
+
+class ConnectorMock:
+  def write(self, data):
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+def create(interface_type):
+  prov = OpenRTM_aist.InPortProviderFactory.instance().createObject(interface_type)
+  prov.setBuffer(OpenRTM_aist.CdrRingBuffer())
+  prov._connector = ConnectorMock()
+  cons = OpenRTM_aist.InPortConsumerFactory.instance().createObject(interface_type)
+  cons.setObject(prov._objref)
+  return cons
+
+
+def per_sample(cons, cdrs):
+  for cdr in cdrs:
+    cons.put(cdr)
+
+
+def batch(cons, cdrs):
+  cons.putN(cdrs)
+
+
+def measure(func, cons, cdrs, count):
+  start = time.time()
+  for i in range(count):
+    func(cons, cdrs)
+  return count * len(cdrs) / (time.time() - start)
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.activateManager()
+  data = RTC.TimedLong(RTC.Time(0,0), 0)
+  cdr = cdrMarshal(any.to_any(data).typecode(), data, 1)
+  cons = create("corba_cdr")
+  bcons = create("corba_cdr_batch")
+
+  print "%10s %20s %20s" % ("backlog", "put[samples/s]", "putN[samples/s]")
+  for n in [1, 10, 100, 1000]:
+    cdrs = [cdr] * n
+    count = max(10000 / n, 10)
+    print "%10d %20.0f %20.0f" % (n,
+                                  measure(per_sample, cons, cdrs, count),
+                                  measure(batch, bcons, cdrs, count))
+
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
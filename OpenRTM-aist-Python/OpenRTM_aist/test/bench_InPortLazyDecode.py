@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_InPortLazyDecode.py
+#  \brief benchmark for inport.decode=lazy against eager
+#
+#  Writes CDR data into an InPortPushConnector as the provider does in
+#  the CORBA upcall, and reads one data per 10 writes as a consumer
+#  running at a tenth of the rate of the producer.  Reports the time
+#  spent in write() (the upcall) and in read() per written data, with
+#  an overwriting buffer of length 1 and 8.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+from omniORB import *
+from omniORB import any
+
+import RTC
+import OpenRTM_aist
+
+
+class ProviderMock:
+  def init(self, prop):
+    pass
+
+  def setBuffer(self, buffer):
+    pass
+
+  def setListener(self, info, listeners):
+    pass
+
+  def exit(self):
+    pass
+
+
+def create(decode, length, value):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("inport.decode", decode)
+  prop.setProperty("buffer.length", str(length))
+  prop.setProperty("buffer.write.full_policy", "overwrite")
+  prop.setProperty("buffer.read.empty_policy", "do_nothing")
+  info = OpenRTM_aist.ConnectorInfo("bench", "bench", [], prop)
+  con = OpenRTM_aist.InPortPushConnector(info, ProviderMock(),
+                                         OpenRTM_aist.ConnectorListeners())
+  con.setDataType(value)
+  con.setConnectorInfo(info)
+  return con
+
+
+def measure(con, cdr, count, ratio):
+  wtime = 0.0
+  rtime = 0.0
+  data = [None]
+  for i in range(count / ratio):
+    start = time.time()
+    for j in range(ratio):
+      con.write(cdr)
+    wtime += time.time() - start
+    start = time.time()
+    con.read(data)
+    rtime += time.time() - start
+  return wtime / count * 1000000.0, rtime / count * 1000000.0
+
+
+def main():
+  OpenRTM_aist.Manager.init(sys.argv)
+  count = 2000
+  ratio = 10
+  values = [("TimedLong",
+             RTC.TimedLong(RTC.Time(0,0), 0)),
+            ("TimedDoubleSeq(1081)",
+             RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 1081)),
+            ("TimedDoubleSeq(100000)",
+             RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 100000))]
+
+  print "producer:consumer = %d:1, %d writes" % (ratio, count)
+  print "%-24s %6s %8s %12s %12s" % ("data", "length", "decode",
+                                       "write[us]", "read[us]")
+  for name, value in values:
+    cdr = cdrMarshal(any.to_any(value).typecode(), value, True)
+    for length in [1, 8]:
+      for decode in ["eager", "lazy"]:
+        con = create(decode, length, value)
+        wtime, rtime = measure(con, cdr, count, ratio)
+        print "%-24s %6d %8s %12.1f %12.1f" % (name, length, decode,
+                                                wtime, rtime)
+
+  OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
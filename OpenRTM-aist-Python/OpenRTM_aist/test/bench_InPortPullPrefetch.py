@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_InPortPullPrefetch.py
+#  \brief benchmark for inport.prefetch against plain pull
+#
+#  Connects an InPortPullConnector to an OutPortCorbaCdrProvider through
+#  the local ORB, and calls read() once per period as onExecute() of a
+#  periodic component does.  Reports the latency of read() with and
+#  without prefetch.  The provider sleeps for the given delay in get()
+#  to emulate the round trip to an OutPort on another host.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+from omniORB import *
+from omniORB import any
+
+import RTC
+import OpenRTM_aist
+
+
+class DelayedProvider(OpenRTM_aist.OutPortCorbaCdrProvider):
+  def __init__(self, delay):
+    OpenRTM_aist.OutPortCorbaCdrProvider.__init__(self)
+    self._delay = delay
+
+  def get(self):
+    if self._delay > 0.0:
+      time.sleep(self._delay)
+    return OpenRTM_aist.OutPortCorbaCdrProvider.get(self)
+
+
+def create(prefetch, delay, value):
+  bprop = OpenRTM_aist.Properties()
+  bprop.setProperty("write.full_policy", "overwrite")
+  bprop.setProperty("read.empty_policy", "readback")
+  buffer = OpenRTM_aist.CdrRingBuffer()
+  buffer.init(bprop)
+  buffer.write(cdrMarshal(any.to_any(value).typecode(), value, True))
+
+  prov = DelayedProvider(delay)
+  prov.setBuffer(buffer)
+  cons = OpenRTM_aist.OutPortCorbaCdrConsumer()
+  cons.subscribeInterface(prov._properties)
+
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("inport.prefetch", prefetch)
+  info = OpenRTM_aist.ConnectorInfo("bench", "bench", [], prop)
+  con = OpenRTM_aist.InPortPullConnector(info, cons,
+                                         OpenRTM_aist.ConnectorListeners())
+  con.setConnectorInfo(info)
+  return prov, con
+
+
+def measure(con, value, period, count):
+  result = []
+  data = [value]
+  next = time.time()
+  for i in range(count):
+    next += period
+    start = time.time()
+    con.read(data)
+    result.append(time.time() - start)
+    wait = next - time.time()
+    if wait > 0.0:
+      time.sleep(wait)
+  result.sort()
+  return (result[len(result) / 2] * 1000000.0,
+          result[len(result) * 99 / 100] * 1000000.0)
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.activateManager()
+
+  period = 0.01
+  count = 300
+  value = RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 1081)
+
+  print "period %.0f ms, %d reads, TimedDoubleSeq(1081)" % (period * 1000.0,
+                                                            count)
+  print "%10s %9s %14s %14s" % ("delay[ms]", "prefetch",
+                                "median[usec]", "99%[usec]")
+  for delay in [0.0, 0.001, 0.005]:
+    for prefetch in ["NO", "YES"]:
+      prov, con = create(prefetch, delay, value)
+      median, worst = measure(con, value, period, count)
+      print "%10.0f %9s %14.1f %14.1f" % (delay * 1000.0, prefetch,
+                                          median, worst)
+      con.disconnect()
+
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_ModuleManager.py
+#  \brief benchmark for getLoadableModules() with the module index
+#
+#  Generates component modules in a temporary directory and reports the
+#  time of getLoadableModules() without the module index, with a cold
+#  index, with the index read by another ModuleManager (as on the next
+#  start of the manager), and after one module is modified.
+#  Each module sleeps for import_time_ms when imported, as a module
+#  importing large libraries would.
+#
+#  usage: bench_ModuleManager.py [modules] [import_time_ms]
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import time
+import shutil
+import tempfile
+
+import OpenRTM_aist
+
+
+module_src = """
+import time
+time.sleep(%(sleep)f)
+
+benchmod%(num)d_spec = ["implementation_id", "BenchMod%(num)d",
+                      "type_name",         "BenchMod%(num)d",
+                      "description",       "Module for index benchmark",
+                      "version",           "1.0",
+                      "vendor",            "AIST",
+                      "category",          "bench",
+                      "activity_type",     "DataFlowComponent",
+                      "max_instance",      "1",
+                      "language",          "Python",
+                      "lang_type",         "script",
+                      ""]
+"""
+
+
+def unloadModules():
+  for name in sys.modules.keys():
+    if name.startswith("BenchMod"):
+      del sys.modules[name]
+
+
+def measure(moddir, index):
+  unloadModules()
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("manager.modules.load_path", moddir)
+  prop.setProperty("manager.modules.index_file", index)
+  mm = OpenRTM_aist.ModuleManager(prop)
+  start = time.time()
+  profs = mm.getLoadableModules()
+  return time.time() - start, len(profs)
+
+
+def main():
+  nmod = 500
+  sleep = 0.0
+  if len(sys.argv) > 1:
+    nmod = int(sys.argv[1])
+  if len(sys.argv) > 2:
+    sleep = float(sys.argv[2]) / 1000.0
+
+  OpenRTM_aist.Manager.init([sys.argv[0]])
+
+  tmpdir = tempfile.mkdtemp()
+  moddir = os.path.join(tmpdir, "modules")
+  index = os.path.join(tmpdir, "index")
+  os.mkdir(moddir)
+  try:
+    for i in range(nmod):
+      f = open(os.path.join(moddir, "BenchMod%d.py" % i), "w")
+      f.write(module_src % {"num": i, "sleep": sleep})
+      f.close()
+
+    print "modules: %d, import time: %.1f ms" % (nmod, sleep * 1000.0)
+    print "%-24s %12s %10s" % ("case", "time[s]", "profiles")
+    cases = [("no index", ""),
+             ("cold index", index),
+             ("warm index", index)]
+    for name, idx in cases:
+      elapsed, n = measure(moddir, idx)
+      print "%-24s %12.4f %10d" % (name, elapsed, n)
+
+    time.sleep(1.0)
+    f = open(os.path.join(moddir, "BenchMod0.py"), "a")
+    f.write("\n")
+    f.close()
+    elapsed, n = measure(moddir, index)
+    print "%-24s %12.4f %10d" % ("one module modified", elapsed, n)
+  finally:
+    shutil.rmtree(tmpdir)
+    OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
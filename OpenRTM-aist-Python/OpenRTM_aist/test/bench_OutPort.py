@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_OutPort.py
+#  \brief benchmark for OutPort::write() fan-out
+#
+#  Measures the cost of one OutPort.write() as the number of push
+#  connectors grows, comparing the shared marshal fan-out with
+#  marshalling the sample in every connector.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+import RTC
+import OpenRTM_aist
+
+
+class ConsumerMock:
+  def init(self, prop):
+    return
+
+  def put(self, data):
+    return OpenRTM_aist.DataPortStatus.PORT_OK
+
+
+class BufferMock:
+  def init(self, prop):
+    return
+
+
+def create_connector(endian):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("serializer.cdr.endian", endian)
+  prof = OpenRTM_aist.ConnectorInfo("bench", str(OpenRTM_aist.uuid1()),
+                                    ["in","out"], prop)
+  return OpenRTM_aist.OutPortPushConnector(prof, ConsumerMock(),
+                                           OpenRTM_aist.ConnectorListeners(),
+                                           BufferMock())
+
+
+def per_connector_write(port, value):
+  for con in port._connectors:
+    con.write(value)
+
+
+def measure(func, count):
+  start = time.time()
+  for i in range(count):
+    func()
+  return (time.time() - start) / count * 1000000.0
+
+
+def main():
+  OpenRTM_aist.Manager.init(sys.argv)
+  count = 2000
+  value = RTC.TimedDoubleSeq(RTC.Time(0,0), [0.0] * 1000)
+
+  print "%10s %20s %20s" % ("connectors", "per-connector[us]", "fan-out[us]")
+  for n in [1, 2, 4, 8, 16, 32]:
+    port = OpenRTM_aist.OutPort("out", value)
+    port._connectors = [create_connector("little") for i in range(n)]
+    old = measure(lambda: per_connector_write(port, value), count)
+    new = measure(lambda: port.write(value), count)
+    print "%10d %20.2f %20.2f" % (n, old, new)
+
+  OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
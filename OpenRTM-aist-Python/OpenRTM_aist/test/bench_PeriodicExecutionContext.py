@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_PeriodicExecutionContext.py
+#  \brief benchmark for period jitter of PeriodicExecutionContext
+#
+#  Runs a component that busies itself for a quarter of the period
+#  at 100 Hz, 500 Hz and 1 kHz, and reports the achieved rate, the
+#  standard deviation and the maximum deviation of the period for the
+#  sleep and deadline scheduling modes.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import math
+import time
+
+import OpenRTM_aist
+
+
+class CompMock:
+  def __init__(self, load):
+    self._sm = self
+    self._load = load
+    self._stamps = []
+
+  def on_startup(self):
+    return
+
+  def on_shutdown(self):
+    return
+
+  def worker(self):
+    now = time.time()
+    self._stamps.append(now)
+    while time.time() - now < self._load:
+      pass
+
+
+def measure(scheduling, rate, duration):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("scheduling", scheduling)
+
+  ec = OpenRTM_aist.PeriodicExecutionContext(None, rate)
+  ec.init(prop)
+  comp = CompMock(0.25 / rate)
+  ec._comps.append(comp)
+  ec.start()
+  time.sleep(duration)
+  ec.stop()
+
+  stamps = comp._stamps
+  periods = [stamps[i+1] - stamps[i] for i in range(len(stamps) - 1)]
+  expected = 1.0 / rate
+  achieved = (len(stamps) - 1) / (stamps[-1] - stamps[0])
+  mean = sum(periods) / len(periods)
+  stddev = math.sqrt(sum([(p - mean) ** 2 for p in periods]) / len(periods))
+  maxdev = max([abs(p - expected) for p in periods])
+  return achieved, stddev * 1000000.0, maxdev * 1000000.0, ec.getOverrunCount()
+
+
+def main():
+  OpenRTM_aist.Manager.init(sys.argv)
+  duration = 3.0
+
+  print "%-10s %8s %12s %12s %12s %10s" % ("scheduling", "rate", "achieved",
+                                           "stddev[us]", "maxdev[us]",
+                                           "overruns")
+  for rate in [100.0, 500.0, 1000.0]:
+    for scheduling in ["sleep", "deadline"]:
+      achieved, stddev, maxdev, overruns = measure(scheduling, rate, duration)
+      print "%-10s %8.1f %12.2f %12.1f %12.1f %10d" % (scheduling, rate,
+                                                       achieved, stddev,
+                                                       maxdev, overruns)
+
+  OpenRTM_aist.Manager.instance().shutdown()
+
+
+if __name__ == '__main__':
+  main()
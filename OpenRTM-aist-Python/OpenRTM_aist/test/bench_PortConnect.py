@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_PortConnect.py
+#  \brief benchmark for connecting data ports with large ConnectorProfiles
+#
+#  Connects and disconnects an OutPort and an InPort in the same process
+#  with ConnectorProfiles which have extra NameValue entries, and reports
+#  the time per connect().  "linear" emulates the former handshake,
+#  which scanned and decoded ConnectorProfile::properties in every step,
+#  and "view" uses the NVListView shared during notify_connect().
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+from omniORB import any
+
+import RTC
+import OpenRTM_aist
+
+
+class LinearProperties:
+  def __init__(self, nvlist):
+    self._nv = nvlist
+
+  def __len__(self):
+    return len(self._nv)
+
+  def __getitem__(self, index):
+    return self._nv[index]
+
+  def find_index(self, name):
+    return OpenRTM_aist.NVUtil.find_index(self._nv, name)
+
+  def valueAt(self, index):
+    return any.from_any(self._nv[index].value, keep_structs=True)
+
+  def toProperties(self):
+    prop = OpenRTM_aist.Properties()
+    OpenRTM_aist.NVUtil.copyToProperties(prop, self._nv)
+    return prop
+
+
+def linearPropertiesView(self, connector_profile):
+  return LinearProperties(connector_profile.properties)
+
+
+def measure(outport, inport, dataflow, entries, count):
+  total = 0.0
+  for i in range(count):
+    nvlist = [OpenRTM_aist.NVUtil.newNV("dataport.interface_type", "corba_cdr"),
+              OpenRTM_aist.NVUtil.newNV("dataport.dataflow_type", dataflow),
+              OpenRTM_aist.NVUtil.newNV("dataport.subscription_type", "flush")]
+    for j in range(entries):
+      nvlist.append(OpenRTM_aist.NVUtil.newNV("bench.entry%d" % j, str(j)))
+    prof = RTC.ConnectorProfile("bench", "",
+                                [outport.get_port_profile().port_ref,
+                                 inport.get_port_profile().port_ref],
+                                nvlist)
+    start = time.time()
+    ret, prof = outport.connect(prof)
+    total += time.time() - start
+    if ret != RTC.RTC_OK:
+      print "connect() failed:", ret
+    outport.disconnect(prof.connector_id)
+  return total / count * 1000.0
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.activateManager()
+
+  outport = OpenRTM_aist.OutPort("out", RTC.TimedLong(RTC.Time(0,0), 0))
+  outport.init(OpenRTM_aist.Properties())
+  inport = OpenRTM_aist.InPort("in", RTC.TimedLong(RTC.Time(0,0), 0))
+  inport.init(OpenRTM_aist.Properties())
+
+  count = 100
+  view = OpenRTM_aist.PortBase.getPropertiesView
+  print "%8s %9s %12s %12s" % ("entries", "dataflow", "linear[ms]", "view[ms]")
+  for entries in [0, 50, 100, 200]:
+    for dataflow in ["push", "pull"]:
+      OpenRTM_aist.PortBase.getPropertiesView = linearPropertiesView
+      linear = measure(outport, inport, dataflow, entries, count)
+      OpenRTM_aist.PortBase.getPropertiesView = view
+      indexed = measure(outport, inport, dataflow, entries, count)
+      print "%8d %9s %12.2f %12.2f" % (entries, dataflow, linear, indexed)
+
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_PublisherPool.py
+#  \brief benchmark for the pool thread type of publishers
+#
+#  Creates 1 to 500 PublisherNew connected to a consumer that only
+#  counts the data, writes a number of data to every publisher and
+#  reports the time until all the data are pushed with the default
+#  (one thread per publisher) and pool thread types.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+import threading
+
+import OpenRTM_aist
+
+
+class ConsumerMock(OpenRTM_aist.InPortConsumer):
+  def __init__(self, counter):
+    self._counter = counter
+
+  def put(self, data):
+    self._counter.count()
+    return self.PORT_OK
+
+
+class Counter:
+  def __init__(self):
+    self._cond = threading.Condition()
+    self._count = 0
+
+  def count(self):
+    self._cond.acquire()
+    self._count += 1
+    if self._count == self._target:
+      self._cond.notify()
+    self._cond.release()
+
+  def wait(self, target):
+    self._cond.acquire()
+    self._target = target
+    while self._count < target:
+      self._cond.wait()
+    self._cond.release()
+
+
+def create(thread_type, n, counter):
+  prop = OpenRTM_aist.Properties()
+  prop.setProperty("publisher.push_policy", "fifo")
+  prop.setProperty("publisher.thread_type", thread_type)
+  cinfo = OpenRTM_aist.ConnectorInfo("", "", [], prop)
+  pubs = []
+  for i in range(n):
+    pub = OpenRTM_aist.PublisherNew()
+    pub.init(prop)
+    pub.setConsumer(ConsumerMock(counter))
+    pub.setBuffer(OpenRTM_aist.CdrRingBuffer())
+    pub.setListener(cinfo, OpenRTM_aist.ConnectorListeners())
+    pub.activate()
+    pubs.append(pub)
+  return pubs
+
+
+def measure(thread_type, n, count):
+  counter = Counter()
+  pubs = create(thread_type, n, counter)
+  threads = threading.activeCount()
+  start = time.time()
+  for i in range(count):
+    for pub in pubs:
+      pub.write("data", 0, 0)
+  counter.wait(n * count)
+  elapsed = time.time() - start
+  for pub in pubs:
+    pub.deactivate()
+    pub._task.finalize()
+  return threads, n * count / elapsed
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.activateManager()
+
+  print "%10s %10s %18s %10s %18s" % ("connectors", "threads", "default[samples/s]",
+                                      "threads", "pool[samples/s]")
+  for n in [1, 10, 50, 100, 200, 500]:
+    count = max(20000 / n, 10)
+    result = measure("default", n, count) + measure("pool", n, count)
+    print "%10d %10d %18.0f %10d %18.0f" % ((n,) + result)
+
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_SharedMemory.py
+#  \brief benchmark for shared_memory against corba_cdr
+#
+#  Sends CDR data through a consumer to a provider in the same process
+#  with corba_cdr and shared_memory, and reports the latency until the
+#  data reaches the connector and the throughput of put().
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+import threading
+
+from omniORB import *
+from omniORB import any
+
+import RTC
+import OpenRTM_aist
+
+
+class ConnectorMock:
+  def __init__(self):
+    self._cond = threading.Condition()
+    self._count = 0
+
+  def write(self, data):
+    self._cond.acquire()
+    self._count += 1
+    self._cond.notify()
+    self._cond.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+  def wait(self, count):
+    self._cond.acquire()
+    while self._count < count:
+      self._cond.wait()
+    self._cond.release()
+
+
+def create(interface_type):
+  prov = OpenRTM_aist.InPortProviderFactory.instance().createObject(interface_type)
+  prov.init(OpenRTM_aist.Properties())
+  prov.setBuffer(OpenRTM_aist.CdrRingBuffer())
+  conn = ConnectorMock()
+  prov.setConnector(conn)
+  cons = OpenRTM_aist.InPortConsumerFactory.instance().createObject(interface_type)
+  cons.init(OpenRTM_aist.Properties())
+  cons.subscribeInterface(prov._properties)
+  return prov, cons, conn
+
+
+def latency(cons, conn, cdr, count):
+  result = []
+  for i in range(count):
+    start = time.time()
+    cons.put(cdr)
+    conn.wait(conn._count + 1)
+    result.append(time.time() - start)
+  result.sort()
+  return result[len(result) / 2] * 1000000.0
+
+
+def throughput(cons, conn, cdr, count):
+  done = conn._count + count
+  start = time.time()
+  for i in range(count):
+    while cons.put(cdr) == OpenRTM_aist.DataPortStatus.SEND_FULL:
+      pass
+  conn.wait(done)
+  return count / (time.time() - start)
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.activateManager()
+
+  print "%10s %14s %16s %14s %16s" % ("size", "corba[usec]", "corba[samples/s]",
+                                      "shm[usec]", "shm[samples/s]")
+  ports = [create("corba_cdr"), create("shared_memory")]
+  for size in [1, 100, 10000, 100000]:
+    data = RTC.TimedOctetSeq(RTC.Time(0,0), "x" * size)
+    cdr = cdrMarshal(any.to_any(data).typecode(), data, 1)
+    count = max(100000 / size, 100)
+    result = []
+    for prov, cons, conn in ports:
+      result.append(latency(cons, conn, cdr, count))
+      result.append(throughput(cons, conn, cdr, count))
+    print "%10d %14.1f %16.0f %14.1f %16.0f" % tuple([size] + result)
+
+  for prov, cons, conn in ports:
+    cons.unsubscribeInterface(prov._properties)
+    prov.exit()
+  mgr.shutdown()
+
+
+if __name__ == '__main__':
+  main()
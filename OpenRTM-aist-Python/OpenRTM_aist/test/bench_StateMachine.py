@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_StateMachine.py
+#  \brief benchmark for the steady state tick of StateMachine
+#
+#  Drives 30 state machines in the active state as an ExecutionContext
+#  does, and reports the time per tick of worker() compared with the
+#  previous implementation that allocated a StateHolder and took the
+#  lock three times on every tick.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import time
+
+import RTC
+import OpenRTM_aist
+from StateMachine import *
+
+
+class LegacyStateMachine(StateMachine):
+  def worker(self):
+    states = StateHolder()
+    self.sync(states)
+    if states.curr == states.next:
+      if self._predo[states.curr]:
+        self._predo[states.curr](states)
+      if self.need_trans():
+        return
+      if self._do[states.curr]:
+        self._do[states.curr](states)
+      if self.need_trans():
+        return
+      if self._postdo[states.curr]:
+        self._postdo[states.curr](states)
+    else:
+      if self._exit[states.curr]:
+        self._exit[states.curr](states)
+      self.sync(states)
+      if states.curr != states.next:
+        states.curr = states.next
+        if self._entry[states.curr]:
+          self._entry[states.curr](states)
+        self.update_curr(states.curr)
+
+
+def action(st):
+  return
+
+
+def create(cls):
+  sm = cls(4)
+  sm.setNOP(action)
+  st = StateHolder()
+  st.prev = RTC.ACTIVE_STATE
+  st.curr = RTC.ACTIVE_STATE
+  st.next = RTC.ACTIVE_STATE
+  sm.setStartState(st)
+  return sm
+
+
+def measure(cls, ncomps, ticks):
+  sms = [create(cls) for i in range(ncomps)]
+  start = time.time()
+  for i in range(ticks):
+    for sm in sms:
+      sm.worker()
+  return (time.time() - start) / (ticks * ncomps) * 1000000.0
+
+
+def main():
+  ncomps = 30
+  ticks = 3000
+  legacy = measure(LegacyStateMachine, ncomps, ticks)
+  current = measure(StateMachine, ncomps, ticks)
+  print "%d components x %d ticks" % (ncomps, ticks)
+  print "legacy worker():  %8.3f [usec/tick]" % legacy
+  print "current worker(): %8.3f [usec/tick]" % current
+  print "saving at 1kHz:   %8.1f [msec/sec]" % ((legacy - current) * ncomps)
+
+
+if __name__ == '__main__':
+  main()
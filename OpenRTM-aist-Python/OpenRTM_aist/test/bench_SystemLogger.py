@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+#  \file bench_SystemLogger.py
+#  \brief benchmark for logging cost on the data port path
+#
+#  Measures OutPort.write() through a push connector and
+#  InPort.read() with logging at INFO, at INFO with
+#  logger.strip_disabled_levels, and with logging disabled.  Each
+#  setting runs in its own process since the manager configuration
+#  is fixed at Manager.init().
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import subprocess
+import time
+
+import RTC
+import OpenRTM_aist
+
+
+settings = [("INFO", ["-o", "logger.log_level:INFO",
+                      "-o", "logger.file_name:bench_SystemLogger.log"]),
+            ("INFO+strip", ["-o", "logger.log_level:INFO",
+                            "-o", "logger.file_name:bench_SystemLogger.log",
+                            "-o", "logger.strip_disabled_levels:YES"]),
+            ("disabled", ["-o", "logger.enable:NO"])]
+
+
+class ConsumerMock:
+  def init(self, prop):
+    return
+
+  def put(self, data):
+    return OpenRTM_aist.DataPortStatus.PORT_OK
+
+
+class BufferMock:
+  def init(self, prop):
+    return
+
+
+class ProviderMock:
+  def init(self, prop):
+    return
+
+  def setBuffer(self, buff):
+    return
+
+  def setListener(self, info, listeners):
+    return
+
+
+def measure(func, count):
+  start = time.time()
+  for i in range(count):
+    func()
+  return (time.time() - start) / count * 1000000.0
+
+
+def run():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  count = 20000
+  value = RTC.TimedLong(RTC.Time(0,0), 0)
+
+  prof = OpenRTM_aist.ConnectorInfo("bench", "id", ["in","out"],
+                                    OpenRTM_aist.Properties())
+  outport = OpenRTM_aist.OutPort("out", value)
+  outport._connectors = [OpenRTM_aist.OutPortPushConnector(prof,
+                                                           ConsumerMock(),
+                                                           OpenRTM_aist.ConnectorListeners(),
+                                                           BufferMock())]
+  buff = OpenRTM_aist.CdrBufferFactory.instance().createObject("ring_buffer")
+  inport = OpenRTM_aist.InPort("in", value)
+  inport._connectors = [OpenRTM_aist.InPortPushConnector(prof,
+                                                         ProviderMock(),
+                                                         OpenRTM_aist.ConnectorListeners(),
+                                                         buff)]
+
+  def read():
+    buff.write(value)
+    inport.read()
+
+  print "%.3f %.3f" % (measure(outport.write, count), measure(read, count))
+  mgr.shutdown()
+
+
+def main():
+  print "%-12s %16s %16s" % ("logging", "write[us]", "read[us]")
+  for name, opts in settings:
+    proc = subprocess.Popen([sys.executable, __file__, "run"] + opts,
+                            stdout=subprocess.PIPE)
+    out = proc.communicate()[0].split()
+    print "%-12s %16s %16s" % (name, out[-2], out[-1])
+
+  if os.path.exists("bench_SystemLogger.log"):
+    os.remove("bench_SystemLogger.log")
+
+
+if __name__ == '__main__':
+  if len(sys.argv) > 1 and sys.argv[1] == "run":
+    del sys.argv[1]
+    run()
+  else:
+    main()
@@ -16,6 +16,7 @@
 
 import time
 import sys
+import threading
 sys.path.insert(1,"../")
 
 import unittest
@@ -71,6 +72,15 @@ class add_one_functor:
 		
 	def get_ret(self):
 		return self._ret
+
+
+def add_one(val):
+	time.sleep(0.5)
+	return val+1
+
+
+def raise_error(obj):
+	raise ValueError("error")
 		
 
 
@@ -110,6 +120,39 @@ class TestAsync(unittest.TestCase):
 		self.assertEqual(aof.get_ret(),val+1)
 		return
 
+
+	def test_result(self):
+		invoker = Async_tInvoker(100,add_one)
+		self.assertEqual(invoker.wait(0.1),False)
+		invoker.invoke()
+		self.assertEqual(invoker.wait(0.1),False)
+		self.assertEqual(invoker.finished(),False)
+		self.assertEqual(invoker.result(),101)
+		self.assertEqual(invoker.finished(),True)
+		self.assertEqual(invoker.exception(),None)
+		return
+
+
+	def test_exception(self):
+		invoker = Async_ref_tInvoker(None,raise_error)
+		invoker.invoke()
+		self.assertEqual(invoker.wait(),True)
+		self.assertEqual(isinstance(invoker.exception(),ValueError),True)
+		self.assertRaises(ValueError,invoker.result)
+		return
+
+
+	def test_pool(self):
+		invokers = [Async_tInvoker(0.01,time.sleep) for i in range(100)]
+		before = threading.activeCount()
+		for invoker in invokers:
+			invoker.invoke()
+		self.assertEqual(threading.activeCount() <= before + asyncInvokerPool().size(),True)
+		for invoker in invokers:
+			invoker.wait()
+		self.assertEqual(invoker.finished(),True)
+		return
+
 		
 
 ############### test #################
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_CdrBatch.py
+# \brief test for framing functions of batched CDR data
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from CdrBatch import *
+
+
+class TestCdrBatch(unittest.TestCase):
+
+	def test_pack_unpack(self):
+		cdrs = ["\x01\x00\x00\x00", "", "abc" * 100, "\x00"]
+		data = packCdrBatch(cdrs)
+		self.assertEqual(len(data), 4 + 4 * 4 + 4 + 0 + 300 + 1)
+		self.assertEqual(unpackCdrBatch(data), cdrs)
+
+		self.assertEqual(unpackCdrBatch(packCdrBatch([])), [])
+		return
+
+
+	def test_malformed(self):
+		data = packCdrBatch(["abc", "defg"])
+		self.assertRaises(ValueError, unpackCdrBatch, "")
+		self.assertRaises(ValueError, unpackCdrBatch, data[:-1])
+		self.assertRaises(ValueError, unpackCdrBatch, data[:9])
+		self.assertRaises(ValueError, unpackCdrBatch, data + "x")
+		return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -183,6 +183,36 @@ class TestConnectorListener(unittest.TestCase):
 		return
 
 
+	def test_decodeOnce(self):
+		holder = self._connectorListeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED]
+		self.assertEqual(holder.isEmpty(), True)
+		listeners = [DataListener("decode%d" % i) for i in range(3)]
+		for listener in listeners:
+			holder.addListener(listener, True)
+		self.assertEqual(holder.isEmpty(), False)
+
+		# the typed listeners share one decoded data per sample
+		data = RTC.TimedLong(RTC.Time(0,0),123)
+		cdr_data = cdrMarshal(any.to_any(data).typecode(), data, True)
+		holder.notify(self._info, cdr_data)
+		decoded = [listener.get_data() for listener in listeners]
+		self.assertEqual(decoded[0].data, 123)
+		self.assert_(decoded[0] is decoded[1])
+		self.assert_(decoded[0] is decoded[2])
+
+		holder.notify(self._info, cdr_data)
+		self.assert_(listeners[0].get_data() is not decoded[0])
+
+		# outside of notify() the data is decoded every time
+		listeners[0](self._info, cdr_data)
+		self.assertEqual(listeners[0].get_data().data, 123)
+
+		for listener in listeners:
+			holder.removeListener(listener)
+		self.assertEqual(holder.isEmpty(), True)
+		return
+
+
 	def test_ConnectorListener(self):
 		# add Listener.
 		for i in range(OpenRTM_aist.ConnectorListenerType.CONNECTOR_LISTENER_NUM):
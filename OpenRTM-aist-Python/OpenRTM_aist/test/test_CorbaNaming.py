@@ -176,6 +176,49 @@ class TestCorbaNaming(unittest.TestCase):
 		self.assertEqual(str("desRec0.desRec0_cxt/desRec1.desRec1_cxt/desRec2.desRec2_cxt/"),str(string_name))
 		print ".",string_name,"."
 
+	def test_resolveCache(self):
+		self.naming.setCacheTTL(10.0)
+		name = "cache0.cache_cxt/cache1.rtc"
+		obj = self.naming.newContext()
+		self.naming.rebindByString(name, obj)
+
+		# bound objects are cached
+		self.assertEqual(obj._is_equivalent(self.naming.resolveStr(name)), True)
+		self.assertEqual(self.naming.getCacheStats()["hits"], 1)
+
+		# unbind invalidates the cache
+		self.naming.unbind(name)
+		self.assertEqual(self.naming.resolveStr(name), None)
+		self.assertEqual(self.naming.getCacheStats()["misses"], 1)
+
+		# expired entries are not used
+		self.naming.setCacheTTL(0.1)
+		self.naming.rebindByString(name, obj)
+		time.sleep(0.2)
+		self.assertEqual(obj._is_equivalent(self.naming.resolveStr(name)), True)
+		self.assertEqual(self.naming.getCacheStats()["misses"], 2)
+		self.naming.unbind(name)
+		self.naming.setCacheTTL(0.0)
+
+	def test_contextCache(self):
+		self.naming.setCacheTTL(10.0)
+		name = []
+		name.append(CosNaming.NameComponent("cxtCache0","cxtCache0_cxt"))
+		name.append(CosNaming.NameComponent("cxtCache1","cxtCache1_cxt"))
+		self.naming.unbind(name)
+		name.append(CosNaming.NameComponent("cxtCache2","rtc"))
+		self.naming.bind(name, self.naming.newContext())
+		self.assertEqual(self.naming.getCacheStats()["context_misses"], 1)
+
+		# the intermediate contexts are taken from the cache
+		name[2] = CosNaming.NameComponent("cxtCache2","cxtCache2_cxt")
+		name.append(CosNaming.NameComponent("cxtCache3","rtc"))
+		obj = self.naming.newContext()
+		self.naming.bind(name, obj)
+		self.assertEqual(self.naming.getCacheStats()["context_hits"], 1)
+		self.naming.setCacheTTL(0.0)
+		self.assertEqual(obj._is_equivalent(self.naming.resolve(name)), True)
+
 ############### test #################
 if __name__ == '__main__':
 	unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_DequeBuffer.py
+# \brief test for DequeBuffer class
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+
+import sys
+sys.path.insert(1,"../")
+sys.path.insert(1,"../RTM_IDL")
+
+import unittest
+import threading
+
+from DequeBuffer import *
+import OpenRTM_aist
+
+class TestDequeBuffer(unittest.TestCase):
+
+	def setUp(self):
+		self._rb = DequeBuffer()
+
+
+	def test_init(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("length","5")
+		prop.setProperty("write.full_policy","overwrite")
+		prop.setProperty("write.timeout","5.0")
+		prop.setProperty("read.empty_policy","readback")
+		prop.setProperty("read.timeout","5.0")
+		self._rb.init(prop)
+		self.assertEqual(self._rb.length(),5)
+		return
+
+	def test_length(self):
+		self.assertEqual(self._rb.length(), 8)
+		self.assertEqual(self._rb.length(7), OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.length(), 7)
+		self.assertEqual(self._rb.length(0), OpenRTM_aist.BufferStatus.NOT_SUPPORTED)
+		self.assertEqual(self._rb.length(-1), OpenRTM_aist.BufferStatus.NOT_SUPPORTED)
+		self.assertEqual(self._rb.length(1), OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.length(), 1)
+		return
+
+	def test_reset(self):
+		self.assertEqual(self._rb.write(123), OpenRTM_aist.BufferStatus.BUFFER_OK)
+		value = [None]
+		self.assertEqual(self._rb.read(value),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(value[0],123)
+		self._rb.reset()
+		self.assertEqual(self._rb.read(value),OpenRTM_aist.BufferStatus.BUFFER_EMPTY)
+		self.assertEqual(value[0],123)
+		return
+
+	def test_write(self):
+		data=[0]
+		for val in [1, 2, "string", [1,2,3], 0.12345]:
+			self.assertEqual(self._rb.write(val),OpenRTM_aist.BufferStatus.BUFFER_OK)
+			self._rb.read(data)
+			self.assertEqual(data[0],val)
+
+		for i in range(8):
+			self.assertEqual(self._rb.write(0.12345,1,0),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.write(0.12345,0,1000),OpenRTM_aist.BufferStatus.TIMEOUT)
+		return
+
+	def test_write_overwrite(self):
+		for i in range(10):
+			self.assertEqual(self._rb.write(i),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.readable(),8)
+		data=[0]
+		self._rb.read(data)
+		self.assertEqual(data[0],2)
+		return
+
+	def test_write_do_nothing(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("length","2")
+		prop.setProperty("write.full_policy","do_nothing")
+		self._rb.init(prop)
+		self.assertEqual(self._rb.write(1),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.write(2),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.write(3),OpenRTM_aist.BufferStatus.BUFFER_FULL)
+		self.assertEqual(self._rb.full(),True)
+		return
+
+	def test_write_block(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("length","1")
+		prop.setProperty("write.full_policy","block")
+		prop.setProperty("write.timeout","2.0")
+		self._rb.init(prop)
+		self.assertEqual(self._rb.write(1),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		reader = threading.Timer(0.1, self._rb.read, [[None]])
+		reader.start()
+		self.assertEqual(self._rb.write(2),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		reader.join()
+		data=[0]
+		self._rb.read(data)
+		self.assertEqual(data[0],2)
+		return
+
+	def test_read(self):
+		data=[0]
+		self.assertEqual(self._rb.read(data,0,1000),OpenRTM_aist.BufferStatus.TIMEOUT)
+		self.assertEqual(self._rb.write("string"),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data[0],"string")
+		self.assertEqual(self._rb.read(data,0,1000),OpenRTM_aist.BufferStatus.TIMEOUT)
+		return
+
+	def test_read_readback(self):
+		data=[0]
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_EMPTY)
+		self._rb.write(1)
+		self._rb.read(data)
+		data[0] = 0
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data[0],1)
+		self.assertEqual(self._rb.readable(),0)
+		return
+
+	def test_read_block(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("read.empty_policy","block")
+		prop.setProperty("read.timeout","2.0")
+		self._rb.init(prop)
+		writer = threading.Timer(0.1, self._rb.write, [3])
+		writer.start()
+		data=[0]
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data[0],3)
+		writer.join()
+		return
+
+	def test_advanceRptr(self):
+		for i in range(3):
+			self._rb.write(i)
+		self.assertEqual(self._rb.get(),0)
+		self.assertEqual(self._rb.advanceRptr(2),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.get(),2)
+		self.assertEqual(self._rb.rptr(-1),1)
+		self.assertEqual(self._rb.advanceRptr(-2),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.readable(),3)
+		self.assertEqual(self._rb.get(),0)
+		self.assertEqual(self._rb.advanceRptr(4),OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET)
+		self.assertEqual(self._rb.advanceRptr(-1),OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET)
+		return
+
+	def test_put(self):
+		self.assertEqual(self._rb.put(5),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.wptr(),5)
+		self.assertEqual(self._rb.readable(),0)
+		self.assertEqual(self._rb.advanceWptr(),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.readable(),1)
+		self.assertEqual(self._rb.get(),5)
+		return
+
+	def test_readN(self):
+		data=[]
+		self.assertEqual(self._rb.readN(data),OpenRTM_aist.BufferStatus.BUFFER_EMPTY)
+		for i in range(10):
+			self._rb.write(i)
+		self.assertEqual(self._rb.readN(data,3),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data,[2,3,4])
+		data=[]
+		self.assertEqual(self._rb.readN(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data,[5,6,7,8,9])
+		self.assertEqual(self._rb.empty(),True)
+		self.assertEqual(self._rb.advanceRptr(-2),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.get(),8)
+		return
+
+	def test_readable(self):
+		data=[0]
+		self.assertEqual(self._rb.readable(),0)
+		self.assertEqual(self._rb.writable(),8)
+		self.assertEqual(self._rb.write("string"),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.readable(),1)
+		self.assertEqual(self._rb.writable(),7)
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.readable(),0)
+		return
+
+	def test_empty(self):
+		data=[0]
+		self.assertEqual(self._rb.empty(),True)
+		self.assertEqual(self._rb.write("string"),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.empty(),False)
+		self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(self._rb.empty(),True)
+		return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_ExecutionStatistics.py
+# \brief test for ExecutionStatistics class
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from ExecutionStatistics import *
+import OpenRTM_aist
+
+
+class TestExecutionStatistics(unittest.TestCase):
+
+	def setUp(self):
+		self._stat = ExecutionStatistics()
+
+
+	def test_update(self):
+		stat = self._stat.getStatistics()
+		self.assertEqual(self._stat.count(), 0)
+		self.assertEqual(stat._max_interval, 0.0)
+
+		for t in [0.002, 0.004, 0.004, 0.004, 0.005, 0.005, 0.007, 0.009]:
+			self._stat.update(t, 0.005)
+
+		stat = self._stat.getStatistics()
+		self.assertEqual(self._stat.count(), 8)
+		self.assertEqual(self._stat.overrun(), 2)
+		self.assertAlmostEqual(stat._max_interval, 0.009)
+		self.assertAlmostEqual(stat._min_interval, 0.002)
+		self.assertAlmostEqual(stat._mean_interval, 0.005)
+		self.assertAlmostEqual(stat._std_deviation, 0.002)
+		return
+
+
+	def test_histogram(self):
+		for t in [0.000005, 0.00001, 0.000015, 0.003, 1.0]:
+			self._stat.update(t)
+		hist = self._stat.histogram()
+		self.assertEqual(len(hist), len(ExecutionStatistics.HISTOGRAM_BOUNDS) + 1)
+		self.assertEqual(hist[0], (10, 2))
+		self.assertEqual(hist[1], (20, 1))
+		self.assertEqual(hist[8], (5000, 1))
+		self.assertEqual(hist[-1], (None, 1))
+		self.assertEqual(self._stat.overrun(), 0)
+
+		self._stat.reset()
+		self.assertEqual(self._stat.count(), 0)
+		self.assertEqual(self._stat.histogram()[0], (10, 0))
+		return
+
+
+	def test_toProperties(self):
+		self._stat.update(0.003, 0.001)
+		prop = OpenRTM_aist.Properties()
+		self._stat.toProperties(prop.getNode("comp0"))
+		self.assertEqual(prop.getProperty("comp0.count"), "1")
+		self.assertEqual(prop.getProperty("comp0.overrun"), "1")
+		self.assertEqual(prop.getProperty("comp0.max"), "0.003")
+		self.assertEqual(prop.getProperty("comp0.histogram.5000"), "1")
+		self.assertEqual(prop.getProperty("comp0.histogram.inf"), "0")
+		return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -39,6 +39,20 @@ class DFP(OpenRTM_aist.RTObject_impl):
 		print "on_execute"
 		return RTC.RTC_OK
 
+class CompMock:
+	def __init__(self):
+		self._sm = self
+		self._count = 0
+
+	def on_startup(self):
+		return
+
+	def on_shutdown(self):
+		return
+
+	def worker(self):
+		self._count += 1
+
 class TestExtTrigExecutionContext(unittest.TestCase):
 	def setUp(self):
 		self._dfp = DFP()
@@ -59,6 +73,59 @@ class TestExtTrigExecutionContext(unittest.TestCase):
 		self.etec.tick()
 		time.sleep(3)
 
+	def test_tick_sleep(self):
+		self.etec.set_rate(10.0)
+		comp = CompMock()
+		self.etec._comps.append(comp)
+		self.assertEqual(self.etec.start(),RTC.RTC_OK)
+		for i in range(20):
+			self.etec.tick()
+		import time
+		time.sleep(0.5)
+		# ticks made during a cycle are merged into one
+		self.assertEqual(1 <= comp._count <= 2, True)
+		self.assertEqual(self.etec.stop(),RTC.RTC_OK)
+
+	def test_tick_immediate(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("tick_mode", "immediate")
+		self.etec.setTickMode(prop)
+		comp = CompMock()
+		self.etec._comps.append(comp)
+		self.assertEqual(self.etec.start(),RTC.RTC_OK)
+		for i in range(100):
+			self.etec.tick()
+		import time
+		time.sleep(0.5)
+		self.assertEqual(comp._count, 100)
+		self.assertEqual(self.etec.stop(),RTC.RTC_OK)
+
+	def test_sync_tick(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("tick_mode", "immediate")
+		prop.setProperty("sync_tick", "YES")
+		self.etec.setTickMode(prop)
+		comp = CompMock()
+		self.etec._comps.append(comp)
+		self.assertEqual(self.etec.start(),RTC.RTC_OK)
+		for i in range(100):
+			self.etec.tick()
+			self.assertEqual(comp._count, i + 1)
+		self.assertEqual(self.etec.stop(),RTC.RTC_OK)
+
+	def test_sync_tick_sleep(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("sync_tick", "YES")
+		self.etec.setTickMode(prop)
+		self.etec.set_rate(100.0)
+		comp = CompMock()
+		self.etec._comps.append(comp)
+		self.assertEqual(self.etec.start(),RTC.RTC_OK)
+		for i in range(10):
+			self.etec.tick()
+			self.assertEqual(comp._count, i + 1)
+		self.assertEqual(self.etec.stop(),RTC.RTC_OK)
+
 ############### test #################
 if __name__ == '__main__':
         unittest.main()
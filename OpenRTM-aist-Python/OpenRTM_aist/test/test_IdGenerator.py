@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_IdGenerator.py
+# \brief test for IdGenerator classes
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+
+import OpenRTM_aist
+from IdGenerator import *
+
+
+UUID_FORMAT = "^[0-9a-f]{8}-[0-9a-f]{4}-%d[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+
+
+class TestIdGenerator(unittest.TestCase):
+	def setUp(self):
+		OpenRTM_aist.IdGeneratorInit()
+		return
+
+	def check_unique(self, gen):
+		ids = gen.generateList(1000)
+		for i in range(100):
+			ids.append(gen.generate())
+		self.assertEqual(len(set(ids)), 1100)
+		return ids
+
+	def test_uuid1(self):
+		gen = Uuid1IdGenerator()
+		for id in self.check_unique(gen):
+			self.assertNotEqual(re.match(UUID_FORMAT % 1, id), None)
+			self.assertEqual(id[-12:], "%012x" % getNodeId())
+		# the timestamps increase
+		ids = gen.generateList(10)
+		ts = [(id[15:18], id[9:13], id[0:8]) for id in ids]
+		self.assertEqual(sorted(ts), ts)
+		return
+
+	def test_uuid4(self):
+		gen = Uuid4IdGenerator()
+		for id in self.check_unique(gen):
+			self.assertNotEqual(re.match(UUID_FORMAT % 4, id), None)
+		return
+
+	def test_counter(self):
+		gen = CounterIdGenerator()
+		ids = self.check_unique(gen)
+		prefix = "%012x-%x-" % (getNodeId(), os.getpid())
+		for id in ids:
+			self.assertEqual(id.startswith(prefix), True)
+		self.assertEqual(ids[0][-1:], "0")
+		return
+
+	def test_threads(self):
+		gen = CounterIdGenerator()
+		ids = []
+		def run():
+			ids.extend(gen.generateList(500))
+		threads = [threading.Thread(target=run) for i in range(4)]
+		for th in threads:
+			th.start()
+		for th in threads:
+			th.join()
+		self.assertEqual(len(set(ids)), 2000)
+		return
+
+	def test_readNodeId(self):
+		path = tempfile.mkdtemp()
+		try:
+			for name, addr in [("lo", "00:00:00:00:00:00"),
+					   ("eth0", "00:11:22:aa:bb:cc")]:
+				os.mkdir(os.path.join(path, name))
+				f = open(os.path.join(path, name, "address"), "w")
+				f.write(addr + "\n")
+				f.close()
+			self.assertEqual(readNodeId(path), 0x001122aabbccL)
+			self.assertEqual(readNodeId(os.path.join(path, "none")), None)
+		finally:
+			shutil.rmtree(path)
+		self.assertEqual(getNodeId(), getNodeId())
+		return
+
+	def test_factory(self):
+		factory = OpenRTM_aist.IdGeneratorFactory.instance()
+		self.assertEqual(isinstance(factory.createObject("uuid1"),
+					    OpenRTM_aist.Uuid1IdGenerator), True)
+		self.assertEqual(isinstance(factory.createObject("uuid4"),
+					    OpenRTM_aist.Uuid4IdGenerator), True)
+		self.assertEqual(isinstance(factory.createObject("counter"),
+					    OpenRTM_aist.CounterIdGenerator), True)
+		return
+
+
+############### test #################
+if __name__ == '__main__':
+	unittest.main()
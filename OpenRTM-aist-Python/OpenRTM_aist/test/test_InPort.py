@@ -85,6 +85,12 @@ class ConnectorMock:
 	        self._buffer.read(data)
 		return OpenRTM_aist.DataPortStatus.PORT_OK
 
+	def readN(self, data, n = -1):
+		del data[:]
+		if self._buffer.readN(data, n) == OpenRTM_aist.BufferStatus.BUFFER_EMPTY:
+			return OpenRTM_aist.DataPortStatus.BUFFER_EMPTY
+		return OpenRTM_aist.DataPortStatus.PORT_OK
+
 	def getBuffer(self):
 		ret = self._buffer.readable()
 		return self._buffer
@@ -114,6 +120,36 @@ class TestInPort(unittest.TestCase):
 		self._ipn.update()
 		return
 
+	def test_readN(self):
+		self._connector = ConnectorMock(OpenRTM_aist.RingBuffer())
+		self._ipn._connectors = [self._connector]
+		self.assertEqual(self._ipn.readAll(), [])
+		for i in range(5):
+			self._connector.write(RTC.TimedLong(RTC.Time(0,0), i))
+		self._ipn.setOnReadConvert(OnRWConvertTest().echo)
+		read_data = self._ipn.readN(2)
+		self.assertEqual([d.data for d in read_data], [0, 1])
+		read_data = self._ipn.readAll()
+		self.assertEqual([d.data for d in read_data], [2, 3, 4])
+		self.assertEqual(self._ipn.isEmpty(), True)
+		self.assertEqual(self._ipn.read().data, 4)
+		return
+
+	def test_read_copy_policy(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("read.copy_policy","none")
+		self._ipn.init(prop)
+		self.assertEqual(self._ipn._copyPolicy,"none")
+		self._connector.write(RTC.TimedLong(RTC.Time(0,0), 789))
+		self.assertEqual(self._ipn.read().data, 789)
+		prop.setProperty("read.copy_policy","Shallow")
+		self._ipn.init(prop)
+		self.assertEqual(self._ipn._copyPolicy,"shallow")
+		prop.setProperty("read.copy_policy","unknown")
+		self._ipn.init(prop)
+		self.assertEqual(self._ipn._copyPolicy,"deep")
+		return
+
 	def test_OnRead(self):
 		self._connector.write(RTC.TimedLong(RTC.Time(0,0), 456))
 		self._ipn.setOnRead(OnRWTest().echo)
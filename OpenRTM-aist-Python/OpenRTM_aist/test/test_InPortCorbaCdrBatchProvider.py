@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+
+#  \file test_InPortCorbaCdrBatchProvider.py
+#  \brief test for InPortCorbaCdrBatchProvider class
+#  \date $Date$
+# 
+#  Copyright (C) 2010
+#      Task-intelligence Research Group,
+#      Intelligent Systems Research Institute,
+#      National Institute of
+#          Advanced Industrial Science and Technology (AIST), Japan
+#      All rights reserved.
+ 
+
+from omniORB import *
+from omniORB import any
+
+import sys
+sys.path.insert(1,"../")
+
+import threading
+import time
+import unittest
+
+from InPortCorbaCdrBatchProvider import *
+
+import RTC, RTC__POA
+import OpenRTM
+import OpenRTM_aist
+
+
+class ConnectorMock:
+	def __init__(self):
+		self._data = []
+		self._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		self._rets = []
+		return
+
+	def write(self, data):
+		self._data.append(data)
+		if self._rets:
+			return self._rets.pop(0)
+		return self._ret
+
+
+
+class TestInPortCorbaCdrBatchProvider(unittest.TestCase):
+	def setUp(self):
+		InPortCorbaCdrBatchProviderInit()
+		self._prov = OpenRTM_aist.InPortProviderFactory.instance().createObject("corba_cdr_batch")
+		self._con = ConnectorMock()
+		self._prov._connector = self._con
+		self._prov.setBuffer(OpenRTM_aist.CdrRingBuffer())
+		return
+
+	def test_put(self):
+		cdrs = []
+		for i in range(3):
+			data = RTC.TimedLong(RTC.Time(0,0),i)
+			cdrs.append(cdrMarshal(any.to_any(data).typecode(), data, 1))
+
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.PORT_OK)
+		self.assertEqual(self._con._data, cdrs)
+
+		# a failed write of the first frame stops the rest
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_FULL
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.BUFFER_FULL)
+		self.assertEqual(len(self._con._data), 4)
+
+		# a later frame is dropped, since the former ones are buffered
+		self._con._data = []
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		self._con._rets = [OpenRTM_aist.BufferStatus.BUFFER_OK,
+				   OpenRTM_aist.BufferStatus.BUFFER_FULL]
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.PORT_OK)
+		self.assertEqual(self._con._data, cdrs)
+		return
+
+	def test_put_full(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("buffer.write.full_policy", "do_nothing")
+		prop.setProperty("buffer.length", "4")
+		buff = OpenRTM_aist.CdrRingBuffer()
+		buff.init(prop.getNode("buffer"))
+		self._prov.setBuffer(buff)
+		info = OpenRTM_aist.ConnectorInfo("name", "id", [], prop)
+		self._prov.setListener(info, OpenRTM_aist.ConnectorListeners())
+
+		cdrs = []
+		for i in range(3):
+			data = RTC.TimedLong(RTC.Time(0,0),i)
+			cdrs.append(cdrMarshal(any.to_any(data).typecode(), data, 1))
+		buff.write(cdrs[0])
+		buff.write(cdrs[0])
+
+		# nothing is written unless all the frames fit in the buffer
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.BUFFER_FULL)
+		self.assertEqual(self._con._data, [])
+
+		buff.get()
+		buff.advanceRptr()
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.PORT_OK)
+		self.assertEqual(self._con._data, cdrs)
+		return
+
+	def test_put_block(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("buffer.write.full_policy", "block")
+		prop.setProperty("buffer.write.timeout", "0.1")
+		prop.setProperty("buffer.length", "4")
+		buff = OpenRTM_aist.CdrRingBuffer()
+		buff.init(prop.getNode("buffer"))
+		self._prov.setBuffer(buff)
+		info = OpenRTM_aist.ConnectorInfo("name", "id", [], prop)
+		self._prov.setListener(info, OpenRTM_aist.ConnectorListeners())
+
+		cdrs = []
+		for i in range(3):
+			data = RTC.TimedLong(RTC.Time(0,0),i)
+			cdrs.append(cdrMarshal(any.to_any(data).typecode(), data, 1))
+		buff.write(cdrs[0])
+		buff.write(cdrs[0])
+
+		# nothing is written if the space is not available in time
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.BUFFER_TIMEOUT)
+		self.assertEqual(self._con._data, [])
+
+		# a batch longer than the buffer is not waited for
+		start = time.time()
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs + cdrs)),OpenRTM.BUFFER_TIMEOUT)
+		self.assertEqual(time.time() - start < 0.1, True)
+
+		# the space freed while waiting is used
+		def read():
+			time.sleep(0.02)
+			buff.get()
+			buff.advanceRptr()
+		th = threading.Thread(target=read)
+		th.start()
+		self.assertEqual(self._prov.put(OpenRTM_aist.packCdrBatch(cdrs)),OpenRTM.PORT_OK)
+		th.join()
+		self.assertEqual(self._con._data, cdrs)
+		return
+
+	def test_put_malformed(self):
+		self.assertEqual(self._prov.put("abc"),OpenRTM.PORT_ERROR)
+		self.assertEqual(self._con._data, [])
+		return
+
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
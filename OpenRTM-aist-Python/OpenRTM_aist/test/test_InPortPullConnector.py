@@ -19,6 +19,8 @@ import sys
 sys.path.insert(1,"../")
 
 import unittest
+import time
+import threading
 
 from InPortPullConnector import *
 
@@ -37,6 +39,24 @@ class InPortConsumerMock:
   def get(self, data):
     return OpenRTM_aist.DataPortStatus.PORT_OK
 
+class InPortConsumerCounter(InPortConsumerMock):
+  def __init__(self):
+    self._mutex = threading.Lock()
+    self._count = 0
+    self._ret = OpenRTM_aist.DataPortStatus.PORT_OK
+    self._block = 0
+    self._gate = threading.Event()
+
+  def get(self, data):
+    self._mutex.acquire()
+    self._count += 1
+    count = self._count
+    data[0] = count
+    self._mutex.release()
+    if count == self._block:
+      self._gate.wait()
+    return self._ret
+
 class TestInPortPullConnector(unittest.TestCase):
   def setUp(self):
     OpenRTM_aist.Manager.instance()
@@ -63,6 +83,80 @@ class TestInPortPullConnector(unittest.TestCase):
     self._con.createBuffer(OpenRTM_aist.ConnectorInfo("name","id",[],OpenRTM_aist.Properties()))
     return
 
+  def test_prefetch(self):
+    consumer = InPortConsumerCounter()
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("inport.prefetch", "YES")
+    prop.setProperty("inport.prefetch.max_age", "10.0")
+    con = InPortPullConnector(OpenRTM_aist.ConnectorInfo("name","id",[],prop),
+                              consumer,OpenRTM_aist.ConnectorListeners())
+
+    # the first read gets synchronously and starts prefetching
+    data = [None]
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],1)
+    con._fetch.wait()
+    self.assertEqual(consumer._count,2)
+
+    # the prefetched data is returned without another get
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],2)
+    con._fetch.wait()
+    self.assertEqual(consumer._count,3)
+
+    # too old data is discarded and got again
+    con._maxAge = 0.0
+    time.sleep(0.01)
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],4)
+    con._fetch.wait()
+
+    # a failed prefetch is retried synchronously
+    con._maxAge = 10.0
+    consumer._ret = OpenRTM_aist.DataPortStatus.BUFFER_EMPTY
+    con._fetch = None
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.BUFFER_EMPTY)
+    con._fetch.wait()
+    consumer._ret = OpenRTM_aist.DataPortStatus.PORT_OK
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],8)
+    con._fetch.wait()
+
+    self.assertEqual(con.disconnect(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(con._fetch,None)
+    return
+
+  def test_prefetch_unfinished(self):
+    consumer = InPortConsumerCounter()
+    consumer._block = 2
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("inport.prefetch", "YES")
+    prop.setProperty("inport.prefetch.max_age", "0.05")
+    con = InPortPullConnector(OpenRTM_aist.ConnectorInfo("name","id",[],prop),
+                              consumer,OpenRTM_aist.ConnectorListeners())
+
+    data = [None]
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],1)
+
+    # a blocked prefetch is not waited for, and kept for the next read
+    fetch = con._fetch
+    start = time.time()
+    self.assertEqual(con.getPrefetched(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0],3)
+    self.assertEqual(time.time() - start < 1.0, True)
+    self.assertEqual(con._fetch is fetch, True)
+    self.assertEqual(fetch.finished(), False)
+
+    # disconnect() does not wait for the blocked prefetch either
+    start = time.time()
+    self.assertEqual(con.disconnect(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(time.time() - start < 1.0, True)
+    consumer._gate.set()
+    fetch.wait()
+    self.assertEqual(consumer._count,3)
+    return
+
 
 
 
@@ -40,6 +40,9 @@ class InPortProviderMock:
   def setListener(self, info, listener):
     pass
 
+  def exit(self):
+    pass
+
 
 class TestInPortPushConnector(unittest.TestCase):
   def setUp(self):
@@ -53,6 +56,17 @@ class TestInPortPushConnector(unittest.TestCase):
     self.assertEqual(self._con.read(data),OpenRTM_aist.DataPortStatus.BUFFER_TIMEOUT)
     return
 
+  def test_readN(self):
+    data = []
+    self.assertEqual(self._con.readN(data),OpenRTM_aist.DataPortStatus.BUFFER_EMPTY)
+    for i in range(3):
+      self._con.getBuffer().write(i)
+    self.assertEqual(self._con.readN(data,2),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data,[0,1])
+    self.assertEqual(self._con.readAll(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data,[2])
+    return
+
   def test_disconnect(self):
     self.assertEqual(self._con.disconnect(),OpenRTM_aist.DataPortStatus.PORT_OK)
     return
@@ -69,6 +83,42 @@ class TestInPortPushConnector(unittest.TestCase):
     self._con.createBuffer(OpenRTM_aist.ConnectorInfo("name","id",[],OpenRTM_aist.Properties()))
     return
 
+  def test_lazyDecode(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("inport.decode", "lazy")
+    prop.setProperty("buffer.length", "1")
+    prop.setProperty("buffer.write.full_policy", "overwrite")
+    info = OpenRTM_aist.ConnectorInfo("name","id",[],prop)
+    con = InPortPushConnector(info,InPortProviderMock(),OpenRTM_aist.ConnectorListeners())
+    val = RTC.TimedLong(RTC.Time(0,0),0)
+    con.setDataType(val)
+    con.setConnectorInfo(info)
+    decoded = []
+    unmarshal = con.unmarshal
+    def count(cdr, endian):
+      decoded.append(cdr)
+      return unmarshal(cdr, endian)
+    con.unmarshal = count
+
+    # overwritten samples are never unmarshaled
+    tc = any.to_any(val).typecode()
+    for i in range(10):
+      val.data = i
+      self.assertEqual(con.write(cdrMarshal(tc, val, True)),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(len(decoded), 0)
+    data = [None]
+    self.assertEqual(con.read(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(data[0].data, 9)
+    self.assertEqual(len(decoded), 1)
+
+    val.data = 10
+    con.write(cdrMarshal(tc, val, True))
+    data = []
+    self.assertEqual(con.readN(data),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual([d.data for d in data], [10])
+    self.assertEqual(len(decoded), 2)
+    return
+
 
 
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_InPortSharedMemoryProvider.py
+# \brief test for InPortSharedMemoryProvider and InPortSharedMemoryConsumer
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import time
+import unittest
+
+from InPortSharedMemoryProvider import *
+
+import OpenRTM_aist
+
+
+class ConnectorMock:
+	def __init__(self):
+		self._data = []
+		self._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		return
+
+	def write(self, data):
+		if self._ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+			self._data.append(data)
+		return self._ret
+
+
+
+class TestInPortSharedMemoryProvider(unittest.TestCase):
+	def setUp(self):
+		OpenRTM_aist.InPortSharedMemoryProviderInit()
+		OpenRTM_aist.InPortSharedMemoryConsumerInit()
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("shared_memory.buffer_size", "1024")
+		self._prov = OpenRTM_aist.InPortProviderFactory.instance().createObject("shared_memory")
+		self._prov.init(prop)
+		self._con = ConnectorMock()
+		self._prov.setConnector(self._con)
+		self._prov.setBuffer(OpenRTM_aist.CdrRingBuffer())
+		self._cons = OpenRTM_aist.InPortConsumerFactory.instance().createObject("shared_memory")
+		self._cons.init(OpenRTM_aist.Properties())
+		return
+
+	def tearDown(self):
+		self._cons.unsubscribeInterface([])
+		self._prov.exit()
+		return
+
+	def wait(self, n):
+		for i in range(100):
+			if len(self._con._data) >= n:
+				return
+			time.sleep(0.01)
+		return
+
+	def test_publishInterface(self):
+		prop = []
+		OpenRTM_aist.NVUtil.appendStringValue(prop, "dataport.interface_type",
+						      "shared_memory")
+		self.assertEqual(self._prov.publishInterface(prop), True)
+		filename = OpenRTM_aist.NVUtil.toString(prop, "dataport.shared_memory.file")
+		fifo = OpenRTM_aist.NVUtil.toString(prop, "dataport.shared_memory.fifo")
+		self.assertEqual(os.path.exists(filename), True)
+		self.assertEqual(os.path.exists(fifo), True)
+
+		self._prov.exit()
+		self.assertEqual(os.path.exists(filename), False)
+		self.assertEqual(os.path.exists(fifo), False)
+		return
+
+	def test_put(self):
+		self.assertEqual(self._cons.put("abc"), OpenRTM_aist.DataPortStatus.CONNECTION_LOST)
+		self.assertEqual(self._cons.subscribeInterface(self._prov._properties), True)
+
+		cdrs = ["data%d" % i for i in range(100)]
+		for cdr in cdrs:
+			self.assertEqual(self._cons.put(cdr), OpenRTM_aist.DataPortStatus.PORT_OK)
+		self.wait(len(cdrs))
+		self.assertEqual(self._con._data, cdrs)
+
+		self.assertEqual(self._cons.put("x" * 2048), OpenRTM_aist.DataPortStatus.PORT_ERROR)
+
+		self._prov.exit()
+		self.assertEqual(self._cons.put("abc"), OpenRTM_aist.DataPortStatus.CONNECTION_LOST)
+		return
+
+	def test_put_full(self):
+		self.assertEqual(self._cons.subscribeInterface(self._prov._properties), True)
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_FULL
+
+		# the data is left in the ring while the buffer is full
+		cdrs = []
+		for i in range(200):
+			cdr = "data%03d" % i
+			ret = self._cons.put(cdr)
+			if ret != OpenRTM_aist.DataPortStatus.PORT_OK:
+				break
+			cdrs.append(cdr)
+		self.assertEqual(ret, OpenRTM_aist.DataPortStatus.SEND_FULL)
+		time.sleep(0.05)
+		self.assertEqual(self._con._data, [])
+
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		self.wait(len(cdrs))
+		self.assertEqual(self._con._data, cdrs)
+		return
+
+	def test_corrupted(self):
+		self.assertEqual(self._cons.subscribeInterface(self._prov._properties), True)
+		ring = self._prov._ring
+		ring._copyIn(0, OpenRTM_aist.SHM_RING_LENGTH.pack(1000))
+		ring._setPosition(OpenRTM_aist.SHM_RING_WPOS_OFFSET, 4)
+
+		# the unread data are dropped and the receiver keeps running
+		self.assertEqual(self._cons.put("abc"), OpenRTM_aist.DataPortStatus.PORT_OK)
+		time.sleep(0.05)
+		self.assertEqual(self._con._data, [])
+		self.assertEqual(self._cons.put("def"), OpenRTM_aist.DataPortStatus.PORT_OK)
+		self.wait(1)
+		self.assertEqual(self._con._data, ["def"])
+		return
+
+	def test_subscribeInterface(self):
+		self.assertEqual(self._cons.subscribeInterface([]), False)
+		prop = []
+		OpenRTM_aist.NVUtil.appendStringValue(prop, "dataport.shared_memory.file",
+						      "/nonexistent/ring")
+		OpenRTM_aist.NVUtil.appendStringValue(prop, "dataport.shared_memory.fifo",
+						      "/nonexistent/fifo")
+		self.assertEqual(self._cons.subscribeInterface(prop), False)
+		return
+
+
+
+if __name__ == '__main__':
+        unittest.main()
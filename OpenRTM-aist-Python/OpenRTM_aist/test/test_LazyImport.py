@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# @file test_LazyImport.py
+# @brief test for lazy loading of OpenRTM_aist package
+# @date $Date$
+#
+# Copyright (C) 2010
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import ast
+import unittest
+
+import OpenRTM_aist
+
+
+def publicNames(path):
+	names = []
+	def walk(body):
+		for node in body:
+			if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+				names.append(node.name)
+			elif isinstance(node, ast.Assign):
+				for target in node.targets:
+					for n in ast.walk(target):
+						if isinstance(n, ast.Name):
+							names.append(n.id)
+			elif isinstance(node, ast.If):
+				walk(node.body)
+				walk(node.orelse)
+			elif isinstance(node, ast.TryExcept):
+				walk(node.body)
+				walk(node.orelse)
+				for handler in node.handlers:
+					walk(handler.body)
+			elif isinstance(node, ast.TryFinally):
+				walk(node.body)
+				walk(node.finalbody)
+	walk(ast.parse(open(path).read()).body)
+
+	result = []
+	for name in names:
+		if not name.startswith("_") and name not in result:
+			result.append(name)
+	return result
+
+
+class TestLazyImport(unittest.TestCase):
+	def setUp(self):
+		self._dir = os.path.dirname(OpenRTM_aist.__file__)
+
+	def test_table(self):
+		for mod, names in OpenRTM_aist._lazy_modules:
+			if names is None:
+				continue
+			self.assertEqual(list(names),
+					 publicNames(os.path.join(self._dir, mod + ".py")))
+
+	def test_load(self):
+		prop = OpenRTM_aist.Properties()
+		self.assertEqual(sys.modules.has_key("OpenRTM_aist.Properties"), True)
+		self.assertEqual(OpenRTM_aist.Properties,
+				 sys.modules["OpenRTM_aist.Properties"].Properties)
+
+	def test_module_name(self):
+		# Factory.py is hidden by Factory class in GlobalFactory.py
+		OpenRTM_aist.Delete
+		self.assertEqual(OpenRTM_aist.Factory,
+				 sys.modules["OpenRTM_aist.GlobalFactory"].Factory)
+		self.assertEqual(OpenRTM_aist.NVUtil,
+				 sys.modules["OpenRTM_aist.NVUtil"])
+		self.assertEqual(OpenRTM_aist.CORBA_SeqUtil.for_each,
+				 sys.modules["OpenRTM_aist.CORBA_SeqUtil"].for_each)
+		self.assertEqual(OpenRTM_aist.for_each,
+				 sys.modules["OpenRTM_aist.StringUtil"].for_each)
+
+	def test_all(self):
+		names = OpenRTM_aist.__all__
+		for mod, modnames in OpenRTM_aist._lazy_modules:
+			for name in modnames or ():
+				self.assertEqual(name in names, True)
+		self.assertEqual(OpenRTM_aist.Factory,
+				 sys.modules["OpenRTM_aist.GlobalFactory"].Factory)
+		self.assertRaises(AttributeError, getattr, OpenRTM_aist, "nonexistent")
+
+
+############### test #################
+if __name__ == '__main__':
+	unittest.main()
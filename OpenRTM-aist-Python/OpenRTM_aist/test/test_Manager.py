@@ -162,6 +162,23 @@ class TestManager(unittest.TestCase):
     time.sleep(0.1)
     return
 
+  def test_createComponents(self):
+    self.manager.activateManager()
+    profile = OpenRTM_aist.Properties(defaults_str=testcomp_spec)
+    self.manager.registerFactory(profile,
+               TestComp,
+               OpenRTM_aist.Delete)
+    comps = self.manager.createComponents(["TestComp", "NoSuchComp", "TestComp"])
+    self.assertEqual(len(comps), 3)
+    self.assertNotEqual(comps[0],None)
+    self.assertEqual(comps[1],None)
+    self.assertNotEqual(comps[2],None)
+    self.assertEqual(len(self.manager.getComponents()), 2)
+    self.assertNotEqual(comps[0].getInstanceName(), comps[2].getInstanceName())
+    self.manager.shutdownComponents()
+    time.sleep(0.1)
+    return
+
   def test_getORB(self):
     self.manager.getORB()
     return
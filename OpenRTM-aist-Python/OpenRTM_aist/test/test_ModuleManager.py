@@ -174,6 +174,44 @@ class TestModuleManager(unittest.TestCase):
     return
 
 
+  def test_moduleIndex(self):
+    import tempfile, shutil
+    tmpdir = tempfile.mkdtemp()
+    try:
+      modfile = os.path.join(tmpdir, "IndexSample.py")
+      f = open(modfile, "w")
+      f.write('indexsample_spec = ["implementation_id", "IndexSample",\n'
+              '                    "type_name", "IndexSample", ""]\n')
+      f.close()
+      prop = OpenRTM_aist.Properties(defaults_str=configsample_spec)
+      prop.setProperty("manager.modules.index_file",
+                       os.path.join(tmpdir, "index", "modules"))
+      mm = ModuleManager(prop)
+      mm.setLoadpath([tmpdir])
+      profs = mm.getLoadableModules()
+      self.assertEqual(len(profs), 1)
+      self.assertEqual(profs[0].getProperty("implementation_id"), "IndexSample")
+      self.assert_(os.path.isfile(os.path.join(tmpdir, "index", "modules")))
+
+      # the index is read by another instance without importing the module
+      del sys.modules["IndexSample"]
+      mm = ModuleManager(prop)
+      mm.setLoadpath([tmpdir])
+      mm.loadIndex()
+      self.assertEqual(mm._index[os.path.abspath(modfile)][2][1], "IndexSample")
+      profs = mm.getLoadableModules()
+      self.assertEqual(len(profs), 1)
+      self.assert_(not sys.modules.has_key("IndexSample"))
+
+      # entries of removed files are dropped
+      os.remove(modfile)
+      self.assertEqual(mm.getLoadableModules(), [])
+      self.assert_(not mm._index.has_key(os.path.abspath(modfile)))
+    finally:
+      shutil.rmtree(tmpdir)
+    return
+
+
 
 ############### test #################
 if __name__ == '__main__':
@@ -158,6 +158,45 @@ class TestNVUtil(unittest.TestCase):
 		self.assertEqual(list_,[1,2,3,4,5,6])
 		
 
+	def test_NVListView(self):
+		nv = [newNV("id0",0),newNV("id1",1),newNV("string","test"),newNV("id1",2)]
+		view_ = NVListView(nv)
+		self.assertEqual(view_.find_index("id0"),0)
+		self.assertEqual(view_.find_index("id1"),1)
+		self.assertEqual(view_.find_index("none"),-1)
+		self.assertEqual(view_.value("id1"),1)
+		self.assertEqual(find_index(view_,"string"),2)
+		self.assertEqual(find(view_,"id0").value(),0)
+		self.assertEqual(isString(view_,"string"),True)
+		self.assertEqual(isString(view_,"id0"),False)
+		self.assertEqual(toString(view_,"string"),"test")
+		self.assertEqual(len(view_),4)
+		self.assertEqual(view(view_) is view_,True)
+
+		prop = view_.toProperties()
+		self.assertEqual(prop.getProperty("id0"),"0")
+		self.assertEqual(prop.getProperty("string"),"test")
+		self.assertEqual(view_.toProperties() is prop,True)
+
+		# appended elements are indexed
+		append(view_,[newNV("id4",4)])
+		self.assertEqual(len(nv),5)
+		self.assertEqual(view_.find_index("id4"),4)
+		self.assertEqual(view_.toProperties().getProperty("id4"),"4")
+
+		# replaced values are extracted again
+		self.assertEqual(appendStringValue(view_,"string","test1"),True)
+		self.assertEqual(view_.value("string"),"test, test1")
+		self.assertEqual(view_.toProperties().getProperty("string"),"test, test1")
+
+		# replaced and removed elements are indexed again
+		nv[0] = newNV("id5",5)
+		self.assertEqual(view_.find_index("id0"),-1)
+		self.assertEqual(view_.find_index("id5"),0)
+		del nv[-1]
+		self.assertEqual(view_.find_index("id4"),-1)
+
+
 	def test_dump(self):
 		nv = [newNV("string","test0, test1, test2")]
 		dump(nv)
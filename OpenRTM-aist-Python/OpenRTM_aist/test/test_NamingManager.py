@@ -17,7 +17,10 @@
 
 import sys
 sys.path.insert(1,"../")
+import omniORB
 from omniORB import CORBA
+import threading
+import time
 
 import unittest
 
@@ -34,6 +37,38 @@ class test_comp(OpenRTM_aist.RTObject_impl):
 		print msg
 		return msg
 
+class StubNaming(NamingBase):
+	def __init__(self, block=False):
+		self.names = {}
+		self.binds = 0
+		self.alive = True
+		self.fail = []
+		self.event = threading.Event()
+		if not block:
+			self.event.set()
+
+	def bindObject(self, name, rtobj):
+		self.event.wait()
+		self.binds += 1
+		if name in self.fail:
+			raise RuntimeError(name)
+		self.names[name] = rtobj
+
+	def unbindObject(self, name):
+		self.event.wait()
+		self.names.pop(name, None)
+
+	def isAlive(self):
+		return self.alive
+
+
+def wait_for(pred, timeout=2.0):
+	end = time.time() + timeout
+	while not pred() and time.time() < end:
+		time.sleep(0.01)
+	return pred()
+
+
 class TestNamingManager(unittest.TestCase):
 
 	def setUp(self):
@@ -119,6 +154,93 @@ class TestNamingManager(unittest.TestCase):
 		self._nm.unregisterMgrName("rest")
 		return
 
+	def test_slowNameServer(self):
+		slow = StubNaming(True)
+		fast = StubNaming()
+		self._nm._names.append(NamingManager.Names("stub", "slow", slow))
+		self._nm._names.append(NamingManager.Names("stub", "fast", fast))
+
+		# neither the caller nor the other name server waits for slow
+		start = time.time()
+		self._nm.bindObject("test_comp", self._obj)
+		self._nm.unbindObject("test_comp")
+		self._nm.bindObject("test_comp2", self._obj)
+		self.assert_(time.time() - start < 0.5)
+		self.assert_(wait_for(lambda: fast.names.has_key("test_comp2")))
+		self.assertEqual(slow.binds, 0)
+		self.assertEqual(self._nm.wait(0.1), False)
+
+		slow.event.set()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(slow.names.keys(), ["test_comp2"])
+		self.assertEqual(fast.names.keys(), ["test_comp2"])
+		return
+
+	def test_updateIncremental(self):
+		stub = StubNaming()
+		self._nm._names.append(NamingManager.Names("stub", "stub", stub))
+		self._mgr.getConfig().setProperty("naming.update.rebind", "YES")
+		stub.fail.append("test_comp")
+		self._nm.bindObject("test_comp", self._obj)
+		self._nm.bindManagerObject("test_mgr", self._mgrservant)
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(stub.names.keys(), ["test_mgr"])
+		binds = stub.binds
+
+		# only the name that failed is bound again
+		stub.fail = []
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(stub.binds, binds + 1)
+		self.assertEqual(len(stub.names), 2)
+
+		# unchanged names are not bound again
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(stub.binds, binds + 1)
+		self._mgr.getConfig().setProperty("naming.update.rebind", "NO")
+		return
+
+	def test_retryBackoff(self):
+		stub = StubNaming()
+		self._nm._names.append(NamingManager.Names("stub", "stub", stub))
+		ns = self._nm._names[0]
+
+		stub.alive = False
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(ns.ns, None)
+
+		# "stub" cannot be reconnected, and the retry is postponed
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(ns.failures, 1)
+		self.assert_(ns.nextRetry > time.time())
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(ns.failures, 1)
+
+		ns.nextRetry = 0.0
+		self._nm.update()
+		self.assertEqual(self._nm.wait(2.0), True)
+		self.assertEqual(ns.failures, 2)
+		return
+
+	def test_threadCallTimeout(self):
+		stub = StubNaming()
+		self._nm._names.append(NamingManager.Names("stub", "stub", stub))
+		timeouts = []
+		setter = omniORB.setClientThreadCallTimeout
+		omniORB.setClientThreadCallTimeout = timeouts.append
+		try:
+			self._nm.bindObject("test_comp", self._obj)
+			self.assertEqual(self._nm.wait(2.0), True)
+		finally:
+			omniORB.setClientThreadCallTimeout = setter
+		# set for the sync and reset for the shared worker
+		self.assertEqual(timeouts, [3000, 0])
+		return
+
 
 ############### test #################
 if __name__ == '__main__':
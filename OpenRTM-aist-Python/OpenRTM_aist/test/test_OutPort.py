@@ -53,6 +53,17 @@ class ConnectorMock:
 		data[0] = self._data
 		return True
 
+class CdrConnectorMock(OpenRTM_aist.OutPortConnector):
+	def __init__(self, endian):
+		prof = OpenRTM_aist.ConnectorInfo("test","id",["in","out"],OpenRTM_aist.Properties())
+		OpenRTM_aist.OutPortConnector.__init__(self, prof)
+		self._endian = endian
+		self._data = None
+
+	def writeCdr(self, cdr_data):
+		self._data = cdr_data
+		return OpenRTM_aist.DataPortStatus.PORT_OK
+
 
 class TestOutPort(unittest.TestCase):
 	def setUp(self):
@@ -70,6 +81,19 @@ class TestOutPort(unittest.TestCase):
 		self.assertEqual(read_data[0].data,123)
 		return
 
+	def test_write_fanout(self):
+		little = [CdrConnectorMock(True) for i in range(3)]
+		big = CdrConnectorMock(False)
+		self._op._connectors = little + [big]
+		self.assertEqual(self._op.write(RTC.TimedLong(RTC.Time(0,0), 123)), True)
+		self.assert_(little[0]._data is little[1]._data)
+		self.assert_(little[0]._data is little[2]._data)
+		self.assert_(little[0]._data is not big._data)
+		tc = any.to_any(RTC.TimedLong(RTC.Time(0,0), 0)).typecode()
+		self.assertEqual(cdrUnmarshal(tc, little[0]._data, True).data, 123)
+		self.assertEqual(cdrUnmarshal(tc, big._data, False).data, 123)
+		return
+
 	def test_OnWrite(self):
 		self._connector = ConnectorMock()
 		self._op._connectors = [self._connector]
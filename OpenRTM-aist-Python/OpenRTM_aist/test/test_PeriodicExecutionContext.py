@@ -160,6 +160,25 @@ class DFP(OpenRTM_aist.RTObject_impl):
 		return None
 	
 
+class CompMock:
+	def __init__(self):
+		self._sm = self
+		self._count = 0
+		self._stat = OpenRTM_aist.ExecutionStatistics()
+
+	def getName(self):
+		return "mock"
+
+	def on_startup(self):
+		return
+
+	def on_shutdown(self):
+		return
+
+	def worker(self):
+		self._count += 1
+
+
 class TestPeriodicExecutionContext(unittest.TestCase):
 
 	def setUp(self):
@@ -224,6 +243,54 @@ class TestPeriodicExecutionContext(unittest.TestCase):
 	def test_get_profile(self):
 		print "get_profile.kind: ", self._pec.get_profile().kind
 
+
+	def test_init(self):
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("scheduling", "Deadline")
+		prop.setProperty("overrun_policy", "skip")
+		self._pec.init(prop)
+		self.assertEqual(self._pec._deadline, True)
+		self.assertEqual(self._pec._catchup, False)
+
+		prop.setProperty("scheduling", "hoge")
+		prop.setProperty("overrun_policy", "hoge")
+		self._pec.init(prop)
+		self.assertEqual(self._pec._deadline, False)
+		self.assertEqual(self._pec._catchup, True)
+
+
+	def test_deadline(self):
+		self._pec.stop()
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("scheduling", "deadline")
+		self._pec.init(prop)
+		self._pec.set_rate(100)
+		comp = CompMock()
+		self._pec._comps.append(comp)
+		self._pec.start()
+		import time
+		time.sleep(1.0)
+		self._pec.stop()
+		self.assertTrue(90 <= comp._count <= 102)
+
+
+	def test_executionMeasure(self):
+		self._pec.stop()
+		comp = CompMock()
+		self._pec._comps = [comp]
+		self._pec.executionMeasure(True)
+		for i in range(3):
+			self._pec.invokeWorker()
+		self.assertEqual(comp._count, 3)
+		self.assertEqual(self._pec.getComponentExecStat()["mock"].count(), 3)
+
+		props = OpenRTM_aist.NVUtil.toProperties(self._pec.get_profile().properties)
+		self.assertEqual(props.getProperty("mock.count"), "3")
+		self.assertEqual(props.getProperty("mock.overrun"), "0")
+
+		self._pec.resetExecStat()
+		self.assertEqual(comp._stat.count(), 0)
+
 	
 
 ############### test #################
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_PooledPeriodicTask.py
+# \brief test for PooledPeriodicTask class
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys,time
+sys.path.insert(1,"../")
+
+import threading
+import unittest
+
+import OpenRTM_aist
+from PooledPeriodicTask import *
+
+
+class SvcMock:
+	def __init__(self, delay=0.0):
+		self._log = []
+		self._delay = delay
+		self._active = 0
+		self._max_active = 0
+		self._mutex = threading.Lock()
+		return
+
+	def __call__(self):
+		self._mutex.acquire()
+		self._active += 1
+		self._max_active = max(self._max_active, self._active)
+		self._mutex.release()
+		if self._delay:
+			time.sleep(self._delay)
+		self._log.append(time.time())
+		self._mutex.acquire()
+		self._active -= 1
+		self._mutex.release()
+		return 0
+
+
+def wait_for(cond, timeout=1.0):
+	end = time.time() + timeout
+	while not cond() and time.time() < end:
+		time.sleep(0.001)
+	return
+
+
+class TestPooledPeriodicTask(unittest.TestCase):
+	def setUp(self):
+		self._pool = PeriodicTaskPool(2)
+		return
+
+	def test_signal(self):
+		svc = SvcMock()
+		task = PooledPeriodicTask(self._pool)
+		self.assert_(task.setTask(svc))
+		task.setPeriod(0.0)
+		task.suspend()
+		task.activate()
+		task.suspend()
+		time.sleep(0.01)
+		self.assertEqual(len(svc._log), 0)
+
+		# one execution per signal, as needed by the fifo policy
+		for i in range(5):
+			task.signal()
+		wait_for(lambda: len(svc._log) == 5)
+		time.sleep(0.01)
+		self.assertEqual(len(svc._log), 5)
+
+		task.finalize()
+		task.signal()
+		time.sleep(0.01)
+		self.assertEqual(len(svc._log), 5)
+		return
+
+	def test_serialized(self):
+		svc = SvcMock(0.002)
+		task = PooledPeriodicTask(self._pool)
+		task.setTask(svc)
+		task.setPeriod(0.0)
+		task.suspend()
+		task.activate()
+		for i in range(10):
+			task.signal()
+		wait_for(lambda: len(svc._log) == 10)
+		self.assertEqual(len(svc._log), 10)
+		self.assertEqual(svc._max_active, 1)
+		task.finalize()
+		return
+
+	def test_exception(self):
+		svc = SvcMock()
+		def fail():
+			svc()
+			raise RuntimeError("task failed")
+		pool = PeriodicTaskPool(1)
+		task = PooledPeriodicTask(pool)
+		task.setTask(fail)
+		task.setPeriod(0.0)
+		task.suspend()
+		task.activate()
+
+		# the task and the worker keep running after the exceptions
+		for i in range(3):
+			task.signal()
+		wait_for(lambda: len(svc._log) == 3)
+		self.assertEqual(len(svc._log), 3)
+		task.wait()
+		self.assertEqual(task._runner, None)
+
+		other = SvcMock()
+		task2 = PooledPeriodicTask(pool)
+		task2.setTask(other)
+		task2.setPeriod(0.0)
+		task2.suspend()
+		task2.activate()
+		task2.signal()
+		wait_for(lambda: len(other._log) == 1)
+		self.assertEqual(len(other._log), 1)
+
+		task.finalize()
+		task2.finalize()
+		return
+
+	def test_periodic(self):
+		svc = SvcMock()
+		task = PooledPeriodicTask(self._pool)
+		task.setTask(svc)
+		task.setPeriod(0.01)
+		task.suspend()
+		task.activate()
+		time.sleep(0.05)
+		self.assertEqual(len(svc._log), 0)
+
+		task.resume()
+		time.sleep(0.105)
+		task.suspend()
+		count = len(svc._log)
+		self.assert_(8 <= count <= 12, count)
+		time.sleep(0.03)
+		self.assert_(len(svc._log) <= count + 1)
+
+		task.finalize()
+		task.wait()
+		return
+
+	def test_many_tasks(self):
+		svcs = [SvcMock() for i in range(50)]
+		tasks = []
+		for svc in svcs:
+			task = PooledPeriodicTask(self._pool)
+			task.setTask(svc)
+			task.setPeriod(0.0)
+			task.suspend()
+			task.activate()
+			tasks.append(task)
+
+		for i in range(3):
+			for task in tasks:
+				task.signal()
+		wait_for(lambda: sum([len(s._log) for s in svcs]) == 150)
+		for svc in svcs:
+			self.assertEqual(len(svc._log), 3)
+
+		for task in tasks:
+			task.finalize()
+		return
+
+
+
+if __name__ == '__main__':
+        unittest.main()
@@ -19,8 +19,10 @@ import sys
 sys.path.insert(1,"../")
 
 import unittest
+import time
 from PortBase import *
 
+import omniORB
 import CORBA
 import OpenRTM_aist
 import RTC, RTC__POA
@@ -42,6 +44,27 @@ class InPortObj(OpenRTM_aist.DataFlowComponentBase):
     self.addInPort("in",OpenRTM_aist.InPort("in", RTC.TimedLong(RTC.Time(0,0),0)))
 
 
+class PortRefMock:
+  def __init__(self, owner, alive=True, delay=0.0, timedout=False):
+    self._owner = owner
+    self._alive = alive
+    self._delay = delay
+    self._timedout = timedout
+    self._count = 0
+
+  def _non_existent(self):
+    self._count += 1
+    time.sleep(self._delay)
+    if self._timedout:
+      raise CORBA.TRANSIENT(omniORB.TRANSIENT_CallTimedout,
+                            CORBA.COMPLETED_NO)
+    return not self._alive
+
+  def notify_disconnect(self, connector_id):
+    self._owner.eraseConnectorProfile(connector_id)
+    return RTC.RTC_OK
+
+
 class TestPortBase(unittest.TestCase):
   def setUp(self):
     OpenRTM_aist.Manager.init(sys.argv)
@@ -174,6 +197,35 @@ class TestPortBase(unittest.TestCase):
     self.assertEqual(prof.properties[1].name, "name2")
 
 
+  def test_updateConnectors(self):
+    self._pb._livenessTimeout = 0.5
+    self._pb._livenessTTL = 10.0
+    alive = PortRefMock(self._pb)
+    dead = PortRefMock(self._pb, alive=False)
+    hung = PortRefMock(self._pb, delay=3.0)
+    slow = PortRefMock(self._pb, timedout=True)
+    for id_, port in [("alive",alive),("dead",dead),("hung",hung),
+                      ("slow",slow)]:
+      self._pb.updateConnectorProfile(RTC.ConnectorProfile(id_,id_,[port],[]))
+
+    # the checks run concurrently and the hung port is waited for
+    # port.liveness.timeout only
+    start = time.time()
+    self._pb.updateConnectors()
+    self.assertEqual(time.time() - start < 2.0, True)
+    self.assertEqual(self._pb.findConnProfileIndex("dead"), -1)
+    self.assertNotEqual(self._pb.findConnProfileIndex("alive"), -1)
+    self.assertNotEqual(self._pb.findConnProfileIndex("hung"), -1)
+    # a port which timed out is not disconnected
+    self.assertNotEqual(self._pb.findConnProfileIndex("slow"), -1)
+
+    # the cached result and the running check are reused
+    self._pb.updateConnectors()
+    self.assertEqual(alive._count, 1)
+    self.assertEqual(hung._count, 1)
+    return
+
+
 ############### test #################
 if __name__ == '__main__':
         unittest.main()
@@ -337,6 +337,11 @@ class TestProperties(unittest.TestCase) :
 		node = self.prop.getNode("conf")
 		node.removeNode("default")
 		self.assertEqual( len(self.prop.getNode("conf").leaf),0, "Result failed.")
+		self.assertEqual(node.hasKey("default"),None, "Result failed.")
+		self.assertEqual(self.prop.getProperty("conf.default.int_param1"), "", "Result failed.")
+
+		self.prop.setProperty("conf.default.int_param1", "10")
+		self.assertEqual(self.prop.getProperty("conf.default.int_param1"), "10", "Result failed.")
 
 
 	def test_hasKey(self):
@@ -349,6 +354,10 @@ class TestProperties(unittest.TestCase) :
 	def test_clear(self):
 		self.prop.clear()
 		self.assertEqual(self.prop.getProperty("implementation_id"), "", "Result failed.")
+		self.assertEqual(self.prop.hasKey("conf"),None, "Result failed.")
+		self.prop.setProperty("conf.default.int_param0", "5")
+		self.assertEqual(self.prop.getProperty("conf.default.int_param0"), "5", "Result failed.")
+		self.assertEqual(self.prop.propertyNames(), ["conf.default.int_param0"], "Result failed.")
 
 		# Failed Pattern
 		# self.assertEqual(self.prop.getProperty("implementation_id"), "ConfigSample", "Result failed.")
@@ -369,6 +378,21 @@ class TestProperties(unittest.TestCase) :
 		self.assertEqual(val, ["test","split,hoge"])
 
 
+	def test_order(self):
+		names = self.prop.propertyNames()
+		self.assertEqual(names[0], "implementation_id", "Result failed.")
+		self.assertEqual(names[10], "conf.default.int_param0", "Result failed.")
+		self.assertEqual(names[-1], "conf.default.vector_param0", "Result failed.")
+
+		self.prop.setProperty("a\\.b.c", "escaped")
+		self.assertEqual(self.prop.propertyNames()[-1], "a\\.b.c", "Result failed.")
+		self.assertEqual(self.prop.getProperty("a\\.b.c"), "escaped", "Result failed.")
+		self.assertEqual(self.prop.hasKey("a\\.b").getProperty("c"), "escaped", "Result failed.")
+
+		for name in names:
+			self.assertEqual(self.prop.getProperty(name), self.prop.getDefault(name), "Result failed.")
+
+
 	def test_mergeProperties(self):
 		self.prop.mergeProperties(self.prop)
 		self.assertEqual(self.prop.getProperty("implementation_id"), "ConfigSample", "Result failed.")
@@ -86,6 +86,27 @@ class ConsumerMock(OpenRTM_aist.InPortCorbaCdrConsumer):
 
 
 
+class BatchConsumerMock(OpenRTM_aist.InPortCorbaCdrBatchConsumer):
+  def __init__(self):
+    self._puts = []
+    self._ret = OpenRTM_aist.DataPortStatus.PORT_OK
+    self._free = -1
+
+  def __del__(self):
+    pass
+
+  def putN(self, data):
+    self._puts.append(list(data))
+    if self._ret != OpenRTM_aist.DataPortStatus.PORT_OK:
+      return self._ret
+    # the InPort rejects a batch which does not fit in its buffer
+    if self._free >= 0:
+      if len(data) > self._free:
+        return OpenRTM_aist.DataPortStatus.SEND_FULL
+      self._free -= len(data)
+    return self._ret
+
+
 class TestPublisherNew(unittest.TestCase):
 
   def setUp(self):
@@ -236,6 +257,69 @@ class TestPublisherNew(unittest.TestCase):
     self.assertEqual(_pn.write(123,0,0),OpenRTM_aist.DataPortStatus.BUFFER_FULL)
     return
 
+  def test_pushAllBatch(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("",
+                                       "",
+                                       [],
+                                       prop)
+    self.assertEqual(_pn.setListener(cinfo,OpenRTM_aist.ConnectorListeners()),
+                     OpenRTM_aist.DataPortStatus.PORT_OK)
+    cons = BatchConsumerMock()
+    self.assertEqual(_pn.setConsumer(cons),OpenRTM_aist.DataPortStatus.PORT_OK)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    for i in range(5):
+      buff.write(i)
+
+    cons._ret = OpenRTM_aist.DataPortStatus.SEND_FULL
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.SEND_FULL)
+    self.assertEqual(cons._puts,[[0,1,2,3,4]])
+    self.assertEqual(buff.readable(),5)
+
+    cons._ret = OpenRTM_aist.DataPortStatus.PORT_OK
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(cons._puts[1:],[[0,1],[2,3,4]])
+    self.assertEqual(buff.readable(),0)
+    return
+
+  def test_pushAllBatchBacklog(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("inport.buffer.length", "4")
+    cinfo = OpenRTM_aist.ConnectorInfo("",
+                                       "",
+                                       [],
+                                       prop)
+    self.assertEqual(_pn.setListener(cinfo,OpenRTM_aist.ConnectorListeners()),
+                     OpenRTM_aist.DataPortStatus.PORT_OK)
+    _pn.setBatchLength(prop)
+    cons = BatchConsumerMock()
+    self.assertEqual(_pn.setConsumer(cons),OpenRTM_aist.DataPortStatus.PORT_OK)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    for i in range(6):
+      buff.write(i)
+
+    # the backlog is longer than the InPort buffer
+    cons._free = 3
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.SEND_FULL)
+    self.assertEqual(cons._puts,[[0,1,2,3]])
+    self.assertEqual(buff.readable(),6)
+
+    # a shorter batch fits, and a longer one is tried again
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.SEND_FULL)
+    self.assertEqual(cons._puts[1:],[[0,1],[2,3,4,5]])
+    self.assertEqual(buff.readable(),4)
+
+    # the rest is delivered once the InPort has read its buffer
+    cons._free = 4
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(cons._puts[3:],[[2,3],[4,5]])
+    self.assertEqual(buff.readable(),0)
+    return
+
   def test_pushFifo(self):
     _pn = PublisherNew()
     prop = OpenRTM_aist.Properties()
@@ -359,6 +443,35 @@ class TestPublisherNew(unittest.TestCase):
          OpenRTM_aist.DataPortStatus.PORT_ERROR)
     return
 
+  def test_pushFifoPool(self):
+    OpenRTM_aist.PooledPeriodicTaskInit()
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("",
+                                       "",
+                                       [],
+                                       prop)
+    self.assertEqual(_pn.setListener(cinfo,OpenRTM_aist.ConnectorListeners()),
+                     OpenRTM_aist.DataPortStatus.PORT_OK)
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.push_policy","fifo")
+    prop.setProperty("publisher.thread_type","pool")
+    self.assertEqual(_pn.init(prop),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assert_(isinstance(_pn._task, OpenRTM_aist.PooledPeriodicTask))
+    cons = ConsumerMock()
+    self.assertEqual(_pn.setConsumer(cons),OpenRTM_aist.DataPortStatus.PORT_OK)
+    _pn.setBuffer(OpenRTM_aist.CdrRingBuffer())
+    _pn.activate()
+
+    for i in range(5):
+      self.assertEqual(_pn.write(i,0,0),OpenRTM_aist.DataPortStatus.PORT_OK)
+    time.sleep(0.1)
+    self.assertEqual(cons.get_m_put_data_len(),5)
+    for i in range(5):
+      self.assertEqual(cons.get_m_put_data(),i)
+    _pn.deactivate()
+    return
+
 ############ test #################
 if __name__ == '__main__':
   unittest.main()
@@ -132,6 +132,18 @@ class TestRingBuffer(unittest.TestCase):
 		self.assertEqual(data[0],"string")
 		self.assertEqual(self._rb.read(data,1,0),OpenRTM_aist.BufferStatus.TIMEOUT)
 
+	def test_readN(self):
+		data=[]
+		self.assertEqual(self._rb.readN(data),OpenRTM_aist.BufferStatus.BUFFER_EMPTY)
+		for i in range(10):
+			self._rb.write(i)
+		self.assertEqual(self._rb.readN(data,3),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data,[2,3,4])
+		data=[]
+		self.assertEqual(self._rb.readN(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+		self.assertEqual(data,[5,6,7,8,9])
+		self.assertEqual(self._rb.empty(),True)
+
 	def test_readable(self):
 		data=[0]
 		self.assertEqual(self._rb.readable(),0)
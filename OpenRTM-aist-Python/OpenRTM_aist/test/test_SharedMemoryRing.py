@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+#
+# \file test_SharedMemoryRing.py
+# \brief test for SharedMemoryRing class
+# \date $Date$
+#
+# Copyright (C) 2010
+#     Noriaki Ando
+#     Task-intelligence Research Group,
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import os
+import tempfile
+import unittest
+
+from SharedMemoryRing import *
+
+
+class TestSharedMemoryRing(unittest.TestCase):
+
+	def setUp(self):
+		self._path = os.path.join(tempfile.gettempdir(),
+					  "test_SharedMemoryRing_%d.ring" % os.getpid())
+		self._ring = SharedMemoryRing(self._path, 64)
+		return
+
+
+	def tearDown(self):
+		self._ring.unlink()
+		return
+
+
+	def test_write_read(self):
+		self.assertEqual(self._ring.capacity(), 64)
+		self.assertEqual(self._ring.empty(), True)
+		self.assertEqual(self._ring.read(), None)
+
+		self.assertEqual(self._ring.write("abc"), True)
+		self.assertEqual(self._ring.write(""), True)
+		self.assertEqual(self._ring.readable(), 4 + 3 + 4)
+		self.assertEqual(self._ring.read(), "abc")
+		self.assertEqual(self._ring.read(), "")
+		self.assertEqual(self._ring.read(), None)
+		self.assertEqual(self._ring.empty(), True)
+		return
+
+
+	def test_full(self):
+		self.assertEqual(self._ring.write("a" * 60), True)
+		self.assertEqual(self._ring.write(""), False)
+		self.assertEqual(self._ring.read(), "a" * 60)
+		self.assertEqual(self._ring.write("b" * 61), False)
+		return
+
+
+	def test_get(self):
+		self.assertEqual(self._ring.get(), None)
+		self.assertEqual(self._ring.write("abc"), True)
+		self.assertEqual(self._ring.write("de"), True)
+		# the frame stays until the read position is advanced
+		self.assertEqual(self._ring.get(), "abc")
+		self.assertEqual(self._ring.get(), "abc")
+		self._ring.advanceRptr()
+		self.assertEqual(self._ring.get(), "de")
+
+		self._ring.clear()
+		self.assertEqual(self._ring.empty(), True)
+		self.assertEqual(self._ring.get(), None)
+		return
+
+
+	def test_wrap(self):
+		# frames straddle the end of the data area
+		for i in range(20):
+			data = chr(ord("a") + i) * (i % 7 + 20)
+			self.assertEqual(self._ring.write(data), True)
+			self.assertEqual(self._ring.read(), data)
+		self.assertEqual(self._ring.empty(), True)
+		return
+
+
+	def test_open(self):
+		peer = SharedMemoryRing(self._path)
+		self.assertEqual(peer.capacity(), 64)
+		self.assertEqual(peer.write("xyz"), True)
+		self.assertEqual(self._ring.read(), "xyz")
+		peer.close()
+
+		fd = open(self._path + ".bad", "w")
+		fd.write("x" * 100)
+		fd.close()
+		self.assertRaises(ValueError, SharedMemoryRing, self._path + ".bad")
+		os.unlink(self._path + ".bad")
+		return
+
+
+
+if __name__ == '__main__':
+        unittest.main()
@@ -124,6 +124,50 @@ class TestStateMachine(unittest.TestCase):
 #		self.assertEqual(self._sm.worker(), True)
 	
 
+  def test_worker_actions(self):
+		log = []
+		def action(name, goto=None):
+			def func(st):
+				log.append((name, st.curr, st.next))
+				if goto is not None:
+					self._sm.goTo(goto)
+				return True
+			return func
+
+		self._sm = StateMachine(4)
+		st = StateHolder()
+		st.prev = RTC.INACTIVE_STATE
+		st.curr = RTC.INACTIVE_STATE
+		st.next = RTC.INACTIVE_STATE
+		self._sm.setStartState(st)
+		self._sm.setEntryAction(RTC.ACTIVE_STATE, action("entry"))
+		self._sm.setPreDoAction(RTC.ACTIVE_STATE, action("predo"))
+		self._sm.setDoAction(RTC.ACTIVE_STATE, action("do", RTC.ERROR_STATE))
+		self._sm.setPostDoAction(RTC.ACTIVE_STATE, action("postdo"))
+		self._sm.setExitAction(RTC.ACTIVE_STATE, action("exit"))
+
+		self._sm.goTo(RTC.ACTIVE_STATE)
+		self._sm.worker()
+		self.assertEqual(log, [("entry", RTC.ACTIVE_STATE, RTC.ACTIVE_STATE)])
+		self.assertEqual(self._sm.getState(), RTC.ACTIVE_STATE)
+
+		# post-do is skipped once a transition is requested
+		del log[:]
+		self._sm.worker()
+		self.assertEqual(log, [("predo", RTC.ACTIVE_STATE, RTC.ACTIVE_STATE),
+				       ("do", RTC.ACTIVE_STATE, RTC.ACTIVE_STATE)])
+
+		del log[:]
+		self._sm.worker()
+		self.assertEqual(log, [("exit", RTC.ACTIVE_STATE, RTC.ERROR_STATE)])
+		self.assertEqual(self._sm.getState(), RTC.ERROR_STATE)
+
+		del log[:]
+		self._sm.worker()
+		self.assertEqual(log, [])
+		return
+
+
 ############### test #################
 if __name__ == '__main__':
         unittest.main()
@@ -25,6 +25,7 @@ import sys
 sys.path.insert(1,"../")
 import unittest
 
+import logging
 from SystemLogger import *
 i = 0
 
@@ -76,6 +77,39 @@ class TestLogger(unittest.TestCase):
 		self.logstr.acquire()
 		self.logstr.release()
 
+	def test_level_gate(self):
+		self.logstr.setLogLevel("INFO")
+		self.assertEqual(self.logstr._level, logging.INFO)
+		self.logstr.setLogLevel("TRACE")
+		self.assertEqual(self.logstr._level, logging.TRACE)
+		# SILENT leaves the level to the ancestors
+		root = logging.getLogger("")
+		level = root.level
+		root.setLevel(logging.WARNING)
+		try:
+			self.logstr.setLogLevel("SILENT")
+			self.assertEqual(self.logstr._level, logging.WARNING)
+		finally:
+			root.setLevel(level)
+
+
+	def test_stripDisabledLevels(self):
+		self.logstr.setLogLevel("INFO")
+		self.logstr.stripDisabledLevels()
+		self.assertEqual(self.logstr.RTC_DEBUG.__name__, "__nop")
+		self.assertEqual(self.logstr.RTC_PARANOID.__name__, "__nop")
+		self.assertEqual(self.logstr.RTC_INFO.__name__, "RTC_INFO")
+		self.logstr.RTC_DEBUG("debug %s", "stripped")
+		self.logstr.setLogLevel("DEBUG")
+		self.assertEqual(self.logstr.RTC_DEBUG.__name__, "RTC_DEBUG")
+		self.assertEqual(self.logstr.RTC_TRACE.__name__, "__nop")
+		self.logstr.stripDisabledLevels(False)
+		self.assertEqual(self.logstr.RTC_TRACE.__name__, "RTC_TRACE")
+		disabled = LogStream()
+		disabled.stripDisabledLevels()
+		self.assertEqual(disabled.RTC_FATAL.__name__, "__nop")
+
+
 	def test_RTC_LOG(self):
 		import logging
 		self.logstr.RTC_LOG(logging.ERROR,"log %s, %s",("hoge","hogehoge"))